@@ -0,0 +1,26 @@
+"""Container freezing example."""
+
+from dependency_injector import containers, providers, errors
+
+
+class Service:
+    ...
+
+
+class Container(containers.DeclarativeContainer):
+
+    service = providers.Factory(Service)
+
+
+if __name__ == '__main__':
+    container = Container()
+    container.freeze()
+
+    try:
+        container.service.override(providers.Object(Service()))
+    except errors.Error as exception:
+        print(exception)
+        # Provider <dependency_injector.providers.Factory(<class '__main__.Service'>) at 0x...>
+        # is frozen and can not be changed
+
+    assert isinstance(container.service(), Service)
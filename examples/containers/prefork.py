@@ -0,0 +1,37 @@
+"""Container prefork example."""
+
+import os
+
+from dependency_injector import containers, providers
+
+
+class Templates:
+    ...
+
+
+class ConnectionPool:
+    ...
+
+
+class Container(containers.DeclarativeContainer):
+
+    config = providers.Configuration()
+
+    templates = providers.Singleton(Templates)
+
+    connection_pool = providers.Singleton(ConnectionPool)
+    connection_pool.set_fork_policy('reset')
+
+
+if __name__ == '__main__':
+    container = Container(config={'workers': 4})
+
+    report = container.prefork()
+    print(report['singletons'], 'singletons are built before fork')
+
+    for _ in range(container.config.workers()):
+        pid = os.fork()
+        if pid == 0:
+            container.connection_pool()  # Every worker creates its own pool
+            os._exit(0)
+        os.waitpid(pid, 0)
@@ -0,0 +1,36 @@
+"""Container warm up example."""
+
+from dependency_injector import containers, providers
+
+
+class Database:
+    ...
+
+
+class Cache:
+    ...
+
+
+class Service:
+    def __init__(self, database: Database, cache: Cache):
+        self.database = database
+        self.cache = cache
+
+
+class Container(containers.DeclarativeContainer):
+
+    database = providers.Singleton(Database)
+
+    cache = providers.Singleton(Cache)
+
+    service = providers.Singleton(Service, database=database, cache=cache)
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    report = container.warm_up(max_workers=4)
+
+    for provider, seconds in report.items():
+        print(provider, seconds)
+    # Database and Cache are built concurrently, Service is built after them
@@ -0,0 +1,35 @@
+"""`Configuration` provider loading from the multiple sources at once example."""
+
+import os
+
+from dependency_injector import containers, providers
+
+
+class Container(containers.DeclarativeContainer):
+
+    config = providers.Configuration()
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    # Emulate environment variables
+    os.environ['AWS_SECRET_ACCESS_KEY'] = 'ENV-SECRET'
+
+    container.config.load(
+        sources=[
+            'examples/providers/configuration/config.yml',
+            'examples/providers/configuration/config.local.yml',
+            {'aws': {'region': 'us-east-1'}},
+        ],
+        env={'aws.secret_access_key': 'AWS_SECRET_ACCESS_KEY'},
+        max_workers=2,
+    )
+
+    assert container.config() == {
+        'aws': {
+            'access_key_id': 'LOCAL-KEY',
+            'secret_access_key': 'ENV-SECRET',
+            'region': 'us-east-1',
+        },
+    }
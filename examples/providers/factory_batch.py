@@ -0,0 +1,39 @@
+"""`Factory` provider batch creation example."""
+
+from dependency_injector import containers, providers
+
+
+class Database:
+    ...
+
+
+class Record:
+    def __init__(self, database: Database, table: str, **fields) -> None:
+        self.database = database
+        self.table = table
+        self.fields = fields
+
+
+class Container(containers.DeclarativeContainer):
+
+    config = providers.Configuration()
+
+    database = providers.Singleton(Database)
+
+    record_factory = providers.Factory(
+        Record,
+        database=database,
+        table=config.table,
+    )
+
+
+if __name__ == '__main__':
+    container = Container(config={'table': 'users'})
+
+    records = container.record_factory.many(3, name='John')
+    assert len(records) == 3
+
+    rows = [{'name': 'John'}, {'name': 'Jane'}]
+    for record in container.record_factory.map(rows):
+        assert record.database is container.database()
+        assert record.table == 'users'
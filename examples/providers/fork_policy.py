@@ -0,0 +1,38 @@
+"""Fork policy example."""
+
+import os
+
+from dependency_injector import containers, providers
+
+
+class Settings:
+    ...
+
+
+class ConnectionPool:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.pid = os.getpid()
+
+
+class Container(containers.DeclarativeContainer):
+
+    settings = providers.Singleton(Settings)
+
+    connection_pool = providers.Singleton(ConnectionPool, settings=settings)
+    connection_pool.set_fork_policy('reinit')
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    settings = container.settings()
+    container.connection_pool()
+
+    pid = os.fork()
+    if pid == 0:
+        assert container.settings() is settings  # Shared with the parent process
+        assert container.connection_pool().pid == os.getpid()  # Created in the child process
+        os._exit(0)
+
+    os.waitpid(pid, 0)
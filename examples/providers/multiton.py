@@ -0,0 +1,31 @@
+"""`Multiton` provider example."""
+
+from dependency_injector import containers, providers
+
+
+class TenantClient:
+    def __init__(self, tenant: str, timeout: float):
+        self.tenant = tenant
+        self.timeout = timeout
+
+    def close(self):
+        ...
+
+
+class Container(containers.DeclarativeContainer):
+
+    tenant_client = providers.ThreadSafeMultiton(TenantClient, timeout=5.0)
+    tenant_client.set_max_size(100).set_eviction_callback(TenantClient.close)
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    client1 = container.tenant_client(tenant='acme')
+    client2 = container.tenant_client(tenant='acme')
+    client3 = container.tenant_client(tenant='globex')
+
+    assert client1 is client2
+    assert client1 is not client3
+    assert container.tenant_client.hits == 1
+    assert container.tenant_client.misses == 2
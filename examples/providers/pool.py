@@ -0,0 +1,36 @@
+"""`Pool` provider example."""
+
+from dependency_injector import containers, providers
+
+
+class Parser:
+
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        self.buffer = []
+
+    def parse(self, text: str) -> list:
+        self.buffer.extend(text.split())
+        return list(self.buffer)
+
+
+class Container(containers.DeclarativeContainer):
+
+    config = providers.Configuration()
+
+    parser_pool = providers.ThreadSafePool(
+        Parser,
+        encoding=config.encoding,
+    ).set_max_size(4).set_reset_hook(lambda parser: parser.buffer.clear())
+
+
+if __name__ == '__main__':
+    container = Container(config={'encoding': 'utf-8'})
+
+    with container.parser_pool.lease() as parser1:
+        assert parser1.parse('a b') == ['a', 'b']
+
+    with container.parser_pool.lease() as parser2:
+        assert parser2.parse('c') == ['c']
+
+    assert parser1 is parser2
@@ -0,0 +1,38 @@
+"""`ContextLocalSingleton` provider example."""
+
+import asyncio
+
+from dependency_injector import containers, providers
+
+
+class Connection:
+    ...
+
+
+class Container(containers.DeclarativeContainer):
+
+    connection = providers.ContextLocalSingleton(Connection)
+
+
+async def handle_request(container: Container):
+    connection1 = container.connection()
+    await asyncio.sleep(0.01)
+    connection2 = container.connection()
+    assert connection1 is connection2
+    return connection1
+
+
+async def main(container: Container):
+    connections = await asyncio.gather(
+        handle_request(container),
+        handle_request(container),
+        handle_request(container),
+    )
+    assert len(set(connections)) == 3
+    # Every task works with its own connection.
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    asyncio.run(main(container))
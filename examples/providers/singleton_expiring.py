@@ -0,0 +1,31 @@
+"""`ExpiringSingleton` provider example."""
+
+import time
+
+from dependency_injector import containers, providers
+
+
+class FeatureFlags:
+    def __init__(self):
+        self.loaded_at = time.monotonic()
+
+
+class Container(containers.DeclarativeContainer):
+
+    feature_flags = providers.ExpiringSingleton(FeatureFlags).set_ttl(0.1)
+
+    token = providers.ExpiringSingleton(object).set_ttl(0.1).set_background_refresh()
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    flags1 = container.feature_flags()
+    time.sleep(0.2)
+    flags2 = container.feature_flags()
+    assert flags1 is not flags2  # Expired instance is created again
+
+    token1 = container.token()
+    time.sleep(0.2)
+    token2 = container.token()
+    assert token1 is token2  # Expired instance is served while refresh runs in background
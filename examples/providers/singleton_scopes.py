@@ -0,0 +1,32 @@
+"""`Singleton` provider scopes example."""
+
+from dependency_injector import containers, providers
+
+
+class Session:
+    ...
+
+
+class Service:
+    def __init__(self, session: Session):
+        self.session = session
+
+
+class Container(containers.DeclarativeContainer):
+
+    session = providers.Singleton(Session).set_scope('request')
+
+    handler = providers.Factory(Service, session=session)
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    with container.scope('request'):
+        handler1 = container.handler()
+        handler2 = container.handler()
+        assert handler1.session is handler2.session
+
+    with container.scope('request'):
+        handler3 = container.handler()
+        assert handler3.session is not handler1.session
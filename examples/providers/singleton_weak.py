@@ -0,0 +1,26 @@
+"""`WeakSingleton` provider example."""
+
+import gc
+
+from dependency_injector import containers, providers
+
+
+class SearchIndex:
+    ...
+
+
+class Container(containers.DeclarativeContainer):
+
+    search_index = providers.WeakSingleton(SearchIndex)
+
+
+if __name__ == '__main__':
+    container = Container()
+
+    index1 = container.search_index()
+    index2 = container.search_index()
+    assert index1 is index2
+
+    del index1, index2
+    gc.collect()
+    assert not container.search_index.is_alive  # Index is collected when nobody uses it
@@ -15,7 +15,7 @@ from typing import (
     overload,
 )
 
-from .providers import Provider, Self, ProviderParent
+from .providers import Provider, Self, ProviderParent, Scope
 
 
 C_Base = TypeVar('C_Base', bound='Container')
@@ -44,9 +44,19 @@ class Container:
     def wire(self, modules: Optional[Iterable[Any]] = None, packages: Optional[Iterable[Any]] = None) -> None: ...
     def unwire(self) -> None: ...
     def init_resources(self) -> Optional[Awaitable]: ...
+    def warm_up(
+            self,
+            types: Optional[Iterable[Type[Provider]]] = None,
+            max_workers: Optional[int] = None,
+    ) -> Union[Dict[Provider, float], Awaitable[Dict[Provider, float]]]: ...
+    def prefork(self, max_workers: Optional[int] = None) -> Dict[str, Any]: ...
     def shutdown_resources(self) -> Optional[Awaitable]: ...
     def apply_container_providers_overridings(self) -> None: ...
+    def seal_sync(self) -> None: ...
+    def freeze(self) -> None: ...
+    def is_frozen(self) -> bool: ...
     def reset_singletons(self) -> SingletonResetContext[C_Base]: ...
+    def scope(self, name: str) -> Scope: ...
     def check_dependencies(self) -> None: ...
     @overload
     def resolve_provider_name(self, provider: Provider) -> str: ...
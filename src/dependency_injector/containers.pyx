@@ -63,6 +63,9 @@ class DynamicContainer(Container):
 
         :rtype: None
         """
+        self.__frozen = False
+        self.__singletons = None
+        self.__singletons_epoch = 0
         self.provider_type = providers.Provider
         self.providers = {}
         self.overridden = tuple()
@@ -114,7 +117,9 @@ class DynamicContainer(Container):
         if isinstance(value, providers.Provider) \
                 and not isinstance(value, providers.Self) \
                 and name != 'parent':
+            _check_frozen(self)
             _check_provider_type(self, value)
+            providers._invalidate_graph()
 
             self.providers[name] = value
 
@@ -135,6 +140,8 @@ class DynamicContainer(Container):
         :rtype: None
         """
         if name in self.providers:
+            _check_frozen(self)
+            providers._invalidate_graph()
             del self.providers[name]
         super(DynamicContainer, self).__delattr__(name)
 
@@ -194,6 +201,8 @@ class DynamicContainer(Container):
 
         :rtype: None
         """
+        _check_frozen(self)
+
         if overriding is self:
             raise errors.Error('Container {0} could not be overridden '
                                'with itself'.format(self))
@@ -215,6 +224,8 @@ class DynamicContainer(Container):
 
         :rtype: None
         """
+        _check_frozen(self)
+
         for name, overriding_provider in six.iteritems(overriding_providers):
             container_provider = getattr(self, name)
             container_provider.override(overriding_provider)
@@ -224,6 +235,8 @@ class DynamicContainer(Container):
 
         :rtype: None
         """
+        _check_frozen(self)
+
         if not self.overridden:
             raise errors.Error('Container {0} is not overridden'.format(self))
 
@@ -237,6 +250,8 @@ class DynamicContainer(Container):
 
         :rtype: None
         """
+        _check_frozen(self)
+
         self.overridden = tuple()
 
         for provider in six.itervalues(self.providers):
@@ -282,6 +297,28 @@ class DynamicContainer(Container):
         if futures:
             return asyncio.gather(*futures)
 
+    def warm_up(self, types=None, max_workers=None):
+        """Build container singletons and resources in the order of their dependencies.
+
+        Independent providers are built concurrently. In a running event loop returns an
+        awaitable.
+
+        :return: Dictionary of built providers and their build time in seconds.
+        """
+        return providers.warm_up(*self.providers.values(), types=types, max_workers=max_workers)
+
+    def prefork(self, max_workers=None):
+        """Prepare container for forking of the process.
+
+        Builds singletons that have no fork policy, caches configuration values and lookups of
+        the container, then freezes garbage collector with :py:func:`gc.freeze`, so worker
+        processes share memory pages of the container with the master process.
+
+        :return: Dictionary with the statistics of the prepared providers.
+        """
+        self.__get_singletons()
+        return providers.prefork(*self.providers.values(), max_workers=max_workers)
+
     def shutdown_resources(self):
         """Shutdown all container resources."""
         futures = []
@@ -300,12 +337,58 @@ class DynamicContainer(Container):
         for provider in self.traverse(types=[providers.Container]):
             provider.apply_overridings()
 
+    def seal_sync(self):
+        """Seal all container providers as synchronous.
+
+        Sealed providers skip async detection of injected values and provided results.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if any of the providers is
+                asynchronous.
+
+        :rtype: None
+        """
+        providers.seal_sync(*self.providers.values())
+
+    def freeze(self):
+        """Freeze container and all its providers.
+
+        Providers of frozen container can not be set, deleted or overridden, and
+        injections of the providers can not be changed.
+
+        :rtype: None
+        """
+        self.__frozen = True
+        providers.freeze(*self.providers.values())
+
+    def is_frozen(self):
+        """Check if container is frozen."""
+        return self.__frozen
+
     def reset_singletons(self):
-        """Reset container singletons."""
-        for provider in self.traverse(types=[providers.BaseSingleton]):
+        """Reset container singletons.
+
+        Singletons are found by traversing the container once. Found singletons are cached until
+        the providers graph is changed.
+        """
+        for provider in self.__get_singletons():
             provider.reset()
         return SingletonResetContext(self)
 
+    def __get_singletons(self):
+        epoch = providers._get_graph_epoch()
+        if self.__singletons is None or self.__singletons_epoch != epoch:
+            self.__singletons = list(self.traverse(types=[providers.BaseSingleton]))
+            self.__singletons_epoch = epoch
+        return self.__singletons
+
+    def scope(self, name):
+        """Return scope context of the singletons with the given scope name.
+
+        Scoped singletons store their instances in the scope. When scope exits, its instances are
+        dropped.
+        """
+        return providers.Scope(name)
+
     def check_dependencies(self):
         """Check if container dependencies are defined.
 
@@ -724,3 +807,8 @@ cpdef object _check_provider_type(object container, object provider):
     if not isinstance(provider, container.provider_type):
         raise errors.Error('{0} can contain only {1} '
                            'instances'.format(container, container.provider_type))
+
+
+cpdef object _check_frozen(object container):
+    if container.is_frozen():
+        raise errors.Error('Container {0} is frozen and can not be changed'.format(container))
@@ -7,14 +7,46 @@ except ImportError:
 
 import functools
 
+from .errors import Error
+
 cimport cython
 
 
+cdef extern from "Python.h":
+    bint PyCoro_CheckExact(object instance)
+
+
+cdef enum:
+    ASYNC_MODE_UNDEFINED = 0
+    ASYNC_MODE_ENABLED = 1
+    ASYNC_MODE_DISABLED = 2
+
+
+cdef enum:
+    KWARGS_LAYOUTS_MAX_SIZE = 32
+
+
+# Incremented on every change of overriding chains, see __resolve_overriding()
+cdef unsigned long long _overriding_epoch
+
+# Incremented on every change of providers graph, see _get_graph_epoch()
+cdef unsigned long long _graph_epoch
+
+# Incremented when instances of singletons and resources or cached configuration values are
+# reset, see Factory.map()
+cdef unsigned long long _instances_epoch
+
+
 # Base providers
 cdef class Provider(object):
     cdef tuple __overridden
     cdef Provider __last_overriding
+    cdef Provider __resolved_overriding
+    cdef unsigned long long __resolved_epoch
     cdef int __async_mode
+    cdef bint __fast_call
+    cdef bint __sync_sealed
+    cdef bint __frozen
 
     cpdef object _provide(self, tuple args, dict kwargs)
     cpdef void _copy_overridings(self, Provider copied, dict memo)
@@ -41,6 +73,10 @@ cdef class Dependency(Provider):
     cdef object __instance_of
     cdef object __default
     cdef object __parent
+    cdef set __checked_types
+    cdef bint __cache_checked_types
+
+    cdef void __check_result_type(self, object instance) except *
 
 
 cdef class ExternalDependency(Dependency):
@@ -60,11 +96,21 @@ cdef class Callable(Provider):
 
     cdef tuple __args
     cdef int __args_len
+    cdef tuple __args_plan
+    cdef tuple __args_plan_slots
+    cdef tuple __args_plan_indexes
+    cdef int __args_plan_slots_len
 
     cdef tuple __kwargs
     cdef int __kwargs_len
+    cdef dict __kwargs_plan
+    cdef tuple __kwargs_plan_slots
+    cdef int __kwargs_plan_slots_len
+    cdef dict __kwargs_layouts
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void __compile_args_plan(self)
+    cdef void __compile_kwargs_plan(self)
 
 
 cdef class DelegatedCallable(Callable):
@@ -103,6 +149,9 @@ cdef class ConfigurationOption(Provider):
     cdef dict __children
     cdef bint __required
     cdef object __cache
+    cdef tuple __path
+
+    cdef void __reset_changed_cache(self, dict old_index, dict new_index) except *
 
 
 cdef class TypedConfigurationOption(Callable):
@@ -114,16 +163,27 @@ cdef class Configuration(Object):
     cdef bint __strict
     cdef dict __children
     cdef object __weakref__
+    cdef dict __index
+    cdef object __index_source
+
+    cdef object __get_option_value(self, tuple path, bint required)
+    cdef dict __get_index(self)
+    cdef void __reset_changed_cache(self, dict old_index) except *
 
 
 # Factory providers
 cdef class Factory(Provider):
     cdef Callable __instantiator
+    cdef bint __batchable
 
     cdef tuple __attributes
     cdef int __attributes_len
+    cdef dict __attributes_plan
+    cdef tuple __attributes_plan_slots
+    cdef int __attributes_plan_slots_len
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void __compile_attributes_plan(self)
 
 
 cdef class DelegatedFactory(Factory):
@@ -148,6 +208,9 @@ cdef class FactoryAggregate(Provider):
 cdef class BaseSingleton(Provider):
     cdef Factory __instantiator
     cdef object __storage
+    cdef object __scope
+    cdef object __fork_policy
+    cdef object __weakref__
 
 
 cdef class Singleton(BaseSingleton):
@@ -161,8 +224,12 @@ cdef class DelegatedSingleton(Singleton):
 
 cdef class ThreadSafeSingleton(BaseSingleton):
     cdef object __storage_lock
+    cdef int __lock_waiters
+    cdef unsigned long __lock_wait_count
+    cdef double __lock_wait_time
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef void __acquire_storage_lock(self) except *
 
 
 cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
@@ -170,14 +237,82 @@ cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
 
 
 cdef class ThreadLocalSingleton(BaseSingleton):
+    cdef object __holders
+    cdef object __holders_lock
 
     cpdef object _provide(self, tuple args, dict kwargs)
+    cdef list __get_holders(self)
 
 
 cdef class DelegatedThreadLocalSingleton(ThreadLocalSingleton):
     pass
 
 
+cdef class ContextLocalSingleton(BaseSingleton):
+    cdef unsigned long long __context_key
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+
+
+cdef class DelegatedContextLocalSingleton(ContextLocalSingleton):
+    pass
+
+
+cdef class WeakSingleton(BaseSingleton):
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+    cdef object __make_ref(self, object instance)
+
+
+cdef class DelegatedWeakSingleton(WeakSingleton):
+    pass
+
+
+cdef class ExpiringSingleton(BaseSingleton):
+    cdef object __storage_lock
+    cdef object __ttl
+    cdef double __expires_at
+    cdef bint __background_refresh
+    cdef bint __refreshing
+    cdef object __refresh_error
+    cdef unsigned long long __generation
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+    cdef inline bint __is_expired(self)
+    cdef void __set_instance(self, object instance)
+    cdef void __start_refresh(self, tuple args, dict kwargs) except *
+    cdef void __finish_refresh(self, unsigned long long generation, object instance, object error) except *
+
+
+cdef class DelegatedExpiringSingleton(ExpiringSingleton):
+    pass
+
+
+cdef class Multiton(BaseSingleton):
+    cdef dict __instances
+    cdef object __max_size
+    cdef object __key
+    cdef object __eviction_callback
+    cdef unsigned long __hits
+    cdef unsigned long __misses
+    cdef unsigned long __evictions
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+    cdef object __make_key(self, tuple args, dict kwargs)
+    cdef object __get_cached(self, object key)
+    cdef object __create(self, object key, tuple args, dict kwargs)
+    cdef object __store(self, object key, object instance)
+    cdef void __evict_overflow(self) except *
+    cdef void __evicted(self, object instance) except *
+
+
+cdef class ThreadSafeMultiton(Multiton):
+    cdef object __lock
+    cdef dict __key_locks
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+
+
 cdef class AbstractSingleton(BaseSingleton):
     pass
 
@@ -188,6 +323,32 @@ cdef class SingletonDelegate(Delegate):
 
 # Miscellaneous providers
 
+# Pool providers
+cdef class Pool(Provider):
+    cdef Factory __instantiator
+    cdef int __max_size
+    cdef object __reset_hook
+    cdef object __max_idle_time
+    cdef list __idle
+    cdef dict __leased
+
+    cpdef object _provide(self, tuple args, dict kwargs)
+    cdef object __acquire(self)
+    cdef object __acquire_idle(self)
+    cdef object __create(self)
+    cdef bint __release_overriding(self, object instance) except -1
+    cdef void __take_leased(self, object instance) except *
+    cdef void __put_idle(self, object instance)
+
+
+cdef class ThreadSafePool(Pool):
+    cdef object __condition
+    cdef object __timeout
+    cdef int __creating
+
+    cdef object __acquire(self)
+
+
 cdef class List(Provider):
     cdef tuple __args
     cdef int __args_len
@@ -207,6 +368,8 @@ cdef class Resource(Provider):
     cdef bint __initialized
     cdef object __shutdowner
     cdef object __resource
+    cdef object __fork_policy
+    cdef object __weakref__
 
     cdef tuple __args
     cdef int __args_len
@@ -292,6 +455,21 @@ cdef class OverridingContext(object):
     cdef Provider __overriding
 
 
+cdef class PoolLease(object):
+    cdef Pool __pool
+    cdef object __instance
+
+
+cdef class Scope(object):
+    cdef object __name
+    cdef list __providers
+    cdef dict __instances
+    cdef object __lock
+    cdef object __previous
+
+    cdef object __provide(self, BaseSingleton provider, object key, tuple args, dict kwargs)
+
+
 cdef class BaseSingletonResetContext(object):
     cdef object __singleton
 
@@ -307,6 +485,11 @@ cdef class SingletonFullResetContext(BaseSingletonResetContext):
 cdef object CLASS_TYPES
 
 
+cdef object _provide_in_scope(BaseSingleton provider, object key, tuple args, dict kwargs)
+
+cdef void _register_fork_policy(Provider provider, object policy) except *
+
+
 cpdef bint is_provider(object instance)
 
 
@@ -336,15 +519,100 @@ cdef inline object __get_name(NamedInjection self):
 cdef inline object __get_value(Injection self):
     if self.__call == 0:
         return self.__value
+    if isinstance(self.__value, Provider) and (<Provider>self.__value).__fast_call:
+        return __provider_call(<Provider>self.__value, (), {})
     return self.__value()
 
 
 cdef inline object __get_value_kwargs(Injection self, dict kwargs):
     if self.__call == 0:
         return self.__value
+    if isinstance(self.__value, Provider) and (<Provider>self.__value).__fast_call:
+        return __provider_call(<Provider>self.__value, (), kwargs)
     return self.__value(**kwargs)
 
 
+# Provider call entry point that is used when provider class does not override
+# ``__call__()``. It skips Python call protocol and arguments packing.
+cdef inline Provider __resolve_overriding(Provider self):
+    """Return provider that the call is delegated to, skipping pass-through overridings.
+
+    Intermediate overriding providers are skipped when calling them would not change the
+    result: they are overridden themselves, do not override ``__call__()``, and do not
+    enforce async or sealed mode. Resolved provider is cached until any overriding chain
+    or async mode changes.
+    """
+    cdef Provider overriding = self.__last_overriding
+    cdef unsigned long long epoch
+
+    if overriding is None:
+        return None
+
+    epoch = _overriding_epoch
+    if self.__resolved_epoch == epoch and self.__resolved_overriding is not None:
+        return self.__resolved_overriding
+
+    while overriding.__last_overriding is not None \
+            and overriding.__fast_call \
+            and overriding.__async_mode != ASYNC_MODE_ENABLED \
+            and not overriding.__sync_sealed:
+        overriding = overriding.__last_overriding
+
+    self.__resolved_overriding = overriding
+    self.__resolved_epoch = epoch
+    return overriding
+
+
+cdef inline void __invalidate_resolved_overridings():
+    global _overriding_epoch
+    _overriding_epoch += 1
+
+
+cdef inline void __invalidate_instances():
+    global _instances_epoch
+    _instances_epoch += 1
+
+
+cdef inline void __check_frozen(Provider provider) except *:
+    if provider.__frozen:
+        raise Error('Provider {0} is frozen and can not be changed'.format(provider))
+
+
+cdef inline void __begin_change(Provider provider) except *:
+    global _graph_epoch
+    __check_frozen(provider)
+    _graph_epoch += 1
+
+
+cdef inline object __provider_call(Provider self, tuple args, dict kwargs):
+    cdef Provider overriding = __resolve_overriding(self)
+
+    if overriding is None:
+        result = self._provide(args, kwargs)
+    elif overriding.__fast_call:
+        result = __provider_call(overriding, args, kwargs)
+    else:
+        result = overriding(*args, **kwargs)
+
+    if self.__sync_sealed:
+        if __is_awaitable_result(result):
+            __raise_sync_sealed_error(self, result)
+        return result
+    elif self.__async_mode == ASYNC_MODE_DISABLED:
+        return result
+    elif self.__async_mode == ASYNC_MODE_ENABLED:
+        if __is_future_or_coroutine(result):
+            return result
+        return __future_result(result)
+    else:
+        if __is_future_or_coroutine(result):
+            self.__async_mode = ASYNC_MODE_ENABLED
+            __invalidate_resolved_overridings()
+        else:
+            self.__async_mode = ASYNC_MODE_DISABLED
+        return result
+
+
 cdef inline tuple __separate_prefixed_kwargs(dict kwargs):
     cdef dict plain_kwargs = {}
     cdef dict prefixed_kwargs = {}
@@ -401,6 +669,7 @@ cdef inline object __provide_keyword_args(
         dict kwargs,
         tuple inj_kwargs,
         int inj_kwargs_len,
+        bint check_futures,
 ):
     cdef int index
     cdef object name
@@ -415,7 +684,7 @@ cdef inline object __provide_keyword_args(
             name = __get_name(kw_injection)
             value = __get_value(kw_injection)
             kwargs[name] = value
-            if __is_future_or_coroutine(value):
+            if check_futures and __is_future_or_coroutine(value):
                 future_kwargs.append((name, value))
     else:
         kwargs, prefixed = __separate_prefixed_kwargs(kwargs)
@@ -434,7 +703,7 @@ cdef inline object __provide_keyword_args(
                 value = __get_value(kw_injection)
 
             kwargs[name] = value
-            if __is_future_or_coroutine(value):
+            if check_futures and __is_future_or_coroutine(value):
                 future_kwargs.append((name, value))
 
     if future_kwargs:
@@ -443,6 +712,242 @@ cdef inline object __provide_keyword_args(
     return kwargs
 
 
+# Context kwargs layouts are cached per set of context kwargs names, so
+# prefixed kwargs are split and overridden injections are skipped without
+# re-scanning every name on every call. Injections keep their order and follow
+# context kwargs, like in the not cached case.
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline tuple __compile_kwargs_layout(object names, tuple inj_kwargs, int inj_kwargs_len):
+    cdef int index
+    cdef set plain_names = set()
+    cdef dict prefixed_names = {}
+    cdef list entries = []
+    cdef NamedInjection kw_injection
+
+    for key in names:
+        if '__' not in key:
+            plain_names.add(key)
+            continue
+
+        index = key.index('__')
+        prefix, name = key[:index], key[index+2:]
+
+        if prefix not in prefixed_names:
+            prefixed_names[prefix] = []
+        prefixed_names[prefix].append((key, name))
+
+    for index in range(inj_kwargs_len):
+        kw_injection = <NamedInjection>inj_kwargs[index]
+        name = __get_name(kw_injection)
+
+        if name in plain_names:
+            continue
+
+        if name in prefixed_names:
+            entries.append((name, kw_injection, tuple(prefixed_names[name])))
+        elif __is_plan_slot(kw_injection):
+            entries.append((name, kw_injection, None))
+        else:
+            entries.append((name, None, kw_injection.__value))
+
+    if prefixed_names:
+        return frozenset(plain_names), tuple(entries)
+    return None, tuple(entries)
+
+
+cdef inline tuple __get_kwargs_layout(
+        dict layouts,
+        dict kwargs,
+        tuple inj_kwargs,
+        int inj_kwargs_len,
+):
+    names = frozenset(kwargs)
+    layout = layouts.get(names)
+
+    if layout is None:
+        layout = __compile_kwargs_layout(names, inj_kwargs, inj_kwargs_len)
+        if len(layouts) >= KWARGS_LAYOUTS_MAX_SIZE:
+            layouts.clear()
+        layouts[names] = layout
+
+    return <tuple>layout
+
+
+cdef inline object __provide_layout_keyword_args(
+        dict kwargs,
+        tuple layout,
+        bint check_futures,
+):
+    cdef dict keyword_args
+    cdef list future_kwargs = []
+
+    plain_names, entries = layout
+
+    if plain_names is None:
+        keyword_args = kwargs.copy()
+    else:
+        keyword_args = {
+            key: value
+            for key, value in kwargs.items()
+            if key in <frozenset>plain_names
+        }
+
+    for name, kw_injection, value in <tuple>entries:
+        if kw_injection is None:
+            keyword_args[name] = value
+            continue
+
+        if value is None:
+            value = __get_value(<NamedInjection>kw_injection)
+        else:
+            value = __get_value_kwargs(
+                <NamedInjection>kw_injection,
+                {prefixed_name: kwargs[key] for key, prefixed_name in <tuple>value},
+            )
+        keyword_args[name] = value
+
+        if check_futures and __is_future_or_coroutine(value):
+            future_kwargs.append((name, value))
+
+    if future_kwargs:
+        return __combine_future_injections(keyword_args, future_kwargs)
+
+    return keyword_args
+
+
+# Injection plans are compiled once, when injections are set, so providing
+# does not need to walk every injection on every call. Constant and delegated
+# values are pre-filled; only provider and awaitable values are kept as slots.
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline tuple __compile_positional_plan(tuple inj_args, int inj_args_len):
+    cdef int index
+    cdef list values = []
+    cdef list slots = []
+    cdef list indexes = []
+    cdef PositionalInjection injection
+
+    for index in range(inj_args_len):
+        injection = <PositionalInjection>inj_args[index]
+        if __is_plan_slot(injection):
+            values.append(None)
+            slots.append(injection)
+            indexes.append(index)
+        else:
+            values.append(injection.__value)
+
+    return tuple(values), tuple(slots), tuple(indexes)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline tuple __compile_named_plan(tuple inj_kwargs, int inj_kwargs_len):
+    cdef int index
+    cdef dict values = {}
+    cdef list slots = []
+    cdef NamedInjection injection
+
+    for index in range(inj_kwargs_len):
+        injection = <NamedInjection>inj_kwargs[index]
+        if __is_plan_slot(injection):
+            values[injection.__name] = None
+            slots.append(injection)
+        else:
+            values[injection.__name] = injection.__value
+
+    return values, tuple(slots)
+
+
+cdef inline bint __is_plan_slot(Injection injection):
+    return injection.__call == 1 or __is_future_or_coroutine(injection.__value)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline object __provide_planned_positional_args(
+        tuple args,
+        tuple plan,
+        tuple plan_slots,
+        tuple plan_indexes,
+        int plan_slots_len,
+        bint check_futures,
+):
+    cdef int index
+    cdef int position
+    cdef list positional_args
+    cdef list future_args = []
+    cdef PositionalInjection injection
+
+    if plan_slots_len == 0:
+        if len(args) == 0:
+            return plan
+        return plan + args
+
+    positional_args = list(plan)
+
+    for index in range(plan_slots_len):
+        injection = <PositionalInjection>plan_slots[index]
+        position = <int>plan_indexes[index]
+        value = __get_value(injection)
+        positional_args[position] = value
+
+        if check_futures and __is_future_or_coroutine(value):
+            future_args.append((position, value))
+
+    positional_args.extend(args)
+
+    if future_args:
+        return __combine_future_injections(positional_args, future_args)
+
+    return positional_args
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline object __provide_planned_keyword_args(
+        dict kwargs,
+        dict plan,
+        tuple plan_slots,
+        int plan_slots_len,
+        tuple inj_kwargs,
+        int inj_kwargs_len,
+        dict layouts,
+        bint check_futures,
+):
+    cdef int index
+    cdef object name
+    cdef object value
+    cdef list future_kwargs = []
+    cdef NamedInjection kw_injection
+
+    if len(kwargs) != 0:
+        return __provide_layout_keyword_args(
+            kwargs,
+            __get_kwargs_layout(layouts, kwargs, inj_kwargs, inj_kwargs_len),
+            check_futures,
+        )
+
+    if inj_kwargs_len == 0:
+        return kwargs
+
+    kwargs = plan.copy()
+
+    for index in range(plan_slots_len):
+        kw_injection = <NamedInjection>plan_slots[index]
+        name = __get_name(kw_injection)
+        value = __get_value(kw_injection)
+        kwargs[name] = value
+
+        if check_futures and __is_future_or_coroutine(value):
+            future_kwargs.append((name, value))
+
+    if future_kwargs:
+        return __combine_future_injections(kwargs, future_kwargs)
+
+    return kwargs
+
+
 cdef inline object __combine_future_injections(object injections, list future_injections):
     future_result = asyncio.Future()
 
@@ -497,6 +1002,32 @@ cdef inline object __provide_attributes(tuple attributes, int attributes_len):
     return attribute_injections
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline object __provide_planned_attributes(
+        dict plan,
+        tuple plan_slots,
+        int plan_slots_len,
+        bint check_futures,
+):
+    cdef NamedInjection attr_injection
+    cdef dict attribute_injections = plan.copy()
+    cdef list future_attributes = []
+
+    for index in range(plan_slots_len):
+        attr_injection = <NamedInjection>plan_slots[index]
+        name = __get_name(attr_injection)
+        value = __get_value(attr_injection)
+        attribute_injections[name] = value
+        if check_futures and __is_future_or_coroutine(value):
+            future_attributes.append((name, value))
+
+    if future_attributes:
+        return __combine_future_injections(attribute_injections, future_attributes)
+
+    return attribute_injections
+
+
 cdef inline object __async_inject_attributes(future_instance, future_attributes):
     future_result = asyncio.Future()
 
@@ -547,8 +1078,13 @@ cdef inline object __call(
         context_kwargs,
         injection_kwargs,
         injection_kwargs_len,
+        True,
     )
 
+    return __call_with_injections(call, args, kwargs)
+
+
+cdef inline object __call_with_injections(object call, object args, object kwargs):
     is_future_args = __is_future_or_coroutine(args)
     is_future_kwargs = __is_future_or_coroutine(kwargs)
 
@@ -597,16 +1133,37 @@ cdef inline object __async_result_callback(object future_result, object future):
 
 
 cdef inline object __callable_call(Callable self, tuple args, dict kwargs):
-    return __call(
-        self.__provides,
+    cdef bint check_futures = not self.__sync_sealed
+    cdef bint is_static = (
+        self.__args_plan_slots_len == 0
+        and self.__kwargs_plan_slots_len == 0
+        and len(kwargs) == 0
+    )
+
+    positional_args = __provide_planned_positional_args(
         args,
-        self.__args,
-        self.__args_len,
+        self.__args_plan,
+        self.__args_plan_slots,
+        self.__args_plan_indexes,
+        self.__args_plan_slots_len,
+        check_futures,
+    )
+    keyword_args = __provide_planned_keyword_args(
         kwargs,
+        self.__kwargs_plan,
+        self.__kwargs_plan_slots,
+        self.__kwargs_plan_slots_len,
         self.__kwargs,
         self.__kwargs_len,
+        self.__kwargs_layouts,
+        check_futures,
     )
 
+    if is_static or not check_futures:
+        return self.__provides(*positional_args, **keyword_args)
+
+    return __call_with_injections(self.__provides, positional_args, keyword_args)
+
 
 cdef inline object __factory_call(Factory self, tuple args, dict kwargs):
     cdef object instance
@@ -614,7 +1171,16 @@ cdef inline object __factory_call(Factory self, tuple args, dict kwargs):
     instance = __callable_call(self.__instantiator, args, kwargs)
 
     if self.__attributes_len > 0:
-        attributes = __provide_attributes(self.__attributes, self.__attributes_len)
+        attributes = __provide_planned_attributes(
+            self.__attributes_plan,
+            self.__attributes_plan_slots,
+            self.__attributes_plan_slots_len,
+            not self.__sync_sealed,
+        )
+
+        if self.__sync_sealed:
+            __inject_attributes(instance, attributes)
+            return instance
 
         is_future_instance = __is_future_or_coroutine(instance)
         is_future_attributes = __is_future_or_coroutine(attributes)
@@ -635,6 +1201,22 @@ cdef inline bint __is_future_or_coroutine(object instance):
     return asyncio.isfuture(instance) or asyncio.iscoroutine(instance)
 
 
+# Cheap check that is used by sealed synchronous providers instead of
+# asyncio.isfuture() and asyncio.iscoroutine() calls.
+cdef inline bint __is_awaitable_result(object instance):
+    if asyncio is None:
+        return False
+    return PyCoro_CheckExact(instance) or isinstance(instance, asyncio.Future)
+
+
+cdef inline void __raise_sync_sealed_error(Provider provider, object result) except *:
+    if PyCoro_CheckExact(result):
+        result.close()
+    raise Error(
+        'Provider {0} is sealed as synchronous, but provided an awaitable {1}'.format(provider, result),
+    )
+
+
 cdef inline object __future_result(object instance):
     future_result = asyncio.Future()
     future_result.set_result(instance)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from threading import RLock
 from typing import (
     Awaitable,
     TypeVar,
@@ -15,9 +16,11 @@ from typing import (
     Union,
     Coroutine as _Coroutine,
     Iterable as _Iterable,
+    Mapping as _Mapping,
     Iterator as _Iterator,
     AsyncIterator as _AsyncIterator,
     Generator as _Generator,
+    Hashable,
     overload,
 )
 
@@ -40,6 +43,7 @@ T = TypeVar('T')
 TT = TypeVar('TT')
 P = TypeVar('P', bound='Provider')
 BS = TypeVar('BS', bound='BaseSingleton')
+PL = TypeVar('PL', bound='Pool')
 
 
 class Provider(Generic[T]):
@@ -58,6 +62,8 @@ class Provider(Generic[T]):
     def overridden(self) -> Tuple[Provider]: ...
     @property
     def last_overriding(self) -> Optional[Provider]: ...
+    @property
+    def overriding_chain_depth(self) -> int: ...
     def override(self, provider: Union[Provider, Any]) -> OverridingContext[P]: ...
     def reset_last_overriding(self) -> None: ...
     def reset_override(self) -> None: ...
@@ -72,6 +78,10 @@ class Provider(Generic[T]):
     def is_async_mode_enabled(self) -> bool: ...
     def is_async_mode_disabled(self) -> bool: ...
     def is_async_mode_undefined(self) -> bool: ...
+    def seal_sync(self: P) -> P: ...
+    def is_sync_sealed(self) -> bool: ...
+    def freeze(self: P) -> P: ...
+    def is_frozen(self) -> bool: ...
     @property
     def related(self) -> _Iterator[Provider]: ...
     def traverse(self, types: Optional[_Iterable[Type[TT]]] = None) -> _Iterator[TT]: ...
@@ -181,6 +191,7 @@ class ConfigurationOption(Provider[Any]):
     def root(self) -> Configuration: ...
     def get_name(self) -> str: ...
     def get_name_segments(self) -> Tuple[Union[str, Provider]]: ...
+    def get_path(self) -> Tuple[str, ...]: ...
     def as_int(self) -> TypedConfigurationOption[int]: ...
     def as_float(self) -> TypedConfigurationOption[float]: ...
     def as_(self, callback: _Callable[..., T], *args: Injection, **kwargs: Injection) -> TypedConfigurationOption[T]: ...
@@ -207,8 +218,9 @@ class Configuration(Object[Any]):
     def __getattr__(self, item: str) -> ConfigurationOption: ...
     def __getitem__(self, item: Union[str, Provider]) -> ConfigurationOption: ...
     def get_name(self) -> str: ...
-    def get(self, selector: str) -> Any: ...
-    def set(self, selector: str, value: Any) -> OverridingContext[P]: ...
+    def get(self, selector: Union[str, Tuple[str, ...]], required: bool = False) -> Any: ...
+    def set(self, selector: Union[str, Tuple[str, ...]], value: Any) -> OverridingContext[P]: ...
+    def compact(self) -> None: ...
     def reset_cache(self) -> None: ...
     def update(self, value: Any) -> None: ...
     def from_ini(self, filepath: Union[Path, str], required: bool = False) -> None: ...
@@ -216,6 +228,7 @@ class Configuration(Object[Any]):
     def from_pydantic(self, settings: PydanticSettings, required: bool = False, **kwargs: Any) -> None: ...
     def from_dict(self, options: _Dict[str, Any], required: bool = False) -> None: ...
     def from_env(self, name: str, default: Optional[Any] = None, required: bool = False) -> None: ...
+    def load(self, sources: _Iterable[Union[Path, str, _Mapping[str, Any], PydanticSettings]] = (), env: Optional[_Dict[str, str]] = None, required: bool = False, loader: Optional[Any] = None, max_workers: Optional[int] = 1) -> OverridingContext[P]: ...
 
 
 class Factory(Provider[T]):
@@ -240,6 +253,9 @@ class Factory(Provider[T]):
     def add_attributes(self, **kwargs: Injection) -> Factory[T]: ...
     def set_attributes(self, **kwargs: Injection) -> Factory[T]: ...
     def clear_attributes(self) -> Factory[T]: ...
+    def many(self, n: int, **kwargs: Injection) -> _List[T]: ...
+    def map(self, kwargs_iterable: _Iterable[_Dict[str, Injection]]) -> _Iterator[T]: ...
+    def map_async(self, kwargs_iterable: _Iterable[_Dict[str, Injection]]) -> _AsyncIterator[T]: ...
 
 
 class DelegatedFactory(Factory[T]): ...
@@ -289,6 +305,12 @@ class BaseSingleton(Provider[T]):
     def add_attributes(self, **kwargs: Injection) -> BaseSingleton[T]: ...
     def set_attributes(self, **kwargs: Injection) -> BaseSingleton[T]: ...
     def clear_attributes(self) -> BaseSingleton[T]: ...
+    @property
+    def scope(self) -> Optional[str]: ...
+    def set_scope(self, name: Optional[str]) -> BaseSingleton[T]: ...
+    @property
+    def fork_policy(self) -> Optional[str]: ...
+    def set_fork_policy(self, policy: Optional[str]) -> BaseSingleton[T]: ...
     def reset(self) -> SingletonResetContext[BS]: ...
     def full_reset(self) -> SingletonFullResetContext[BS]: ...
 
@@ -299,18 +321,82 @@ class Singleton(BaseSingleton[T]): ...
 class DelegatedSingleton(Singleton[T]): ...
 
 
-class ThreadSafeSingleton(Singleton[T]): ...
+class ThreadSafeSingleton(Singleton[T]):
+    storage_lock: RLock
+    per_provider_lock: bool
+    @property
+    def lock_waiters(self) -> int: ...
+    @property
+    def lock_wait_count(self) -> int: ...
+    @property
+    def lock_wait_time(self) -> float: ...
 
 
 class DelegatedThreadSafeSingleton(ThreadSafeSingleton[T]): ...
 
 
-class ThreadLocalSingleton(BaseSingleton[T]): ...
+class ThreadLocalSingleton(BaseSingleton[T]):
+    @property
+    def size(self) -> int: ...
+    def reset_all_threads(self) -> SingletonResetContext[BS]: ...
 
 
 class DelegatedThreadLocalSingleton(ThreadLocalSingleton[T]): ...
 
 
+class ContextLocalSingleton(BaseSingleton[T]): ...
+
+
+class WeakSingleton(BaseSingleton[T]):
+    @property
+    def is_alive(self) -> bool: ...
+
+
+class DelegatedWeakSingleton(WeakSingleton[T]): ...
+
+
+class Multiton(BaseSingleton[T]):
+    @property
+    def max_size(self) -> Optional[int]: ...
+    def set_max_size(self, max_size: Optional[int]) -> Multiton[T]: ...
+    @property
+    def key(self) -> Optional[_Callable[..., Hashable]]: ...
+    def set_key(self, key: Optional[_Callable[..., Hashable]]) -> Multiton[T]: ...
+    @property
+    def eviction_callback(self) -> Optional[_Callable[[T], Any]]: ...
+    def set_eviction_callback(self, callback: Optional[_Callable[[T], Any]]) -> Multiton[T]: ...
+    @property
+    def size(self) -> int: ...
+    @property
+    def hits(self) -> int: ...
+    @property
+    def misses(self) -> int: ...
+    @property
+    def evictions(self) -> int: ...
+    def evict(self, *args: Any, **kwargs: Any) -> None: ...
+
+
+class ThreadSafeMultiton(Multiton[T]): ...
+
+
+class ExpiringSingleton(BaseSingleton[T]):
+    @property
+    def ttl(self) -> Optional[float]: ...
+    def set_ttl(self, ttl: Optional[float]) -> ExpiringSingleton[T]: ...
+    @property
+    def background_refresh(self) -> bool: ...
+    def set_background_refresh(self, enabled: bool = True) -> ExpiringSingleton[T]: ...
+    @property
+    def refresh_error(self) -> Optional[Exception]: ...
+    def is_expired(self) -> bool: ...
+
+
+class DelegatedExpiringSingleton(ExpiringSingleton[T]): ...
+
+
+class DelegatedContextLocalSingleton(ContextLocalSingleton[T]): ...
+
+
 class AbstractSingleton(BaseSingleton[T]):
     def override(self, provider: BaseSingleton) -> OverridingContext[P]: ...
 
@@ -319,6 +405,61 @@ class SingletonDelegate(Delegate):
     def __init__(self, factory: BaseSingleton): ...
 
 
+class Pool(Provider[PoolLease[T]]):
+    default_max_size: int
+    def __init__(self, provides: _Callable[..., T], *args: Injection, **kwargs: Injection) -> None: ...
+    @property
+    def cls(self) -> T: ...
+    @property
+    def provides(self) -> T: ...
+    @property
+    def args(self) -> Tuple[Injection]: ...
+    def add_args(self: PL, *args: Injection) -> PL: ...
+    def set_args(self: PL, *args: Injection) -> PL: ...
+    def clear_args(self: PL) -> PL: ...
+    @property
+    def kwargs(self) -> _Dict[Any, Injection]: ...
+    def add_kwargs(self: PL, **kwargs: Injection) -> PL: ...
+    def set_kwargs(self: PL, **kwargs: Injection) -> PL: ...
+    def clear_kwargs(self: PL) -> PL: ...
+    @property
+    def attributes(self) -> _Dict[Any, Injection]: ...
+    def add_attributes(self: PL, **kwargs: Injection) -> PL: ...
+    def set_attributes(self: PL, **kwargs: Injection) -> PL: ...
+    def clear_attributes(self: PL) -> PL: ...
+    @property
+    def max_size(self) -> int: ...
+    def set_max_size(self: PL, max_size: int) -> PL: ...
+    @property
+    def reset_hook(self) -> Optional[_Callable[[T], Any]]: ...
+    def set_reset_hook(self: PL, hook: Optional[_Callable[[T], Any]]) -> PL: ...
+    @property
+    def max_idle_time(self) -> Optional[float]: ...
+    def set_max_idle_time(self: PL, max_idle_time: Optional[float]) -> PL: ...
+    @property
+    def size(self) -> int: ...
+    @property
+    def idle_size(self) -> int: ...
+    def acquire(self) -> T: ...
+    def release(self, instance: T) -> None: ...
+    def lease(self) -> PoolLease[T]: ...
+    def reset(self) -> None: ...
+
+
+class ThreadSafePool(Pool[T]):
+    @property
+    def timeout(self) -> Optional[float]: ...
+    def set_timeout(self: PL, timeout: Optional[float]) -> PL: ...
+
+
+class PoolLease(Generic[T]):
+    def __init__(self, pool: Pool[T]) -> None: ...
+    def __enter__(self) -> T: ...
+    def __exit__(self, *_: Any) -> None: ...
+    async def __aenter__(self) -> T: ...
+    async def __aexit__(self, *_: Any) -> None: ...
+
+
 class List(Provider[_List]):
     def __init__(self, *args: Injection): ...
     @property
@@ -364,6 +505,9 @@ class Resource(Provider[T]):
     def clear_kwargs(self) -> Resource[T]: ...
     @property
     def initialized(self) -> bool: ...
+    @property
+    def fork_policy(self) -> Optional[str]: ...
+    def set_fork_policy(self, policy: Optional[str]) -> Resource[T]: ...
     def init(self) -> Optional[Awaitable[T]]: ...
     def shutdown(self) -> Optional[Awaitable]: ...
 
@@ -416,6 +560,23 @@ class OverridingContext(Generic[T]):
     def __exit__(self, *_: Any) -> None: ...
 
 
+class Scope:
+    def __init__(self, name: str) -> None: ...
+    @property
+    def name(self) -> str: ...
+    @property
+    def providers(self) -> Tuple[BaseSingleton[Any], ...]: ...
+    @property
+    def is_active(self) -> bool: ...
+    def enter(self) -> Scope: ...
+    def exit(self) -> None: ...
+    def reset(self) -> None: ...
+    def __enter__(self) -> Scope: ...
+    def __exit__(self, *_: Any) -> None: ...
+    async def __aenter__(self) -> Scope: ...
+    async def __aexit__(self, *_: Any) -> None: ...
+
+
 class BaseSingletonResetContext(Generic[T]):
     def __init__(self, provider: T): ...
     def __enter__(self) -> T: ...
@@ -432,6 +593,10 @@ class SingletonFullResetContext(BaseSingletonResetContext):
 
 CHILD_PROVIDERS: Tuple[Provider]
 
+FORK_POLICY_RESET: str
+FORK_POLICY_REINIT: str
+FORK_POLICIES: Tuple[Optional[str], ...]
+
 
 def is_provider(instance: Any) -> bool: ...
 
@@ -454,6 +619,37 @@ def merge_dicts(dict1: _Dict[Any, Any], dict2: _Dict[Any, Any]) -> _Dict[Any, An
 def traverse(*providers: Provider, types: Optional[_Iterable[Type]]=None) -> _Iterator[Provider]: ...
 
 
+def seal_sync(*providers: Provider) -> None: ...
+
+
+def freeze(*providers: Provider) -> None: ...
+
+
+def warm_up(
+        *providers: Provider,
+        types: Optional[_Iterable[Type]] = None,
+        max_workers: Optional[int] = None,
+) -> Union[_Dict[Provider, float], Awaitable[_Dict[Provider, float]]]: ...
+
+
+def prefork(*providers: Provider, max_workers: Optional[int] = None) -> _Dict[str, Any]: ...
+
+
+def after_fork() -> None: ...
+
+
+def get_active_scope(name: str) -> Optional[Scope]: ...
+
+
+def enable_dependency_type_checks() -> None: ...
+
+
+def disable_dependency_type_checks() -> None: ...
+
+
+def is_dependency_type_checks_enabled() -> bool: ...
+
+
 if yaml:
     class YamlLoader(yaml.SafeLoader): ...
 else:
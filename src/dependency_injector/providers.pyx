@@ -2,16 +2,21 @@
 
 from __future__ import absolute_import
 
+import abc
+import concurrent.futures
 import copy
 import errno
 import functools
+import gc
 import inspect
 import os
 import re
 import sys
 import types
 import threading
+import time
 import warnings
+import weakref
 
 try:
     import asyncio
@@ -25,6 +30,16 @@ else:
     else:
         _is_coroutine_marker = True
 
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
 try:
     import ConfigParser as iniconfigparser
 except ImportError:
@@ -111,9 +126,14 @@ else:
 
 UNDEFINED = object()
 
-cdef int ASYNC_MODE_UNDEFINED = 0
-cdef int ASYNC_MODE_ENABLED = 1
-cdef int ASYNC_MODE_DISABLED = 2
+FORK_POLICY_RESET = 'reset'
+FORK_POLICY_REINIT = 'reinit'
+FORK_POLICIES = (None, FORK_POLICY_RESET, FORK_POLICY_REINIT)
+
+DEPENDENCY_TYPE_CHECKS_ENV = 'DEPENDENCY_INJECTOR_SKIP_TYPE_CHECKS'
+CHECKED_TYPES_MAX_SIZE = 64
+
+cdef bint _dependency_type_checks = os.environ.get(DEPENDENCY_TYPE_CHECKS_ENV, '') in ('', '0')
 
 
 cdef class Provider(object):
@@ -177,6 +197,9 @@ cdef class Provider(object):
         self.__overridden = tuple()
         self.__last_overriding = None
         self.__async_mode = ASYNC_MODE_UNDEFINED
+        self.__fast_call = type(self).__call__ is Provider.__call__
+        self.__sync_sealed = False
+        self.__frozen = False
         super(Provider, self).__init__()
 
     def __call__(self, *args, **kwargs):
@@ -184,23 +207,7 @@ cdef class Provider(object):
 
         Callable interface implementation.
         """
-        if self.__last_overriding is not None:
-            result = self.__last_overriding(*args, **kwargs)
-        else:
-            result = self._provide(args, kwargs)
-
-        if self.is_async_mode_disabled():
-            return result
-        elif self.is_async_mode_enabled():
-            if __is_future_or_coroutine(result):
-                return result
-            return __future_result(result)
-        elif self.is_async_mode_undefined():
-            if __is_future_or_coroutine(result):
-                self.enable_async_mode()
-            else:
-                self.disable_async_mode()
-            return result
+        return __provider_call(self, args, kwargs)
 
     def __deepcopy__(self, memo):
         """Create and return full copy of provider."""
@@ -235,6 +242,8 @@ cdef class Provider(object):
     @property
     def overridden(self):
         """Return tuple of overriding providers."""
+        if self.__frozen:
+            return self.__overridden
         with self.overriding_lock:
             return self.__overridden
 
@@ -246,6 +255,22 @@ cdef class Provider(object):
         """
         return self.__last_overriding
 
+    @property
+    def overriding_chain_depth(self):
+        """Return depth of overriding chain.
+
+        Depth is a number of overriding providers that are followed from the provider
+        to the provider that is not overridden. If provider is not overridden, then 0 is returned.
+        """
+        cdef Provider overriding = self.__last_overriding
+        cdef int depth = 0
+
+        while overriding is not None:
+            depth += 1
+            overriding = overriding.__last_overriding
+
+        return depth
+
     def override(self, provider):
         """Override provider with another provider.
 
@@ -257,6 +282,7 @@ cdef class Provider(object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
+        __begin_change(self)
         if provider is self:
             raise Error('Provider {0} could not be overridden '
                         'with itself'.format(self))
@@ -267,6 +293,7 @@ cdef class Provider(object):
         with self.overriding_lock:
             self.__overridden += (provider,)
             self.__last_overriding = provider
+            __invalidate_resolved_overridings()
 
         return OverridingContext(self, provider)
 
@@ -278,6 +305,7 @@ cdef class Provider(object):
 
         :rtype: None
         """
+        __begin_change(self)
         with self.overriding_lock:
             if len(self.__overridden) == 0:
                 raise Error('Provider {0} is not overridden'.format(str(self)))
@@ -287,15 +315,18 @@ cdef class Provider(object):
                 self.__last_overriding = self.__overridden[-1]
             except IndexError:
                 self.__last_overriding = None
+            __invalidate_resolved_overridings()
 
     def reset_override(self):
         """Reset all overriding providers.
 
         :rtype: None
         """
+        __begin_change(self)
         with self.overriding_lock:
             self.__overridden = tuple()
             self.__last_overriding = None
+            __invalidate_resolved_overridings()
 
     def async_(self, *args, **kwargs):
         """Return provided object asynchronously.
@@ -340,19 +371,60 @@ cdef class Provider(object):
         return ProvidedInstance(self)
 
     def enable_async_mode(self):
-        """Enable async mode."""
+        """Enable async mode.
+
+        If provider is sealed as synchronous, the seal is removed.
+        """
         self.__async_mode = ASYNC_MODE_ENABLED
+        self.__sync_sealed = False
+        __invalidate_resolved_overridings()
 
     def disable_async_mode(self):
         """Disable async mode."""
         self.__async_mode = ASYNC_MODE_DISABLED
+        __invalidate_resolved_overridings()
 
     def reset_async_mode(self):
         """Reset async mode.
 
-        Provider will automatically set the mode on the next call.
+        Provider will automatically set the mode on the next call. If provider is sealed as
+        synchronous, the seal is removed.
         """
         self.__async_mode = ASYNC_MODE_UNDEFINED
+        self.__sync_sealed = False
+        __invalidate_resolved_overridings()
+
+    def seal_sync(self):
+        """Seal provider and all providers it depends on as synchronous.
+
+        Sealed providers work in sync mode and skip async detection of injected values
+        and provided results. If sealed provider provides an awaitable, it raises an error.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if any of the providers is
+                asynchronous.
+
+        :return: Reference ``self``
+        """
+        seal_sync(self)
+        return self
+
+    def is_sync_sealed(self):
+        """Check if provider is sealed as synchronous."""
+        return self.__sync_sealed
+
+    def freeze(self):
+        """Freeze provider and all providers it depends on.
+
+        Frozen providers can not be overridden and their injections can not be changed.
+
+        :return: Reference ``self``
+        """
+        freeze(self)
+        return self
+
+    def is_frozen(self):
+        """Check if provider is frozen."""
+        return self.__frozen
 
     def is_async_mode_enabled(self):
         """Check if async mode is enabled."""
@@ -388,6 +460,22 @@ cdef class Provider(object):
         """Copy provider overridings to a newly copied provider."""
         copied.__overridden = deepcopy(self.__overridden, memo)
         copied.__last_overriding = deepcopy(self.__last_overriding, memo)
+        __invalidate_resolved_overridings()
+
+    def _check_sync_seal(self):
+        """Check that provider can be sealed as synchronous."""
+        if self.__async_mode == ASYNC_MODE_ENABLED:
+            raise Error('Provider {0} can not be sealed as synchronous, async mode is enabled'.format(self))
+
+    def _apply_sync_seal(self):
+        """Seal provider as synchronous."""
+        self.__async_mode = ASYNC_MODE_DISABLED
+        self.__sync_sealed = True
+        __invalidate_resolved_overridings()
+
+    def _freeze(self):
+        """Freeze provider."""
+        self.__frozen = True
 
 
 cdef class Object(Provider):
@@ -619,6 +707,12 @@ cdef class Dependency(Provider):
 
         self.__parent = None
 
+        self.__checked_types = set()
+        self.__cache_checked_types = (
+            type(instance_of).__instancecheck__ in (type.__instancecheck__, abc.ABCMeta.__instancecheck__)
+            and type(self)._check_instance_type is Dependency._check_instance_type
+        )
+
         super(Dependency, self).__init__()
 
     def __deepcopy__(self, memo):
@@ -656,7 +750,7 @@ cdef class Dependency(Provider):
             self._raise_undefined_error()
 
         if self.is_async_mode_disabled():
-            self._check_instance_type(result)
+            self.__check_result_type(result)
             return result
         elif self.is_async_mode_enabled():
             if __is_future_or_coroutine(result):
@@ -665,7 +759,7 @@ cdef class Dependency(Provider):
                 result.add_done_callback(functools.partial(self._async_provide, future_result))
                 return future_result
             else:
-                self._check_instance_type(result)
+                self.__check_result_type(result)
                 return __future_result(result)
         elif self.is_async_mode_undefined():
             if __is_future_or_coroutine(result):
@@ -677,7 +771,7 @@ cdef class Dependency(Provider):
                 return future_result
             else:
                 self.disable_async_mode()
-                self._check_instance_type(result)
+                self.__check_result_type(result)
                 return result
 
     def __getattr__(self, name):
@@ -766,7 +860,7 @@ cdef class Dependency(Provider):
     def _async_provide(self, future_result, future):
         try:
             instance = future.result()
-            self._check_instance_type(instance)
+            self.__check_result_type(instance)
         except Exception as exception:
             future_result.set_exception(exception)
         else:
@@ -776,6 +870,24 @@ cdef class Dependency(Provider):
         if not isinstance(instance, self.instance_of):
             raise Error('{0} is not an instance of {1}'.format(instance, self.instance_of))
 
+    cdef void __check_result_type(self, object instance) except *:
+        """Check type of provided instance, unless the type has already passed the check."""
+        if not _dependency_type_checks or self.__instance_of is object:
+            return
+
+        if not self.__cache_checked_types:
+            self._check_instance_type(instance)
+            return
+
+        instance_type = type(instance)
+        if instance_type in self.__checked_types:
+            return
+
+        self._check_instance_type(instance)
+
+        if len(self.__checked_types) < CHECKED_TYPES_MAX_SIZE:
+            self.__checked_types.add(instance_type)
+
     def _raise_undefined_error(self):
         if self.parent_name:
             raise Error(f'Dependency "{self.parent_name}" is not defined')
@@ -913,6 +1025,7 @@ cdef class DependenciesContainer(Object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
+        __begin_change(self)
         self._override_providers(container=provider)
         return super(DependenciesContainer, self).override(provider)
 
@@ -924,6 +1037,7 @@ cdef class DependenciesContainer(Object):
 
         :rtype: None
         """
+        __begin_change(self)
         for child in self.__providers.values():
             try:
                 child.reset_last_overriding()
@@ -936,6 +1050,7 @@ cdef class DependenciesContainer(Object):
 
         :rtype: None
         """
+        __begin_change(self)
         for child in self.__providers.values():
             child.reset_override()
         super(DependenciesContainer, self).reset_override()
@@ -1085,8 +1200,10 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args += parse_positional_injections(args)
         self.__args_len = len(self.__args)
+        self.__compile_args_plan()
         return self
 
     def set_args(self, *args):
@@ -1096,8 +1213,10 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args = parse_positional_injections(args)
         self.__args_len = len(self.__args)
+        self.__compile_args_plan()
         return self
 
     def clear_args(self):
@@ -1105,8 +1224,10 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args = tuple()
         self.__args_len = len(self.__args)
+        self.__compile_args_plan()
         return self
 
     @property
@@ -1127,8 +1248,10 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs += parse_named_injections(kwargs)
         self.__kwargs_len = len(self.__kwargs)
+        self.__compile_kwargs_plan()
         return self
 
     def set_kwargs(self, **kwargs):
@@ -1138,8 +1261,10 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs = parse_named_injections(kwargs)
         self.__kwargs_len = len(self.__kwargs)
+        self.__compile_kwargs_plan()
         return self
 
     def clear_kwargs(self):
@@ -1147,8 +1272,10 @@ cdef class Callable(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs = tuple()
         self.__kwargs_len = len(self.__kwargs)
+        self.__compile_kwargs_plan()
         return self
 
     @property
@@ -1163,6 +1290,19 @@ cdef class Callable(Provider):
         """Return result of provided callable's call."""
         return __callable_call(self, args, kwargs)
 
+    cdef void __compile_args_plan(self):
+        """Compile positional argument injections into a call plan."""
+        self.__args_plan, self.__args_plan_slots, self.__args_plan_indexes = \
+            __compile_positional_plan(self.__args, self.__args_len)
+        self.__args_plan_slots_len = len(self.__args_plan_slots)
+
+    cdef void __compile_kwargs_plan(self):
+        """Compile keyword argument injections into a call plan."""
+        self.__kwargs_plan, self.__kwargs_plan_slots = \
+            __compile_named_plan(self.__kwargs, self.__kwargs_len)
+        self.__kwargs_plan_slots_len = len(self.__kwargs_plan_slots)
+        self.__kwargs_layouts = {}
+
 
 cdef class DelegatedCallable(Callable):
     """Callable that is injected "as is".
@@ -1279,6 +1419,10 @@ cdef class Coroutine(Callable):
 
         super(Coroutine, self).__init__(provides, *args, **kwargs)
 
+    def _check_sync_seal(self):
+        """Check that provider can be sealed as synchronous."""
+        raise Error('Provider {0} can not be sealed as synchronous'.format(self))
+
 
 cdef class DelegatedCoroutine(Coroutine):
     """Coroutine provider that is injected "as is".
@@ -1365,6 +1509,7 @@ cdef class ConfigurationOption(Provider):
         self.__children = {}
         self.__required = required
         self.__cache = UNDEFINED
+        self.__path = _get_configuration_path(name)
         super().__init__()
 
     def __deepcopy__(self, memo):
@@ -1418,7 +1563,11 @@ cdef class ConfigurationOption(Provider):
         if self.__cache is not UNDEFINED:
             return self.__cache
 
-        value = self.__root.get(self._get_self_name(), self.__required)
+        path = self.__path
+        if path is None:
+            path = _get_configuration_path(self.__name, resolve=True)
+
+        value = self.__root.__get_option_value(path, self.__required)
         self.__cache = value
         return value
 
@@ -1427,6 +1576,15 @@ cdef class ConfigurationOption(Provider):
             segment() if is_provider(segment) else segment for segment in self.__name
         )
 
+    def get_path(self):
+        """Return path of the option in the configuration.
+
+        :rtype: tuple[str]
+        """
+        if self.__path is not None:
+            return self.__path
+        return _get_configuration_path(self.__name, resolve=True)
+
     @property
     def root(self):
         return self.__root
@@ -1455,7 +1613,7 @@ cdef class ConfigurationOption(Provider):
     def override(self, value):
         if isinstance(value, Provider):
             raise Error('Configuration option can only be overridden by a value')
-        return self.__root.set(self._get_self_name(), value)
+        return self.__root.set(self.get_path(), value)
 
     def reset_last_overriding(self):
         raise Error('Configuration option does not support this method')
@@ -1465,9 +1623,25 @@ cdef class ConfigurationOption(Provider):
 
     def reset_cache(self):
         self.__cache = UNDEFINED
+        __invalidate_instances()
         for child in self.__children.values():
             child.reset_cache()
 
+    cdef void __reset_changed_cache(self, dict old_index, dict new_index) except *:
+        if self.__path is None:
+            self.reset_cache()
+            return
+
+        old_value = old_index.get(self.__path, UNDEFINED)
+        new_value = new_index.get(self.__path, UNDEFINED)
+        if _is_configuration_value_changed(old_value, new_value):
+            self.__cache = UNDEFINED
+        elif not isinstance(new_value, Mapping):
+            return
+
+        for child in self.__children.values():
+            (<ConfigurationOption> child).__reset_changed_cache(old_index, new_index)
+
     def update(self, value):
         """Set configuration options.
 
@@ -1695,6 +1869,8 @@ cdef class Configuration(Object):
             value = default.copy()
 
         self.__children = {}
+        self.__index = None
+        self.__index_source = None
 
         super().__init__(value)
 
@@ -1738,7 +1914,7 @@ cdef class Configuration(Object):
     def __getitem__(self, item):
         child = self.__children.get(item)
         if child is None:
-            child = ConfigurationOption(item, self)
+            child = ConfigurationOption((item,), self)
             self.__children[item] = child
         return child
 
@@ -1748,8 +1924,9 @@ cdef class Configuration(Object):
     def get(self, selector, required=False):
         """Return configuration option.
 
-        :param selector: Selector string, e.g. "option1.option2"
-        :type selector: str
+        :param selector: Selector string, e.g. "option1.option2", or tuple path,
+                         e.g. ("option1", "option2")
+        :type selector: str | tuple[str]
 
         :param required: Required flag, raise error if required option is missing
         :type required: bool
@@ -1757,30 +1934,19 @@ cdef class Configuration(Object):
         :return: Option value.
         :rtype: Any
         """
-        value = self.__call__()
-
-        if value is None:
-            if self._is_strict_mode_enabled() or required:
-                raise Error('Undefined configuration option "{0}.{1}"'.format(self.__name, selector))
-            return None
-
-        keys = selector.split('.')
-        while len(keys) > 0:
-            key = keys.pop(0)
-            value = value.get(key, UNDEFINED)
-
-            if value is UNDEFINED:
-                if self._is_strict_mode_enabled() or required:
-                    raise Error('Undefined configuration option "{0}.{1}"'.format(self.__name, selector))
-                return None
-
-        return value
+        if not isinstance(selector, tuple):
+            selector = tuple(selector.split('.'))
+        return self.__get_option_value(selector, required)
 
     def set(self, selector, value):
         """Override configuration option.
 
-        :param selector: Selector string, e.g. "option1.option2"
-        :type selector: str
+        Only dictionaries on the path to the option are copied, the rest of the configuration
+        is shared with the previous overriding.
+
+        :param selector: Selector string, e.g. "option1.option2", or tuple path,
+                         e.g. ("option1", "option2")
+        :type selector: str | tuple[str]
 
         :param value: Overriding value
         :type value: Any
@@ -1788,17 +1954,18 @@ cdef class Configuration(Object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
-        original_value = current_value = deepcopy(self.__call__())
+        if not isinstance(selector, tuple):
+            selector = tuple(selector.split('.'))
+
+        current_value = self.__call__()
+        original_value = current_value = dict(current_value) if isinstance(current_value, Mapping) else {}
 
-        keys = selector.split('.')
-        while len(keys) > 0:
-            key = keys.pop(0)
-            if len(keys) == 0:
-                current_value[key] = value
-                break
-            temp_value = current_value.get(key, {})
+        for key in selector[:-1]:
+            temp_value = current_value.get(key)
+            temp_value = dict(temp_value) if isinstance(temp_value, Mapping) else {}
             current_value[key] = temp_value
             current_value = temp_value
+        current_value[selector[-1]] = value
 
         return self.override(original_value)
 
@@ -1813,8 +1980,9 @@ cdef class Configuration(Object):
         :return: Overriding context.
         :rtype: :py:class:`OverridingContext`
         """
+        old_index = self.__index
         context = super().override(provider)
-        self.reset_cache()
+        self.__reset_changed_cache(old_index)
         return context
 
     def reset_last_overriding(self):
@@ -1825,22 +1993,42 @@ cdef class Configuration(Object):
 
         :rtype: None
         """
+        old_index = self.__index
         super().reset_last_overriding()
-        self.reset_cache()
+        self.__reset_changed_cache(old_index)
 
     def reset_override(self):
         """Reset all overriding providers.
 
         :rtype: None
         """
+        old_index = self.__index
         super().reset_override()
-        self.reset_cache()
+        self.__reset_changed_cache(old_index)
+
+    def compact(self):
+        """Collapse overriding providers into the last one.
+
+        Every overriding keeps the whole configuration value, so previous overriding providers
+        are needed only to get back to them with :py:meth:`reset_last_overriding`. Compaction
+        releases them, and configuration value does not change. After compaction
+        :py:meth:`reset_last_overriding` resets configuration to its default value.
+
+        :rtype: None
+        """
+        __begin_change(self)
+        with self.overriding_lock:
+            if len(self.__overridden) > 1:
+                self.__overridden = (self.__last_overriding,)
 
     def reset_cache(self):
         """Reset children providers cache.
 
         :rtype: None
         """
+        self.__index = None
+        self.__index_source = None
+        __invalidate_instances()
         for child in self.__children.values():
             child.reset_cache()
 
@@ -2016,6 +2204,87 @@ cdef class Configuration(Object):
 
         self.override(value)
 
+    def load(self, sources=(), env=None, required=UNDEFINED, loader=None, max_workers=1):
+        """Load configuration from the multiple sources at once.
+
+        Sources are merged recursively in the given order over existing configuration and
+        configuration is overridden only once.
+
+        :param sources: Paths to the ``.ini``, ``.yml`` and ``.yaml`` files, dictionaries
+                        and pydantic settings instances.
+        :type sources: list
+
+        :param env: Mapping of option selectors to the names of environment variables. Values
+                    of environment variables are set after all sources are merged.
+        :type env: dict[str, str]
+
+        :param required: When required is True, raise an exception if file does not exist,
+                         dictionary is empty or environment variable is undefined.
+        :type required: bool
+
+        :param loader: YAML loader, :py:class:`YamlLoader` is used if not specified.
+        :type loader: ``yaml.Loader``
+
+        :param max_workers: Number of threads that parse files. Files are parsed in the
+                            current thread by default.
+        :type max_workers: int | None
+
+        :return: Overriding context.
+        :rtype: :py:class:`OverridingContext`
+        """
+        cdef bint raise_missing = required is not False \
+            and (self.__strict or required is True)
+
+        configs = []
+        files = []
+        for source in sources:
+            if isinstance(source, Mapping):
+                if raise_missing and not source:
+                    raise ValueError('Can not use empty dictionary')
+                configs.append(source)
+            elif isinstance(source, (str, os.PathLike)):
+                files.append(len(configs))
+                configs.append(source)
+            elif _is_pydantic_settings(source):
+                options = source.dict()
+                if raise_missing and not options:
+                    raise ValueError('Can not use empty dictionary')
+                configs.append(options)
+            else:
+                raise Error('Unable to recognize configuration source {0}'.format(source))
+
+        if max_workers == 1 or len(files) < 2:
+            for position in files:
+                configs[position] = _read_configuration_file(configs[position], raise_missing, loader)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    position: executor.submit(
+                        _read_configuration_file, configs[position], raise_missing, loader,
+                    )
+                    for position in files
+                }
+                for position, future in futures.items():
+                    configs[position] = future.result()
+
+        current_config = self.__call__()
+        config = dict(current_config) if isinstance(current_config, Mapping) else {}
+        owned = {id(config): config}
+
+        for options in configs:
+            if options:
+                _merge_configuration(config, options, owned)
+
+        for selector, name in (env or {}).items():
+            value = os.environ.get(name, UNDEFINED)
+            if value is UNDEFINED:
+                if raise_missing:
+                    raise ValueError('Environment variable "{0}" is undefined'.format(name))
+                value = None
+            _merge_configuration(config, _nest_configuration_value(selector, value), owned)
+
+        return self.override(config)
+
     @property
     def related(self):
         """Return related providers generator."""
@@ -2025,6 +2294,46 @@ cdef class Configuration(Object):
     def _is_strict_mode_enabled(self):
         return self.__strict
 
+    cdef object __get_option_value(self, tuple path, bint required):
+        value = self.__get_index().get(path, UNDEFINED)
+
+        if value is UNDEFINED:
+            # Containers that are not mappings are not indexed, look the path up in them directly
+            value = _find_configuration_value(self.__index_source, path)
+
+        if value is UNDEFINED:
+            if self.__strict or required:
+                raise Error(
+                    'Undefined configuration option "{0}.{1}"'.format(self.__name, '.'.join(path)),
+                )
+            return None
+
+        return value
+
+    cdef void __reset_changed_cache(self, dict old_index) except *:
+        # Options cache values only after the index is built, so nothing is cached when there is
+        # no index. Otherwise only the options with changed values are reset.
+        if old_index is None:
+            self.reset_cache()
+            return
+
+        self.__index = None
+        self.__index_source = None
+        new_index = self.__get_index()
+        for child in self.__children.values():
+            (<ConfigurationOption> child).__reset_changed_cache(old_index, new_index)
+
+    cdef dict __get_index(self):
+        # Flat index of configuration values: every path, including paths of the nested
+        # mappings, is mapped to its value. Index is rebuilt when configuration is overridden
+        # by a provider that returns another value, e.g. by a linked configuration.
+        value = self.__call__()
+        if self.__index is None or self.__index_source is not value:
+            self.__index = {}
+            self.__index_source = value
+            _index_configuration(self.__index, (), value)
+        return self.__index
+
 
 cdef class Factory(Provider):
     r"""Factory provider creates new instance on every call.
@@ -2091,9 +2400,11 @@ cdef class Factory(Provider):
                 self.__class__, self.__class__.provided_type))
 
         self.__instantiator = Callable(provides, *args, **kwargs)
+        self.__batchable = _get_class_attribute(type(self), '_provide') is Factory.__dict__['_provide']
 
         self.__attributes = tuple()
         self.__attributes_len = 0
+        self.__compile_attributes_plan()
 
         super(Factory, self).__init__()
 
@@ -2214,8 +2525,10 @@ cdef class Factory(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__attributes += parse_named_injections(kwargs)
         self.__attributes_len = len(self.__attributes)
+        self.__compile_attributes_plan()
         return self
 
     def set_attributes(self, **kwargs):
@@ -2225,8 +2538,10 @@ cdef class Factory(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__attributes = parse_named_injections(kwargs)
         self.__attributes_len = len(self.__attributes)
+        self.__compile_attributes_plan()
         return self
 
     def clear_attributes(self):
@@ -2234,10 +2549,91 @@ cdef class Factory(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__attributes = tuple()
         self.__attributes_len = len(self.__attributes)
+        self.__compile_attributes_plan()
         return self
 
+    def many(self, n, **kwargs):
+        """Return list of ``n`` new instances.
+
+        Injected singletons, configuration options, objects and resources are provided only once
+        for the whole batch. Singletons that keep instances per thread, context, scope or for the
+        limited time are provided for every instance.
+
+        :param n: Number of instances.
+        :type n: int
+
+        :param kwargs: Context keyword arguments, same for every instance.
+        :type kwargs: dict[str, object]
+
+        :rtype: list
+        """
+        cdef Factory batch
+
+        if n <= 0:
+            return []
+
+        batch = self._create_batch_factory(kwargs.keys())
+        if batch is None:
+            return [self(**kwargs) for _ in range(n)]
+
+        return [__provider_call(batch, (), dict(kwargs)) for _ in range(n)]
+
+    def map(self, kwargs_iterable):
+        """Return generator of new instances, one for each item of ``kwargs_iterable``.
+
+        Injected singletons, configuration options, objects and resources are provided only once
+        for the whole batch. They are provided again if providers are changed or singletons,
+        resources or configuration caches are reset while the generator is iterated.
+
+        :param kwargs_iterable: Iterable of context keyword arguments dictionaries.
+        :type kwargs_iterable: iterable[dict[str, object]]
+
+        :rtype: generator
+        """
+        cdef Factory batch = None
+        cdef bint batch_created = False
+        cdef set batch_names = set(self.kwargs.keys())
+        cdef unsigned long long graph_epoch = 0
+        cdef unsigned long long instances_epoch = 0
+
+        for kwargs in kwargs_iterable:
+            if __has_prefixed_kwargs(kwargs, batch_names):
+                yield self(**kwargs)
+                continue
+
+            # Batch is created on demand, so injections are not provided before the
+            # preceding items with prefixed keyword arguments.
+            if not batch_created \
+                    or graph_epoch != _graph_epoch \
+                    or instances_epoch != _instances_epoch:
+                batch = self._create_batch_factory(())
+                batch_created = True
+                graph_epoch = _graph_epoch
+                instances_epoch = _instances_epoch
+
+            if batch is None:
+                yield self(**kwargs)
+            else:
+                yield __provider_call(batch, (), dict(kwargs))
+
+    async def map_async(self, kwargs_iterable):
+        """Return asynchronous generator of new instances.
+
+        Asynchronous version of :py:meth:`Factory.map`. Awaitable instances are awaited.
+
+        :param kwargs_iterable: Iterable of context keyword arguments dictionaries.
+        :type kwargs_iterable: iterable[dict[str, object]]
+
+        :rtype: async_generator
+        """
+        for instance in self.map(kwargs_iterable):
+            if __is_future_or_coroutine(instance):
+                instance = await instance
+            yield instance
+
     @property
     def related(self):
         """Return related providers generator."""
@@ -2251,6 +2647,51 @@ cdef class Factory(Provider):
         """Return new instance."""
         return __factory_call(self, args, kwargs)
 
+    def _create_batch_factory(self, context_names):
+        """Return copy of the factory with batch injections provided, or None.
+
+        None is returned if factory can not be batched: it is overridden or its calling
+        logic is customized.
+        """
+        cdef Factory batch
+        cdef set excluded
+
+        if self.__last_overriding is not None \
+                or not self.__fast_call \
+                or not self.__batchable:
+            return None
+
+        excluded = {name.split('__', 1)[0] for name in context_names if '__' in name}
+
+        batch = Factory(
+            self.provides,
+            *__provide_batch_injections(self.__instantiator.__args, set()),
+            **dict(__provide_batch_injections(self.__instantiator.__kwargs, excluded)),
+        )
+        batch.set_attributes(**dict(__provide_batch_injections(self.__attributes, set())))
+
+        batch.__async_mode = self.__async_mode
+        if self.__sync_sealed:
+            batch._apply_sync_seal()
+
+        return batch
+
+    def _apply_sync_seal(self):
+        """Seal provider as synchronous."""
+        super()._apply_sync_seal()
+        self.__instantiator._apply_sync_seal()
+
+    def _freeze(self):
+        """Freeze provider."""
+        super()._freeze()
+        self.__instantiator._freeze()
+
+    cdef void __compile_attributes_plan(self):
+        """Compile attribute injections into a call plan."""
+        self.__attributes_plan, self.__attributes_plan_slots = \
+            __compile_named_plan(self.__attributes, self.__attributes_len)
+        self.__attributes_plan_slots_len = len(self.__attributes_plan_slots)
+
 
 cdef class DelegatedFactory(Factory):
     """Factory that is injected "as is".
@@ -2453,6 +2894,8 @@ cdef class BaseSingleton(Provider):
                 self.__class__, self.__class__.provided_type))
 
         self.__instantiator = Factory(provides, *args, **kwargs)
+        self.__scope = None
+        self.__fork_policy = None
 
         super(BaseSingleton, self).__init__()
 
@@ -2478,6 +2921,8 @@ cdef class BaseSingleton(Provider):
                                 *deepcopy(self.args, memo),
                                 **deepcopy(self.kwargs, memo))
         copied.set_attributes(**deepcopy(self.attributes, memo))
+        copied.set_scope(self.scope)
+        copied.set_fork_policy(self.fork_policy)
 
         self._copy_overridings(copied, memo)
 
@@ -2493,6 +2938,48 @@ cdef class BaseSingleton(Provider):
         """Return provided type."""
         return self.__instantiator.provides
 
+    @property
+    def scope(self):
+        """Return name of the scope, if any."""
+        return self.__scope
+
+    @property
+    def fork_policy(self):
+        """Return policy of the provider in the child process after fork."""
+        return self.__fork_policy
+
+    def set_fork_policy(self, policy):
+        """Set policy of the provider in the child process after fork.
+
+        With ``"reset"`` policy the instance is dropped in the child process and is created on
+        the next call. With ``"reinit"`` policy it is created again right after fork. By default
+        the child process uses the instance created in the parent process.
+
+        :param policy: ``"reset"``, ``"reinit"`` or ``None``.
+        :type policy: str | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        _register_fork_policy(self, policy)
+        self.__fork_policy = policy
+        return self
+
+    def set_scope(self, name):
+        """Set name of the scope.
+
+        Instance of the scoped singleton can be created only inside of the active scope with the
+        same name. Instance is reset when the scope exits.
+
+        :param name: Scope name or ``None`` to drop the scope.
+        :type name: str | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        self.__scope = name
+        return self
+
     @property
     def args(self):
         """Return positional argument injections."""
@@ -2612,6 +3099,20 @@ cdef class BaseSingleton(Provider):
         yield from filter(is_provider, self.attributes.values())
         yield from super().related
 
+    def _apply_sync_seal(self):
+        """Seal provider as synchronous."""
+        super()._apply_sync_seal()
+        self.__instantiator._apply_sync_seal()
+
+    def _freeze(self):
+        """Freeze provider."""
+        super()._freeze()
+        self.__instantiator._freeze()
+
+    def _reset_after_fork(self):
+        """Reset provider in the child process after fork."""
+        self.reset()
+
     def _async_init_instance(self, future_result, result):
         try:
             instance = result.result()
@@ -2672,11 +3173,16 @@ cdef class Singleton(BaseSingleton):
         if __is_future_or_coroutine(self.__storage):
             asyncio.ensure_future(self.__storage).cancel()
         self.__storage = None
+        __invalidate_instances()
         return SingletonResetContext(self)
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
+        if self.__scope is not None:
+            return _provide_in_scope(self, None, args, kwargs)
+
         if self.__storage is None:
+
             instance = __factory_call(self.__instantiator, args, kwargs)
 
             if __is_future_or_coroutine(instance):
@@ -2714,14 +3220,29 @@ cdef class DelegatedSingleton(Singleton):
 
 
 cdef class ThreadSafeSingleton(BaseSingleton):
-    """Thread-safe singleton provider."""
+    """Thread-safe singleton provider.
+
+    Every provider has its own storage lock, so slow creation of one singleton does not block
+    creation of the others. Once the instance is created, it is returned without locking.
+    """
 
     storage_lock = threading.RLock()
-    """Storage reentrant lock.
+    """Storage reentrant lock shared by all providers of the class.
+
+    Lock is used only if :py:attr:`per_provider_lock` is ``False``. It is kept for the
+    compatibility with the code that used the shared lock of the previous versions.
 
     :type: :py:class:`threading.RLock`
     """
 
+    per_provider_lock = True
+    """Create storage lock for every provider.
+
+    Set to ``False`` in the subclass to use the shared :py:attr:`storage_lock`.
+
+    :type: bool
+    """
+
     def __init__(self, provides, *args, **kwargs):
         """Initializer.
 
@@ -2729,27 +3250,57 @@ cdef class ThreadSafeSingleton(BaseSingleton):
         :type provides: type
         """
         self.__storage = None
-        self.__storage_lock = self.__class__.storage_lock
+        if self.__class__.per_provider_lock:
+            self.__storage_lock = threading.RLock()
+        else:
+            self.__storage_lock = self.__class__.storage_lock
+        self.__lock_waiters = 0
+        self.__lock_wait_count = 0
+        self.__lock_wait_time = 0.0
         super(ThreadSafeSingleton, self).__init__(provides, *args, **kwargs)
 
+    @property
+    def lock_waiters(self):
+        """Return number of threads that are waiting for the storage lock."""
+        return self.__lock_waiters
+
+    @property
+    def lock_wait_count(self):
+        """Return number of times the storage lock was acquired after waiting."""
+        return self.__lock_wait_count
+
+    @property
+    def lock_wait_time(self):
+        """Return total time in seconds spent waiting for the storage lock."""
+        return self.__lock_wait_time
+
     def reset(self):
         """Reset cached instance, if any.
 
         :rtype: None
         """
-        with self.__storage_lock:
+        self.__acquire_storage_lock()
+        try:
             if __is_future_or_coroutine(self.__storage):
                 asyncio.ensure_future(self.__storage).cancel()
             self.__storage = None
+        finally:
+            self.__storage_lock.release()
+        __invalidate_instances()
         return SingletonResetContext(self)
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
+        if self.__scope is not None:
+            return _provide_in_scope(self, None, args, kwargs)
+
         instance = self.__storage
 
         if instance is None:
-            with self.__storage_lock:
+            self.__acquire_storage_lock()
+            try:
                 if self.__storage is None:
+
                     instance = __factory_call(self.__instantiator, args, kwargs)
 
                     if __is_future_or_coroutine(instance):
@@ -2760,9 +3311,37 @@ cdef class ThreadSafeSingleton(BaseSingleton):
                         return future_result
 
                     self.__storage = instance
+                else:
+                    instance = self.__storage
+            finally:
+                self.__storage_lock.release()
 
         return instance
 
+    def _reset_after_fork(self):
+        """Reset provider in the child process after fork.
+
+        Lock could be held by a thread of the parent process, so it is replaced.
+        """
+        if self.__class__.per_provider_lock:
+            self.__storage_lock = threading.RLock()
+        self.__lock_waiters = 0
+        self.__storage = None
+        __invalidate_instances()
+
+    cdef void __acquire_storage_lock(self) except *:
+        if self.__storage_lock.acquire(False):
+            return
+
+        self.__lock_waiters += 1
+        started_at = time.monotonic()
+        try:
+            self.__storage_lock.acquire()
+        finally:
+            self.__lock_waiters -= 1
+        self.__lock_wait_count += 1
+        self.__lock_wait_time += time.monotonic() - started_at
+
 
 cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
     """Delegated thread-safe singleton is injected "as is".
@@ -2789,6 +3368,9 @@ cdef class DelegatedThreadSafeSingleton(ThreadSafeSingleton):
 cdef class ThreadLocalSingleton(BaseSingleton):
     """Thread-local singleton provides single objects in scope of thread.
 
+    Instance of the thread is released when the thread exits. Use :py:meth:`reset_all_threads` to
+    reset instances of all threads and :py:attr:`size` to get the number of the instances.
+
     .. py:attribute:: provided_type
 
         If provided type is defined, provider checks that providing class is
@@ -2812,143 +3394,1595 @@ cdef class ThreadLocalSingleton(BaseSingleton):
         :type provides: type
         """
         self.__storage = threading.local()
+        self.__holders = weakref.WeakSet()
+        self.__holders_lock = threading.Lock()
         super(ThreadLocalSingleton, self).__init__(provides, *args, **kwargs)
 
+    @property
+    def size(self):
+        """Return number of threads that have an instance."""
+        return sum(1 for holder in self.__get_holders() if holder.instance is not UNDEFINED)
+
     def reset(self):
-        """Reset cached instance, if any.
+        """Reset cached instance of current thread, if any.
 
         :rtype: None
         """
         try:
-            instance = self.__storage.instance
+            holder = self.__storage.holder
         except AttributeError:
             return SingletonResetContext(self)
 
-        if __is_future_or_coroutine(instance):
-            asyncio.ensure_future(instance).cancel()
+        if __is_future_or_coroutine(holder.instance):
+            asyncio.ensure_future(holder.instance).cancel()
+
+        holder.instance = UNDEFINED
+
+        return SingletonResetContext(self)
+
+    def reset_all_threads(self):
+        """Reset cached instances of all threads.
 
-        del self.__storage.instance
+        Instance of current thread is reset as :py:meth:`reset` does. Instances of other threads
+        are dropped, the threads create new instances on the next call.
 
+        :rtype: None
+        """
+        self.reset()
+        for holder in self.__get_holders():
+            holder.instance = UNDEFINED
         return SingletonResetContext(self)
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
         cdef object instance
 
+        if self.__scope is not None:
+            return _provide_in_scope(self, None, args, kwargs)
+
         try:
-            instance = self.__storage.instance
+            holder = self.__storage.holder
         except AttributeError:
-            instance = __factory_call(self.__instantiator, args, kwargs)
-
-            if __is_future_or_coroutine(instance):
-                future_result = asyncio.Future()
-                instance = asyncio.ensure_future(instance)
-                instance.add_done_callback(functools.partial(self._async_init_instance, future_result))
-                self.__storage.instance = future_result
-                return future_result
+            holder = _ThreadLocalHolder()
+            self.__storage.holder = holder
+            with self.__holders_lock:
+                self.__holders.add(holder)
 
-            self.__storage.instance = instance
-        finally:
+        instance = holder.instance
+        if instance is not UNDEFINED:
             return instance
 
-    def _async_init_instance(self, future_result, result):
+
+        instance = __factory_call(self.__instantiator, args, kwargs)
+
+        if __is_future_or_coroutine(instance):
+            future_result = asyncio.Future()
+            instance = asyncio.ensure_future(instance)
+            instance.add_done_callback(
+                functools.partial(self._async_init_thread_instance, holder, future_result),
+            )
+            holder.instance = future_result
+            return future_result
+
+        holder.instance = instance
+        return instance
+
+    def _reset_after_fork(self):
+        """Reset provider in the child process after fork."""
+        self.__holders_lock = threading.Lock()
+        self.reset_all_threads()
+
+    def _async_init_thread_instance(self, holder, future_result, result):
         try:
             instance = result.result()
         except Exception as exception:
-            del self.__storage.instance
+            holder.instance = UNDEFINED
             future_result.set_exception(exception)
         else:
-            self.__storage.instance = instance
+            holder.instance = instance
             future_result.set_result(instance)
 
+    cdef list __get_holders(self):
+        with self.__holders_lock:
+            return list(self.__holders)
 
-cdef class DelegatedThreadLocalSingleton(ThreadLocalSingleton):
+
+class _ThreadLocalHolder(object):
+    """Holder of the thread-local singleton instance."""
+
+    __slots__ = ('instance', '__weakref__')
+
+    def __init__(self):
+        self.instance = UNDEFINED
+
+
+cdef class DelegatedThreadLocalSingleton(ThreadLocalSingleton):
     """Delegated thread-local singleton is injected "as is".
 
-    .. py:attribute:: provided_type
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    __IS_DELEGATED__ = True
+
+
+if contextvars is not None:
+    # Instances of all context-local singletons are stored in a single context variable, context
+    # variables are never released from the contexts that have seen them.
+    _context_local_instances = contextvars.ContextVar('context_local_instances', default=None)
+else:
+    _context_local_instances = None
+
+cdef unsigned long long _context_local_keys = 0
+
+
+cdef list _get_context_local_holder(unsigned long long key):
+    instances = _context_local_instances.get()
+    if instances is None:
+        return None
+    return (<dict> instances).get(key)
+
+
+cdef void _set_context_local_holder(unsigned long long key, list holder) except *:
+    # Dictionary is shared with the copies of the context, so it is copied before the change
+    instances = _context_local_instances.get()
+    instances = {} if instances is None else dict(instances)
+    if holder is None:
+        instances.pop(key, None)
+    else:
+        instances[key] = holder
+    _context_local_instances.set(instances)
+
+
+cdef class ContextLocalSingleton(BaseSingleton):
+    """Context-local singleton provides single objects in scope of context.
+
+    Instances are stored in :py:class:`contextvars.ContextVar`. In asyncio every task runs in
+    its own context, so every task gets its own instance. Tasks inherit instances that are
+    created before they are started.
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        global _context_local_keys
+
+        if contextvars is None:
+            raise Error('Context-local singleton requires Python 3.7 or newer')
+        # Keys are not reused, so a new provider never gets an instance of the released one
+        _context_local_keys += 1
+        self.__context_key = _context_local_keys
+        super(ContextLocalSingleton, self).__init__(provides, *args, **kwargs)
+
+    def reset(self):
+        """Reset cached instance in current context, if any.
+
+        :rtype: None
+        """
+        holder = _get_context_local_holder(self.__context_key)
+        if holder is None:
+            return SingletonResetContext(self)
+
+        if __is_future_or_coroutine(holder[0]):
+            asyncio.ensure_future(holder[0]).cancel()
+
+        _set_context_local_holder(self.__context_key, None)
+
+        return SingletonResetContext(self)
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return single instance."""
+        cdef list holder
+
+        if self.__scope is not None:
+            return _provide_in_scope(self, None, args, kwargs)
+
+        holder = _get_context_local_holder(self.__context_key)
+
+        if holder is not None and holder[0] is not UNDEFINED:
+            return holder[0]
+
+
+        instance = __factory_call(self.__instantiator, args, kwargs)
+
+        if __is_future_or_coroutine(instance):
+            future_result = asyncio.Future()
+            holder = [future_result]
+            _set_context_local_holder(self.__context_key, holder)
+            instance = asyncio.ensure_future(instance)
+            instance.add_done_callback(
+                functools.partial(self._async_init_context_instance, holder, future_result),
+            )
+            return future_result
+
+        _set_context_local_holder(self.__context_key, [instance])
+        return instance
+
+    def _async_init_context_instance(self, holder, future_result, result):
+        # Done callbacks run in a copy of the context, so the instance is stored in the holder
+        # that the context refers to instead of setting the context variable.
+        try:
+            instance = result.result()
+        except Exception as exception:
+            holder[0] = UNDEFINED
+            future_result.set_exception(exception)
+        else:
+            holder[0] = instance
+            future_result.set_result(instance)
+
+
+cdef class DelegatedContextLocalSingleton(ContextLocalSingleton):
+    """Delegated context-local singleton is injected "as is".
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    __IS_DELEGATED__ = True
+
+
+cdef class WeakSingleton(BaseSingleton):
+    """Weak singleton provider stores weak reference to the instance.
+
+    Instance is shared while anyone holds a reference to it. When the instance is garbage
+    collected, the next call creates a new instance. Provided type must support weak
+    references.
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        self.__storage = None
+        super(WeakSingleton, self).__init__(provides, *args, **kwargs)
+
+    @property
+    def is_alive(self):
+        """Return ``True`` if instance is created and is not collected yet."""
+        if self.__storage is None:
+            return False
+        if type(self.__storage) is weakref.ref:
+            return self.__storage() is not None
+        return True
+
+    def reset(self):
+        """Reset cached instance, if any.
+
+        :rtype: None
+        """
+        if __is_future_or_coroutine(self.__storage):
+            asyncio.ensure_future(self.__storage).cancel()
+        self.__storage = None
+        return SingletonResetContext(self)
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return single instance."""
+        if self.__scope is not None:
+            return _provide_in_scope(self, None, args, kwargs)
+
+        storage = self.__storage
+
+        if storage is not None:
+            if type(storage) is not weakref.ref:
+                return storage
+            instance = storage()
+            if instance is not None:
+                return instance
+
+
+        instance = __factory_call(self.__instantiator, args, kwargs)
+
+        if __is_future_or_coroutine(instance):
+            future_result = asyncio.Future()
+            instance = asyncio.ensure_future(instance)
+            instance.add_done_callback(functools.partial(self._async_init_instance, future_result))
+            self.__storage = future_result
+            return future_result
+
+        self.__storage = self.__make_ref(instance)
+        return instance
+
+    def _async_init_instance(self, future_result, result):
+        try:
+            instance = result.result()
+            storage = self.__make_ref(instance)
+        except Exception as exception:
+            self.__storage = None
+            future_result.set_exception(exception)
+        else:
+            self.__storage = storage
+            future_result.set_result(instance)
+
+    cdef object __make_ref(self, object instance):
+        try:
+            return weakref.ref(instance)
+        except TypeError:
+            raise Error(
+                '{0} can not provide {1} instances, they do not support weak references'.format(
+                    self.__class__.__name__,
+                    type(instance),
+                ),
+            )
+
+
+cdef class DelegatedWeakSingleton(WeakSingleton):
+    """Delegated weak singleton is injected "as is".
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    __IS_DELEGATED__ = True
+
+
+cdef class ExpiringSingleton(BaseSingleton):
+    """Expiring singleton provider.
+
+    Instance expires after the time to live set by :py:meth:`set_ttl`. Next call after the
+    expiration creates a new instance.
+
+    If background refresh is enabled, expired instance is served until the new instance is
+    created. The new instance is created in a background thread or, if the provider is in async
+    mode, in an asyncio task. In async mode the provided callable is called by the caller and only
+    the awaitable it returns is awaited in the task, so synchronous callable blocks the caller. If
+    refresh fails, expired instance is served and the refresh is retried on the next call.
+    Refresh started before the instance is reset or replaced is discarded.
+
+    .. code-block:: python
+
+        flags = ExpiringSingleton(load_flags).set_ttl(60.0).set_background_refresh()
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        self.__storage = None
+        self.__storage_lock = threading.RLock()
+        self.__ttl = None
+        self.__expires_at = 0.0
+        self.__background_refresh = False
+        self.__refreshing = False
+        self.__refresh_error = None
+        self.__generation = 0
+        super(ExpiringSingleton, self).__init__(provides, *args, **kwargs)
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        copied = super(ExpiringSingleton, self).__deepcopy__(memo)
+        copied.set_ttl(self.__ttl)
+        copied.set_background_refresh(self.__background_refresh)
+
+        return copied
+
+    @property
+    def ttl(self):
+        """Return instance time to live in seconds."""
+        return self.__ttl
+
+    def set_ttl(self, ttl):
+        """Set instance time to live in seconds.
+
+        :param ttl: Time to live or ``None`` if the instance never expires.
+        :type ttl: float | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        if ttl is not None and ttl <= 0:
+            raise Error('Time to live must be a positive number, got {0}'.format(ttl))
+        self.__ttl = ttl
+        return self
+
+    @property
+    def background_refresh(self):
+        """Return ``True`` if expired instance is refreshed in background."""
+        return self.__background_refresh
+
+    def set_background_refresh(self, enabled=True):
+        """Enable or disable background refresh of expired instance.
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        self.__background_refresh = enabled
+        return self
+
+    @property
+    def refresh_error(self):
+        """Return error of the last background refresh, if any."""
+        return self.__refresh_error
+
+    def is_expired(self):
+        """Check if instance is expired."""
+        return self.__storage is not None and self.__is_expired()
+
+    def reset(self):
+        """Reset cached instance, if any.
+
+        :rtype: None
+        """
+        with self.__storage_lock:
+            if __is_future_or_coroutine(self.__storage):
+                asyncio.ensure_future(self.__storage).cancel()
+            self.__storage = None
+            self.__expires_at = 0.0
+            # Running refresh belongs to the previous instance and is discarded
+            self.__generation += 1
+            self.__refreshing = False
+        return SingletonResetContext(self)
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return single instance."""
+        if self.__scope is not None:
+            return _provide_in_scope(self, None, args, kwargs)
+
+        instance = self.__storage
+
+        if instance is not None:
+            if not self.__is_expired():
+                return instance
+            if self.__background_refresh and not __is_future_or_coroutine(instance):
+                self.__start_refresh(args, kwargs)
+                return instance
+
+        with self.__storage_lock:
+            instance = self.__storage
+            if instance is not None and not self.__is_expired():
+                return instance
+
+
+            instance = __factory_call(self.__instantiator, args, kwargs)
+
+            if __is_future_or_coroutine(instance):
+                future_result = asyncio.Future()
+                instance = asyncio.ensure_future(instance)
+                instance.add_done_callback(functools.partial(self._async_init_instance, future_result))
+                self.__storage = future_result
+                # Pending instance does not expire, so concurrent callers await the same future
+                self.__expires_at = float('inf')
+                return future_result
+
+            self.__set_instance(instance)
+            return instance
+
+    def _async_init_instance(self, future_result, result):
+        try:
+            instance = result.result()
+        except Exception as exception:
+            self.__storage = None
+            self.__expires_at = 0.0
+            future_result.set_exception(exception)
+        else:
+            self.__set_instance(instance)
+            future_result.set_result(instance)
+
+    def _reset_after_fork(self):
+        """Reset provider in the child process after fork.
+
+        Lock could be held by a thread of the parent process, so it is replaced.
+        """
+        self.__storage_lock = threading.RLock()
+        self.__refreshing = False
+        self.reset()
+
+    def _refresh_instance(self, generation, args, kwargs):
+        try:
+            instance = __factory_call(self.__instantiator, args, kwargs)
+        except Exception as exception:
+            self.__finish_refresh(generation, UNDEFINED, exception)
+        else:
+            self.__finish_refresh(generation, instance, None)
+
+    def _async_refresh_instance(self, generation, result):
+        if result.cancelled():
+            self.__finish_refresh(generation, UNDEFINED, None)
+            return
+
+        try:
+            instance = result.result()
+        except Exception as exception:
+            self.__finish_refresh(generation, UNDEFINED, exception)
+        else:
+            self.__finish_refresh(generation, instance, None)
+
+    cdef inline bint __is_expired(self):
+        return self.__ttl is not None and time.monotonic() >= self.__expires_at
+
+    cdef void __set_instance(self, object instance):
+        # Every new instance starts a new generation, refresh of the previous one is discarded
+        self.__generation += 1
+        self.__refreshing = False
+        self.__storage = instance
+        if self.__ttl is not None:
+            self.__expires_at = time.monotonic() + self.__ttl
+
+    cdef void __start_refresh(self, tuple args, dict kwargs) except *:
+        cdef unsigned long long generation
+
+        with self.__storage_lock:
+            if self.__refreshing:
+                return
+            self.__refreshing = True
+            generation = self.__generation
+
+        if not self.is_async_mode_enabled():
+            thread = threading.Thread(target=self._refresh_instance, args=(generation, args, kwargs))
+            thread.daemon = True
+            thread.start()
+            return
+
+        try:
+            instance = __factory_call(self.__instantiator, args, kwargs)
+            if not __is_future_or_coroutine(instance):
+                self.__finish_refresh(generation, instance, None)
+                return
+            instance = asyncio.ensure_future(instance)
+        except Exception as exception:
+            self.__finish_refresh(generation, UNDEFINED, exception)
+            return
+
+        instance.add_done_callback(functools.partial(self._async_refresh_instance, generation))
+
+    cdef void __finish_refresh(self, unsigned long long generation, object instance, object error) except *:
+        with self.__storage_lock:
+            if generation != self.__generation:
+                return
+            self.__refreshing = False
+            self.__refresh_error = error
+            if instance is not UNDEFINED and self.__storage is not None:
+                self.__set_instance(instance)
+
+
+cdef class DelegatedExpiringSingleton(ExpiringSingleton):
+    """Delegated expiring singleton is injected "as is".
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    __IS_DELEGATED__ = True
+
+
+cdef class Multiton(BaseSingleton):
+    """Multiton provider creates single instance per key.
+
+    Key is computed from the call arguments. Use :py:meth:`set_key` to compute the key with a
+    function. Calls with the same key return the same instance, call arguments are passed to the
+    provided callable when the instance for the key is created.
+
+    Number of the cached instances can be limited with :py:meth:`set_max_size`. When the limit is
+    exceeded, least recently used instance is evicted and passed to the eviction callback.
+
+    .. code-block:: python
+
+        client = Multiton(Client).set_max_size(100).set_eviction_callback(Client.close)
+
+        assert client(tenant='a') is client(tenant='a')
+        assert client(tenant='a') is not client(tenant='b')
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        self.__instances = {}
+        self.__max_size = None
+        self.__key = None
+        self.__eviction_callback = None
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        super(Multiton, self).__init__(provides, *args, **kwargs)
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        copied = super(Multiton, self).__deepcopy__(memo)
+        copied.set_max_size(self.__max_size)
+        copied.set_key(self.__key)
+        copied.set_eviction_callback(self.__eviction_callback)
+
+        return copied
+
+    @property
+    def max_size(self):
+        """Return maximum number of cached instances."""
+        return self.__max_size
+
+    def set_max_size(self, max_size):
+        """Set maximum number of cached instances.
+
+        :param max_size: Maximum number of instances or ``None`` for no limit.
+        :type max_size: int | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        if max_size is not None and max_size < 1:
+            raise Error('Maximum size must be a positive number, got {0}'.format(max_size))
+        self.__max_size = max_size
+        self.__evict_overflow()
+        return self
+
+    @property
+    def key(self):
+        """Return key function."""
+        return self.__key
+
+    def set_key(self, key):
+        """Set key function.
+
+        Key function is called with the call arguments and returns hashable key of the instance.
+
+        :param key: Key function or ``None`` to use the call arguments as a key.
+        :type key: callable | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        self.__key = key
+        return self
+
+    @property
+    def eviction_callback(self):
+        """Return eviction callback."""
+        return self.__eviction_callback
+
+    def set_eviction_callback(self, callback):
+        """Set eviction callback.
+
+        Callback is called with the instance evicted because of the size limit or with
+        :py:meth:`evict`.
+
+        :param callback: Eviction callback.
+        :type callback: callable | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        self.__eviction_callback = callback
+        return self
+
+    def set_fork_policy(self, policy):
+        """Set policy of the provider in the child process after fork.
+
+        With ``"reset"`` policy the instances are dropped in the child process. Instances can not
+        be created again right after fork without the call arguments, so ``"reinit"`` policy is
+        not supported.
+
+        :param policy: ``"reset"`` or ``None``.
+        :type policy: str | None
+
+        :return: Reference ``self``
+        """
+        if policy == FORK_POLICY_REINIT:
+            raise Error('{0} does not support "{1}" fork policy'.format(self, policy))
+        return super(Multiton, self).set_fork_policy(policy)
+
+    @property
+    def size(self):
+        """Return number of cached instances."""
+        return len(self.__instances)
+
+    @property
+    def hits(self):
+        """Return number of calls that returned cached instance."""
+        return self.__hits
+
+    @property
+    def misses(self):
+        """Return number of calls that created an instance."""
+        return self.__misses
+
+    @property
+    def evictions(self):
+        """Return number of evicted instances."""
+        return self.__evictions
+
+    def evict(self, *args, **kwargs):
+        """Evict instance for the key of the call arguments, if any.
+
+        :rtype: None
+        """
+        key = self.__make_key(args, kwargs)
+        try:
+            if key not in self.__instances:
+                return
+        except TypeError:
+            raise _unhashable_key_error(self, key)
+        instance = self.__instances.pop(key)
+        self.__evictions += 1
+        self.__evicted(instance)
+
+    def reset(self):
+        """Reset all cached instances.
+
+        Eviction callback is not called.
+
+        :rtype: None
+        """
+        instances, self.__instances = self.__instances, {}
+        for instance in instances.values():
+            if __is_future_or_coroutine(instance):
+                asyncio.ensure_future(instance).cancel()
+        return SingletonResetContext(self)
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return instance for the key of the call arguments."""
+        key = self.__make_key(args, kwargs)
+
+        if self.__scope is not None:
+            return _provide_in_scope(self, key, args, kwargs)
+
+        instance = self.__get_cached(key)
+        if instance is not UNDEFINED:
+            return instance
+
+        return self.__store(key, self.__create(key, args, kwargs))
+
+    def _async_init_keyed_instance(self, key, future_result, result):
+        try:
+            instance = result.result()
+        except Exception as exception:
+            if self.__instances.get(key) is future_result:
+                del self.__instances[key]
+            future_result.set_exception(exception)
+        else:
+            if self.__instances.get(key) is future_result:
+                self.__instances[key] = instance
+            future_result.set_result(instance)
+
+    cdef object __make_key(self, tuple args, dict kwargs):
+        if self.__key is not None:
+            return self.__key(*args, **kwargs)
+        if kwargs:
+            try:
+                return args, frozenset(kwargs.items())
+            except TypeError:
+                raise _unhashable_key_error(self, (args, kwargs))
+        return args
+
+    cdef object __get_cached(self, object key):
+        cdef dict instances = self.__instances
+
+        try:
+            if self.__max_size is None:
+                instance = instances[key]
+            else:
+                instance = instances.pop(key)
+                instances[key] = instance
+        except KeyError:
+            return UNDEFINED
+        except TypeError:
+            raise _unhashable_key_error(self, key)
+
+        self.__hits += 1
+        return instance
+
+    cdef object __create(self, object key, tuple args, dict kwargs):
+        self.__misses += 1
+
+        instance = __factory_call(self.__instantiator, args, kwargs)
+
+        if __is_future_or_coroutine(instance):
+            future_result = asyncio.Future()
+            instance = asyncio.ensure_future(instance)
+            instance.add_done_callback(
+                functools.partial(self._async_init_keyed_instance, key, future_result),
+            )
+            instance = future_result
+
+        return instance
+
+    cdef object __store(self, object key, object instance):
+        self.__instances[key] = instance
+        self.__evict_overflow()
+        return instance
+
+    cdef void __evict_overflow(self) except *:
+        if self.__max_size is None:
+            return
+
+        while len(self.__instances) > self.__max_size:
+            instance = self.__instances.pop(next(iter(self.__instances)))
+            self.__evictions += 1
+            self.__evicted(instance)
+
+    cdef void __evicted(self, object instance) except *:
+        if __is_future_or_coroutine(instance):
+            if not instance.done():
+                instance.cancel()
+                return
+            if instance.cancelled() or instance.exception() is not None:
+                return
+            instance = instance.result()
+
+        if self.__eviction_callback is not None:
+            self.__eviction_callback(instance)
+
+
+cdef class ThreadSafeMultiton(Multiton):
+    """Thread-safe multiton provider.
+
+    Instances are created under the lock of their key, so every key gets one instance and
+    creation of the instance for one key does not block callers of the other keys.
+
+    .. py:attribute:: provided_type
+
+        If provided type is defined, provider checks that providing class is
+        its subclass.
+
+        :type: type | None
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        self.__lock = threading.RLock()
+        self.__key_locks = {}
+        super(ThreadSafeMultiton, self).__init__(provides, *args, **kwargs)
+
+    def evict(self, *args, **kwargs):
+        """Evict instance for the key of the call arguments, if any.
+
+        :rtype: None
+        """
+        with self.__lock:
+            super(ThreadSafeMultiton, self).evict(*args, **kwargs)
+
+    def reset(self):
+        """Reset all cached instances.
+
+        Eviction callback is not called.
+
+        :rtype: None
+        """
+        with self.__lock:
+            return super(ThreadSafeMultiton, self).reset()
+
+    def _reset_after_fork(self):
+        """Reset provider in the child process after fork.
+
+        Lock could be held by a thread of the parent process, so it is replaced.
+        """
+        self.__lock = threading.RLock()
+        self.__key_locks = {}
+        self.reset()
+
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return instance for the key of the call arguments."""
+        cdef list key_lock
+
+        key = self.__make_key(args, kwargs)
+
+        if self.__scope is not None:
+            return _provide_in_scope(self, key, args, kwargs)
+
+        with self.__lock:
+            instance = self.__get_cached(key)
+            if instance is not UNDEFINED:
+                return instance
+
+            # Key lock and the number of its users
+            key_lock = self.__key_locks.get(key)
+            if key_lock is None:
+                key_lock = self.__key_locks[key] = [threading.RLock(), 0]
+            key_lock[1] += 1
+
+        try:
+            with key_lock[0]:
+                with self.__lock:
+                    instance = self.__get_cached(key)
+                    if instance is not UNDEFINED:
+                        return instance
+
+                instance = self.__create(key, args, kwargs)
+
+                with self.__lock:
+                    return self.__store(key, instance)
+        finally:
+            with self.__lock:
+                key_lock[1] -= 1
+                if key_lock[1] == 0 and self.__key_locks.get(key) is key_lock:
+                    del self.__key_locks[key]
+
+
+cdef class AbstractSingleton(BaseSingleton):
+    """Abstract singleton provider.
+
+    :py:class:`AbstractSingleton` is a :py:class:`Singleton` provider that must
+    be explicitly overridden before calling.
+
+    Overriding of :py:class:`AbstractSingleton` is possible only by another
+    :py:class:`BaseSingleton` provider.
+    """
+
+    def __call__(self, *args, **kwargs):
+        """Return provided object.
+
+        Callable interface implementation.
+        """
+        if self.__last_overriding is None:
+            raise Error('{0} must be overridden before calling'.format(self))
+        return super().__call__(*args, **kwargs)
+
+    def override(self, provider):
+        """Override provider with another provider.
+
+        :param provider: Overriding provider.
+        :type provider: :py:class:`Provider`
+
+        :raise: :py:exc:`dependency_injector.errors.Error`
+
+        :return: Overriding context.
+        :rtype: :py:class:`OverridingContext`
+        """
+        if not isinstance(provider, BaseSingleton):
+            raise Error('{0} must be overridden only by '
+                        '{1} providers'.format(self, BaseSingleton))
+        return super(AbstractSingleton, self).override(provider)
+
+    def reset(self):
+        """Reset cached instance, if any.
+
+        :rtype: None
+        """
+        if self.__last_overriding is None:
+            raise Error('{0} must be overridden before calling'.format(self))
+        return self.__last_overriding.reset()
+
+
+cdef class SingletonDelegate(Delegate):
+    """Singleton delegate injects delegating singleton "as is".
+
+    .. py:attribute:: provides
+
+        Value that have to be provided.
+
+        :type: object
+    """
+
+    def __init__(self, singleton):
+        """Initializer.
+
+        :param singleton: Value that have to be provided.
+        :type singleton: py:class:`BaseSingleton`
+        """
+        if isinstance(singleton, BaseSingleton) is False:
+            raise Error('{0} can wrap only {1} providers'.format(
+                self.__class__, BaseSingleton))
+        super(SingletonDelegate, self).__init__(singleton)
+
+
+cdef class Pool(Provider):
+    """Pool provider reuses a bounded number of instances.
+
+    :py:class:`Pool` provider creates instances on demand, keeps no more than
+    :py:attr:`max_size` of them and reuses released instances. :py:class:`Pool` uses
+    :py:class:`Factory` for creating instances, so, please follow :py:class:`Factory`
+    documentation for getting familiar with injections syntax.
+
+    Calling or injecting the provider returns :py:class:`PoolLease` context manager. It does
+    not acquire an instance until the context is entered.
+
+    .. code-block:: python
+
+        pool = Pool(Parser).set_max_size(4)
+
+        with pool.lease() as parser:
+            parser.parse(text)
+
+    .. py:attribute:: cls
+       :noindex:
+
+        Class that provides object.
+        Alias for :py:attr:`provides`.
+
+        :type: type
+    """
+
+    default_max_size = 10
+    """Default maximum number of pool instances.
+
+    :type: int
+    """
+
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
+
+        :param provides: Provided type.
+        :type provides: type
+        """
+        self.__instantiator = Factory(provides, *args, **kwargs)
+        self.__max_size = self.__class__.default_max_size
+        self.__reset_hook = None
+        self.__max_idle_time = None
+        self.__idle = []
+        self.__leased = {}
+        super(Pool, self).__init__()
+
+    def __str__(self):
+        """Return string representation of provider.
+
+        :rtype: str
+        """
+        return represent_provider(provider=self,
+                                  provides=self.__instantiator.cls)
+
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
+
+        cls = self.cls
+        if isinstance(cls, Provider):
+            cls = deepcopy(cls, memo)
+
+        copied = self.__class__(cls,
+                                *deepcopy(self.args, memo),
+                                **deepcopy(self.kwargs, memo))
+        copied.set_attributes(**deepcopy(self.attributes, memo))
+        copied.set_max_size(self.__max_size)
+        copied.set_reset_hook(self.__reset_hook)
+        copied.set_max_idle_time(self.__max_idle_time)
+
+        self._copy_overridings(copied, memo)
+
+        return copied
+
+    @property
+    def cls(self):
+        """Return provided type."""
+        return self.provides
+
+    @property
+    def provides(self):
+        """Return provided type."""
+        return self.__instantiator.provides
+
+    @property
+    def args(self):
+        """Return positional argument injections."""
+        return self.__instantiator.args
+
+    def add_args(self, *args):
+        """Add __init__ positional argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.add_args(*args)
+        return self
+
+    def set_args(self, *args):
+        """Set __init__ positional argument injections.
+
+        Existing __init__ positional argument injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.set_args(*args)
+        return self
+
+    def clear_args(self):
+        """Drop __init__ positional argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.clear_args()
+        return self
+
+    @property
+    def kwargs(self):
+        """Return keyword argument injections."""
+        return self.__instantiator.kwargs
+
+    def add_kwargs(self, **kwargs):
+        """Add __init__ keyword argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.add_kwargs(**kwargs)
+        return self
+
+    def set_kwargs(self, **kwargs):
+        """Set __init__ keyword argument injections.
+
+        Existing __init__ keyword argument injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.set_kwargs(**kwargs)
+        return self
+
+    def clear_kwargs(self):
+        """Drop __init__ keyword argument injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.clear_kwargs()
+        return self
+
+    @property
+    def attributes(self):
+        """Return attribute injections."""
+        return self.__instantiator.attributes
+
+    def add_attributes(self, **kwargs):
+        """Add attribute injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.add_attributes(**kwargs)
+        return self
+
+    def set_attributes(self, **kwargs):
+        """Set attribute injections.
+
+        Existing attribute injections are dropped.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.set_attributes(**kwargs)
+        return self
+
+    def clear_attributes(self):
+        """Drop attribute injections.
+
+        :return: Reference ``self``
+        """
+        self.__instantiator.clear_attributes()
+        return self
+
+    @property
+    def max_size(self):
+        """Return maximum number of pool instances."""
+        return self.__max_size
+
+    def set_max_size(self, max_size):
+        """Set maximum number of pool instances.
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        if max_size < 1:
+            raise Error('Pool size should be positive, got {0}'.format(max_size))
+        self.__max_size = max_size
+        return self
+
+    @property
+    def reset_hook(self):
+        """Return hook that is called with every released instance."""
+        return self.__reset_hook
+
+    def set_reset_hook(self, hook):
+        """Set hook that is called with every released instance.
+
+        Hook receives released instance. If hook raises an error, instance is dropped from the pool.
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        self.__reset_hook = hook
+        return self
+
+    @property
+    def max_idle_time(self):
+        """Return number of seconds after which idle instance is evicted."""
+        return self.__max_idle_time
+
+    def set_max_idle_time(self, max_idle_time):
+        """Set number of seconds after which idle instance is evicted.
+
+        If ``None``, idle instances are never evicted.
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        self.__max_idle_time = max_idle_time
+        return self
+
+    @property
+    def size(self):
+        """Return number of instances, both idle and acquired."""
+        return len(self.__idle) + len(self.__leased)
+
+    @property
+    def idle_size(self):
+        """Return number of idle instances."""
+        return len(self.__idle)
+
+    def acquire(self):
+        """Acquire instance from the pool.
+
+        Idle instance is reused if there is any. Otherwise new instance is created. If the pool
+        is overridden, instance is acquired from the overriding pool or provided by the
+        overriding provider.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if all instances are acquired.
+        """
+        overriding = __resolve_overriding(self)
+        if overriding is not None:
+            if isinstance(overriding, Pool):
+                return overriding.acquire()
+            return overriding()
+        return self.__acquire()
+
+    def release(self, instance):
+        """Return acquired instance to the pool.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if instance is not acquired from
+                the pool.
+
+        :rtype: None
+        """
+        if self.__release_overriding(instance):
+            return
+        self.__take_leased(instance)
+        if self.__reset_hook is not None:
+            self.__reset_hook(instance)
+        self.__put_idle(instance)
+
+    def lease(self):
+        """Return context manager that acquires instance and releases it on exit.
+
+        :rtype: :py:class:`PoolLease`
+        """
+        return PoolLease(self)
+
+    def reset(self):
+        """Drop idle instances.
+
+        Acquired instances are returned to the pool when released.
+
+        :rtype: None
+        """
+        self.__idle = []
+
+    @property
+    def related(self):
+        """Return related providers generator."""
+        yield from filter(is_provider, [self.__instantiator.provides])
+        yield from filter(is_provider, self.args)
+        yield from filter(is_provider, self.kwargs.values())
+        yield from filter(is_provider, self.attributes.values())
+        yield from super().related
 
-        If provided type is defined, provider checks that providing class is
-        its subclass.
+    def _apply_sync_seal(self):
+        """Seal provider as synchronous."""
+        super()._apply_sync_seal()
+        self.__instantiator._apply_sync_seal()
 
-        :type: type | None
+    def _freeze(self):
+        """Freeze provider."""
+        super()._freeze()
+        self.__instantiator._freeze()
 
-    .. py:attribute:: cls
-       :noindex:
+    def _async_init_instance(self, future_result, result):
+        self.__leased.pop(id(future_result), None)
+        try:
+            instance = result.result()
+        except Exception as exception:
+            future_result.set_exception(exception)
+        else:
+            self.__leased[id(instance)] = instance
+            future_result.set_result(instance)
 
-        Class that provides object.
-        Alias for :py:attr:`provides`.
+    cpdef object _provide(self, tuple args, dict kwargs):
+        """Return lease of the pool instance."""
+        if args or kwargs:
+            raise Error('Pool provider {0} does not accept context arguments'.format(self))
+        return PoolLease(self)
+
+    cdef object __acquire(self):
+        instance = self.__acquire_idle()
+        if instance is not UNDEFINED:
+            return instance
 
-        :type: type
-    """
+        if len(self.__leased) >= self.__max_size:
+            raise Error('Pool provider {0} is exhausted, all {1} instances are acquired'.format(
+                self,
+                self.__max_size,
+            ))
 
-    __IS_DELEGATED__ = True
+        return self.__create()
 
+    cdef object __acquire_idle(self):
+        cdef int expired = 0
 
-cdef class AbstractSingleton(BaseSingleton):
-    """Abstract singleton provider.
+        if self.__max_idle_time is not None and self.__idle:
+            deadline = time.monotonic() - self.__max_idle_time
+            for _, released_at in self.__idle:
+                if released_at >= deadline:
+                    break
+                expired += 1
+            if expired:
+                del self.__idle[:expired]
 
-    :py:class:`AbstractSingleton` is a :py:class:`Singleton` provider that must
-    be explicitly overridden before calling.
+        if not self.__idle:
+            return UNDEFINED
 
-    Overriding of :py:class:`AbstractSingleton` is possible only by another
-    :py:class:`BaseSingleton` provider.
+        instance, _ = self.__idle.pop()
+        self.__leased[id(instance)] = instance
+        return instance
+
+    cdef object __create(self):
+        instance = __factory_call(self.__instantiator, tuple(), dict())
+
+        if __is_future_or_coroutine(instance):
+            future_result = asyncio.Future()
+            self.__leased[id(future_result)] = future_result
+            instance = asyncio.ensure_future(instance)
+            instance.add_done_callback(functools.partial(self._async_init_instance, future_result))
+            return future_result
+
+        self.__leased[id(instance)] = instance
+        return instance
+
+    cdef bint __release_overriding(self, object instance) except -1:
+        # Instances acquired before the pool is overridden are returned to the pool, other
+        # instances come from the overriding provider.
+        if self.__leased.get(id(instance), UNDEFINED) is instance:
+            return False
+
+        overriding = __resolve_overriding(self)
+        if overriding is None:
+            return False
+
+        if isinstance(overriding, Pool):
+            overriding.release(instance)
+        return True
+
+    cdef void __take_leased(self, object instance) except *:
+        if self.__leased.get(id(instance), UNDEFINED) is not instance:
+            raise Error('Instance {0} is not acquired from pool provider {1}'.format(instance, self))
+        del self.__leased[id(instance)]
+
+    cdef void __put_idle(self, object instance):
+        self.__idle.append((instance, time.monotonic()))
+
+
+cdef class ThreadSafePool(Pool):
+    """Thread-safe pool provider.
+
+    If all instances are acquired, :py:meth:`ThreadSafePool.acquire` waits until any
+    instance is released. Waiting time is limited by :py:attr:`timeout`.
     """
 
-    def __call__(self, *args, **kwargs):
-        """Return provided object.
+    def __init__(self, provides, *args, **kwargs):
+        """Initializer.
 
-        Callable interface implementation.
+        :param provides: Provided type.
+        :type provides: type
         """
-        if self.__last_overriding is None:
-            raise Error('{0} must be overridden before calling'.format(self))
-        return super().__call__(*args, **kwargs)
+        self.__condition = threading.Condition()
+        self.__timeout = None
+        self.__creating = 0
+        super(ThreadSafePool, self).__init__(provides, *args, **kwargs)
 
-    def override(self, provider):
-        """Override provider with another provider.
+    def __deepcopy__(self, memo):
+        """Create and return full copy of provider."""
+        copied = memo.get(id(self))
+        if copied is not None:
+            return copied
 
-        :param provider: Overriding provider.
-        :type provider: :py:class:`Provider`
+        copied = super(ThreadSafePool, self).__deepcopy__(memo)
+        copied.set_timeout(self.__timeout)
 
-        :raise: :py:exc:`dependency_injector.errors.Error`
+        return copied
 
-        :return: Overriding context.
-        :rtype: :py:class:`OverridingContext`
+    @property
+    def timeout(self):
+        """Return number of seconds to wait for released instance."""
+        return self.__timeout
+
+    def set_timeout(self, timeout):
+        """Set number of seconds to wait for released instance.
+
+        If ``None``, acquiring waits until any instance is released.
+
+        :return: Reference ``self``
         """
-        if not isinstance(provider, BaseSingleton):
-            raise Error('{0} must be overridden only by '
-                        '{1} providers'.format(self, BaseSingleton))
-        return super(AbstractSingleton, self).override(provider)
+        __begin_change(self)
+        self.__timeout = timeout
+        return self
 
-    def reset(self):
-        """Reset cached instance, if any.
+    def release(self, instance):
+        """Return acquired instance to the pool.
+
+        :raise: :py:exc:`dependency_injector.errors.Error` if instance is not acquired from
+                the pool.
 
         :rtype: None
         """
-        if self.__last_overriding is None:
-            raise Error('{0} must be overridden before calling'.format(self))
-        return self.__last_overriding.reset()
-
+        if self.__release_overriding(instance):
+            return
 
-cdef class SingletonDelegate(Delegate):
-    """Singleton delegate injects delegating singleton "as is".
+        with self.__condition:
+            self.__take_leased(instance)
 
-    .. py:attribute:: provides
+        try:
+            if self.__reset_hook is not None:
+                self.__reset_hook(instance)
+        except:
+            with self.__condition:
+                self.__condition.notify()
+            raise
 
-        Value that have to be provided.
+        with self.__condition:
+            self.__put_idle(instance)
+            self.__condition.notify()
 
-        :type: object
-    """
+    def reset(self):
+        """Drop idle instances.
 
-    def __init__(self, singleton):
-        """Initializer.
+        Acquired instances are returned to the pool when released.
 
-        :param singleton: Value that have to be provided.
-        :type singleton: py:class:`BaseSingleton`
+        :rtype: None
         """
-        if isinstance(singleton, BaseSingleton) is False:
-            raise Error('{0} can wrap only {1} providers'.format(
-                self.__class__, BaseSingleton))
-        super(SingletonDelegate, self).__init__(singleton)
+        with self.__condition:
+            self.__idle = []
+            self.__condition.notify_all()
+
+    cdef object __acquire(self):
+        with self.__condition:
+            while True:
+                instance = self.__acquire_idle()
+                if instance is not UNDEFINED:
+                    return instance
+
+                if len(self.__leased) + self.__creating < self.__max_size:
+                    self.__creating += 1
+                    break
+
+                if not self.__condition.wait(self.__timeout):
+                    raise Error('Pool provider {0} is exhausted, all {1} instances are acquired'.format(
+                        self,
+                        self.__max_size,
+                    ))
+
+        try:
+            return self.__create()
+        finally:
+            with self.__condition:
+                self.__creating -= 1
+                self.__condition.notify()
 
 
 cdef class List(Provider):
@@ -3024,6 +5058,7 @@ cdef class List(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args += parse_positional_injections(args)
         self.__args_len = len(self.__args)
         return self
@@ -3035,6 +5070,7 @@ cdef class List(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args = parse_positional_injections(args)
         self.__args_len = len(self.__args)
         return self
@@ -3044,6 +5080,7 @@ cdef class List(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args = tuple()
         self.__args_len = len(self.__args)
         return self
@@ -3132,6 +5169,7 @@ cdef class Dict(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         if dict_ is None:
             dict_ = {}
 
@@ -3148,6 +5186,7 @@ cdef class Dict(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         if dict_ is None:
             dict_ = {}
 
@@ -3162,6 +5201,7 @@ cdef class Dict(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs = tuple()
         self.__kwargs_len = len(self.__kwargs)
         return self
@@ -3174,7 +5214,7 @@ cdef class Dict(Provider):
 
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return result of provided callable's call."""
-        return __provide_keyword_args(kwargs, self.__kwargs, self.__kwargs_len)
+        return __provide_keyword_args(kwargs, self.__kwargs, self.__kwargs_len, True)
 
 
 cdef class Resource(Provider):
@@ -3185,6 +5225,7 @@ cdef class Resource(Provider):
         self.__initialized = False
         self.__resource = None
         self.__shutdowner = None
+        self.__fork_policy = None
 
         self.__args = tuple()
         self.__args_len = 0
@@ -3210,6 +5251,7 @@ cdef class Resource(Provider):
             *deepcopy(self.args, memo),
             **deepcopy(self.kwargs, memo),
         )
+        copied.set_fork_policy(self.__fork_policy)
         self._copy_overridings(copied, memo)
 
         return copied
@@ -3244,6 +5286,7 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args += parse_positional_injections(args)
         self.__args_len = len(self.__args)
         return self
@@ -3255,6 +5298,7 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args = parse_positional_injections(args)
         self.__args_len = len(self.__args)
         return self
@@ -3264,6 +5308,7 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__args = tuple()
         self.__args_len = len(self.__args)
         return self
@@ -3286,6 +5331,7 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs += parse_named_injections(kwargs)
         self.__kwargs_len = len(self.__kwargs)
         return self
@@ -3297,6 +5343,7 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs = parse_named_injections(kwargs)
         self.__kwargs_len = len(self.__kwargs)
         return self
@@ -3306,6 +5353,7 @@ cdef class Resource(Provider):
 
         :return: Reference ``self``
         """
+        __begin_change(self)
         self.__kwargs = tuple()
         self.__kwargs_len = len(self.__kwargs)
         return self
@@ -3315,12 +5363,35 @@ cdef class Resource(Provider):
         """Check if resource is initialized."""
         return self.__initialized
 
+    @property
+    def fork_policy(self):
+        """Return policy of the provider in the child process after fork."""
+        return self.__fork_policy
+
+    def set_fork_policy(self, policy):
+        """Set policy of the provider in the child process after fork.
+
+        With ``"reset"`` policy the resource is dropped in the child process and is created on
+        the next call. With ``"reinit"`` policy it is created again right after fork. By default
+        the child process uses the resource created in the parent process.
+
+        :param policy: ``"reset"``, ``"reinit"`` or ``None``.
+        :type policy: str | None
+
+        :return: Reference ``self``
+        """
+        __begin_change(self)
+        _register_fork_policy(self, policy)
+        self.__fork_policy = policy
+        return self
+
     def init(self):
         """Initialize resource."""
         return self.__call__()
 
     def shutdown(self):
         """Shutdown resource."""
+        __invalidate_instances()
         if not self.__initialized:
             if self.is_async_mode_enabled():
                 result = asyncio.Future()
@@ -3346,6 +5417,16 @@ cdef class Resource(Provider):
             result.set_result(None)
             return result
 
+    def _reset_after_fork(self):
+        """Reset provider in the child process after fork.
+
+        Resource belongs to the parent process, so it is dropped without shutdown.
+        """
+        __invalidate_instances()
+        self.__resource = None
+        self.__initialized = False
+        self.__shutdowner = None
+
     @property
     def related(self):
         """Return related providers generator."""
@@ -3493,6 +5574,14 @@ cdef class Resource(Provider):
 
         future_result.set_result(None)
 
+    def _check_sync_seal(self):
+        """Check that provider can be sealed as synchronous."""
+        if self._is_async_resource_subclass(self.__initializer) \
+                or iscoroutinefunction(self.__initializer) \
+                or isasyncgenfunction(self.__initializer):
+            raise Error('Provider {0} can not be sealed as synchronous'.format(self))
+        super()._check_sync_seal()
+
     @staticmethod
     def _is_resource_subclass(instance):
         if  sys.version_info < (3, 5):
@@ -3574,6 +5663,7 @@ cdef class Container(Provider):
 
     def override(self, provider):
         """Override provider with another provider."""
+        __begin_change(self)
         if not hasattr(provider, 'providers'):
             raise Error('Container provider {0} can be overridden only by providers container'.format(self))
 
@@ -3588,6 +5678,7 @@ cdef class Container(Provider):
 
         :rtype: None
         """
+        __begin_change(self)
         super().reset_last_overriding()
         for provider in self.__container.providers.values():
             if not provider.overridden:
@@ -3599,6 +5690,7 @@ cdef class Container(Provider):
 
         :rtype: None
         """
+        __begin_change(self)
         super().reset_override()
         for provider in self.__container.providers.values():
             if not provider.overridden:
@@ -3651,6 +5743,12 @@ cdef class Container(Provider):
     def _copy_parent(self, copied, memo):
         _copy_parent(self, copied, memo)
 
+    def _freeze(self):
+        """Freeze provider and its container."""
+        super()._freeze()
+        if not self.__container.is_frozen():
+            self.__container.freeze()
+
     cpdef object _provide(self, tuple args, dict kwargs):
         """Return single instance."""
         return self.__container
@@ -4142,85 +6240,291 @@ cdef class NamedInjection(Injection):
         """Return injection value."""
         return __get_name(self)
 
-    def get_value(self):
-        """Return injection value."""
-        return __get_value(self)
+    def get_value(self):
+        """Return injection value."""
+        return __get_value(self)
+
+    def get_original_value(self):
+        """Return original value."""
+        return self.__value
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple parse_positional_injections(tuple args):
+    """Parse positional injections."""
+    cdef list injections = list()
+    cdef int args_len = len(args)
+
+    cdef int index
+    cdef object arg
+    cdef PositionalInjection injection
+
+    for index in range(args_len):
+        arg = args[index]
+        injection = PositionalInjection(arg)
+        injections.append(injection)
+
+    return tuple(injections)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef tuple parse_named_injections(dict kwargs):
+    """Parse named injections."""
+    cdef list injections = list()
+
+    cdef object name
+    cdef object arg
+    cdef NamedInjection injection
+
+    for name, arg in kwargs.items():
+        injection = NamedInjection(name, arg)
+        injections.append(injection)
+
+    return tuple(injections)
+
+
+cdef class OverridingContext(object):
+    """Provider overriding context.
+
+    :py:class:`OverridingContext` is used by :py:meth:`Provider.override` for
+    implementing ``with`` contexts. When :py:class:`OverridingContext` is
+    closed, overriding that was created in this context is dropped also.
+
+    .. code-block:: python
+
+        with provider.override(another_provider):
+            assert provider.overridden
+        assert not provider.overridden
+    """
+
+    def __init__(self, Provider overridden, Provider overriding):
+        """Initializer.
+
+        :param overridden: Overridden provider.
+        :type overridden: :py:class:`Provider`
+
+        :param overriding: Overriding provider.
+        :type overriding: :py:class:`Provider`
+        """
+        self.__overridden = overridden
+        self.__overriding = overriding
+        super(OverridingContext, self).__init__()
+
+    def __enter__(self):
+        """Do nothing."""
+        return self.__overriding
+
+    def __exit__(self, *_):
+        """Exit overriding context."""
+        self.__overridden.reset_last_overriding()
+
+
+cdef class PoolLease(object):
+    """Pool lease context manager.
+
+    Acquires instance from the pool on entering the context and releases it on exiting. Lease
+    can be entered again after exiting, but it can not be entered by several users at once.
+
+    .. code-block:: python
+
+        with pool.lease() as instance:
+            ...
+
+        async with pool.lease() as instance:
+            ...
+    """
+
+    def __init__(self, Pool pool):
+        """Initializer.
+
+        :param pool: Pool provider.
+        :type pool: :py:class:`Pool`
+        """
+        self.__pool = pool
+        self.__instance = UNDEFINED
+        super(PoolLease, self).__init__()
+
+    def __enter__(self):
+        """Acquire instance."""
+        self.__instance = self.__pool.acquire()
+        return self.__instance
+
+    def __exit__(self, *_):
+        """Release instance."""
+        instance, self.__instance = self.__instance, UNDEFINED
+        self.__pool.release(instance)
+
+    async def __aenter__(self):
+        """Acquire instance asynchronously."""
+        instance = self.__pool.acquire()
+        if __is_future_or_coroutine(instance):
+            instance = await instance
+        self.__instance = instance
+        return instance
+
+    async def __aexit__(self, *_):
+        """Release instance."""
+        self.__exit__()
+
+
+cdef class Scope(object):
+    """Singletons scope.
+
+    :py:class:`Scope` activates scope with the given name on entering the context. Singletons that
+    have the same scope name store their instances in the active scope. When the scope exits, its
+    instances are dropped, so the cost of the exit does not depend on the size of the providers
+    graph.
+
+    .. code-block:: python
+
+        service = providers.Singleton(Service).set_scope('request')
+
+        with Scope('request'):
+            assert service() is service()
+
+    Active scopes are stored in a context variable, so every asyncio task or thread can use its
+    own scope with its own instances. Use ``async with`` in coroutines.
+    """
+
+    def __init__(self, name):
+        """Initializer.
+
+        :param name: Scope name.
+        :type name: str
+        """
+        self.__name = name
+        self.__providers = []
+        self.__instances = {}
+        self.__lock = threading.RLock()
+        self.__previous = UNDEFINED
+        super(Scope, self).__init__()
+
+    def __repr__(self):
+        """Return string representation of scope.
+
+        :rtype: str
+        """
+        return '<{0}.{1}({2}) at {3}>'.format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            repr(self.__name),
+            hex(id(self)),
+        )
+
+    @property
+    def name(self):
+        """Return scope name."""
+        return self.__name
+
+    @property
+    def providers(self):
+        """Return tuple of singletons that have instances in the scope."""
+        return tuple(self.__providers)
 
-    def get_original_value(self):
-        """Return original value."""
-        return self.__value
+    @property
+    def is_active(self):
+        """Return ``True`` if scope is active."""
+        return self.__previous is not UNDEFINED
 
+    def enter(self):
+        """Activate scope.
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cpdef tuple parse_positional_injections(tuple args):
-    """Parse positional injections."""
-    cdef list injections = list()
-    cdef int args_len = len(args)
+        :return: Reference ``self``
+        """
+        if self.__previous is not UNDEFINED:
+            raise Error('Scope {0} is already active'.format(repr(self.__name)))
 
-    cdef int index
-    cdef object arg
-    cdef PositionalInjection injection
+        active_scopes = _get_active_scopes()
+        self.__previous = active_scopes
 
-    for index in range(args_len):
-        arg = args[index]
-        injection = PositionalInjection(arg)
-        injections.append(injection)
+        active_scopes = dict(active_scopes) if active_scopes else {}
+        active_scopes[self.__name] = self
+        _set_active_scopes(active_scopes)
+        return self
 
-    return tuple(injections)
+    def exit(self):
+        """Drop instances of the scope and deactivate scope.
 
+        :rtype: None
+        """
+        if self.__previous is UNDEFINED:
+            raise Error('Scope {0} is not active'.format(repr(self.__name)))
 
-@cython.boundscheck(False)
-@cython.wraparound(False)
-cpdef tuple parse_named_injections(dict kwargs):
-    """Parse named injections."""
-    cdef list injections = list()
+        previous, self.__previous = self.__previous, UNDEFINED
+        _set_active_scopes(previous)
+        self.reset()
 
-    cdef object name
-    cdef object arg
-    cdef NamedInjection injection
+    def reset(self):
+        """Drop instances of the scope.
 
-    for name, arg in kwargs.items():
-        injection = NamedInjection(name, arg)
-        injections.append(injection)
+        :rtype: None
+        """
+        with self.__lock:
+            instances, self.__instances = self.__instances, {}
+            self.__providers = []
 
-    return tuple(injections)
+        for instance in reversed(list(instances.values())):
+            if __is_future_or_coroutine(instance):
+                asyncio.ensure_future(instance).cancel()
 
+    def __enter__(self):
+        """Activate scope."""
+        return self.enter()
 
-cdef class OverridingContext(object):
-    """Provider overriding context.
+    def __exit__(self, *_):
+        """Deactivate scope."""
+        self.exit()
 
-    :py:class:`OverridingContext` is used by :py:meth:`Provider.override` for
-    implementing ``with`` contexts. When :py:class:`OverridingContext` is
-    closed, overriding that was created in this context is dropped also.
+    async def __aenter__(self):
+        """Activate scope."""
+        return self.enter()
 
-    .. code-block:: python
+    async def __aexit__(self, *_):
+        """Deactivate scope."""
+        self.exit()
 
-        with provider.override(another_provider):
-            assert provider.overridden
-        assert not provider.overridden
-    """
+    def _async_init_instance(self, storage_key, future_result, result):
+        try:
+            instance = result.result()
+        except Exception as exception:
+            with self.__lock:
+                if self.__instances.get(storage_key) is future_result:
+                    del self.__instances[storage_key]
+            future_result.set_exception(exception)
+        else:
+            with self.__lock:
+                if self.__instances.get(storage_key) is future_result:
+                    self.__instances[storage_key] = instance
+            future_result.set_result(instance)
 
-    def __init__(self, Provider overridden, Provider overriding):
-        """Initializer.
+    cdef object __provide(self, BaseSingleton provider, object key, tuple args, dict kwargs):
+        storage_key = (id(provider), key)
 
-        :param overridden: Overridden provider.
-        :type overridden: :py:class:`Provider`
+        instance = self.__instances.get(storage_key, UNDEFINED)
+        if instance is not UNDEFINED:
+            return instance
 
-        :param overriding: Overriding provider.
-        :type overriding: :py:class:`Provider`
-        """
-        self.__overridden = overridden
-        self.__overriding = overriding
-        super(OverridingContext, self).__init__()
+        with self.__lock:
+            instance = self.__instances.get(storage_key, UNDEFINED)
+            if instance is not UNDEFINED:
+                return instance
 
-    def __enter__(self):
-        """Do nothing."""
-        return self.__overriding
+            instance = __factory_call(provider.__instantiator, args, kwargs)
 
-    def __exit__(self, *_):
-        """Exit overriding context."""
-        self.__overridden.reset_last_overriding()
+            if __is_future_or_coroutine(instance):
+                future_result = asyncio.Future()
+                instance = asyncio.ensure_future(instance)
+                instance.add_done_callback(
+                    functools.partial(self._async_init_instance, storage_key, future_result),
+                )
+                instance = future_result
+
+            self.__instances[storage_key] = instance
+            if provider not in self.__providers:
+                self.__providers.append(provider)
+            return instance
 
 
 cdef class BaseSingletonResetContext(object):
@@ -4356,6 +6660,72 @@ def __add_sys_streams(memo):
     memo[id(sys.stderr)] = sys.stderr
 
 
+def _read_configuration_file(filepath, raise_missing, loader):
+    filename = str(filepath)
+    if filename.endswith('.ini'):
+        reader = _read_ini_configuration
+    elif filename.endswith(('.yml', '.yaml')):
+        if yaml is None:
+            raise Error(
+                'Unable to load yaml configuration - PyYAML is not installed. '
+                'Install PyYAML or install Dependency Injector with yaml extras: '
+                '"pip install dependency-injector[yaml]"'
+            )
+        reader = _read_yaml_configuration
+    else:
+        raise Error('Unable to recognize format of configuration file {0}'.format(filename))
+
+    try:
+        return reader(filepath, loader)
+    except IOError as exception:
+        if raise_missing and exception.errno in (errno.ENOENT, errno.EISDIR):
+            exception.strerror = 'Unable to load configuration file {0}'.format(exception.strerror)
+            raise
+        return None
+
+
+def _read_ini_configuration(filepath, loader):
+    parser = _parse_ini_file(filepath)
+    return {section: dict(parser.items(section)) for section in parser.sections()}
+
+
+def _read_yaml_configuration(filepath, loader):
+    with open(filepath) as opened_file:
+        return yaml.load(opened_file, loader or YamlLoader)
+
+
+def _nest_configuration_value(selector, value):
+    for key in reversed(selector.split('.')):
+        value = {key: value}
+    return value
+
+
+cdef bint _is_pydantic_settings(object source) except -1:
+    if pydantic is None:
+        return False
+    try:
+        settings_cls = pydantic.BaseSettings
+    except ImportError:
+        # Pydantic 2 moved settings to the separate package
+        return False
+    return isinstance(source, settings_cls)
+
+
+cdef void _merge_configuration(dict target, object source, dict owned) except *:
+    # Merge source into target without changing the source. Mappings of the target that are
+    # not owned by the merge are copied before the change, so they can be shared.
+    for key, value in source.items():
+        current = target.get(key)
+        if isinstance(value, Mapping) and isinstance(current, Mapping):
+            if id(current) not in owned:
+                current = dict(current)
+                owned[id(current)] = current
+                target[key] = current
+            _merge_configuration(current, value, owned)
+        else:
+            target[key] = value
+
+
 def merge_dicts(dict1, dict2):
     """Merge dictionaries recursively.
 
@@ -4400,6 +6770,286 @@ def traverse(*providers, types=None):
         yield visiting
 
 
+def seal_sync(*providers):
+    """Seal providers and all providers they depend on as synchronous.
+
+    All providers are checked before sealing, so if any of them is asynchronous,
+    none of them is sealed.
+
+    :raise: :py:exc:`dependency_injector.errors.Error` if any of the providers is
+            asynchronous.
+    """
+    sealing = list(traverse(*providers))
+
+    for provider in sealing:
+        provider._check_sync_seal()
+
+    for provider in sealing:
+        provider._apply_sync_seal()
+
+
+def freeze(*providers):
+    """Freeze providers and all providers they depend on.
+
+    Frozen providers can not be overridden and their injections can not be changed.
+    """
+    for provider in traverse(*providers):
+        provider._freeze()
+
+
+def warm_up(*providers, types=None, max_workers=None):
+    """Build singletons and resources that providers depend on.
+
+    Providers are built in the order of their dependencies. Independent providers are built
+    concurrently on a thread pool. If called from a running event loop, returns an awaitable that
+    builds providers in concurrent asyncio tasks.
+
+    Scoped singletons and multitons are skipped. Thread-local and context-local singletons are
+    skipped unless their types are listed in ``types`` explicitly.
+
+    :param types: Types of providers to build, defaults to singletons and resources.
+    :type types: list[type] | None
+
+    :param max_workers: Maximum number of providers that are built at the same time.
+    :type max_workers: int | None
+
+    :return: Dictionary of built providers and their build time in seconds, in order of
+             building.
+    :rtype: dict[:py:class:`Provider`, float]
+    """
+    targets = _get_warm_up_targets(providers, types)
+    dependencies = _get_warm_up_dependencies(targets, types)
+
+    if _is_event_loop_running():
+        return _warm_up_async(targets, dependencies, max_workers)
+    return _warm_up_sync(targets, dependencies, max_workers)
+
+
+def prefork(*providers, max_workers=None):
+    """Prepare providers for forking of the process.
+
+    Builds singletons that have no fork policy, caches values of configuration options and
+    resolves overriding chains of all providers. Then collects garbage and moves all objects to
+    the permanent generation with :py:func:`gc.freeze`, so the child processes keep sharing
+    memory pages with the parent process.
+
+    Scoped, thread-local, context-local and asynchronous singletons and multitons are not built.
+
+    :param max_workers: Maximum number of singletons that are built at the same time.
+    :type max_workers: int | None
+
+    :return: Dictionary with the number of ``"providers"``, built ``"singletons"``,
+             ``"skipped_singletons"``, cached ``"configuration_options"`` and ``"frozen_objects"``.
+             Build time of every singleton is in ``"build_time"`` dictionary.
+    :rtype: dict
+    """
+    graph = list(traverse(*providers))
+
+    singletons = [provider for provider in graph if isinstance(provider, BaseSingleton)]
+    targets = [
+        provider
+        for provider in _get_warm_up_targets(providers, None)
+        if isinstance(provider, BaseSingleton)
+        and provider.fork_policy is None
+        and not provider.is_async_mode_enabled()
+    ]
+    build_time = _warm_up_sync(targets, _get_warm_up_dependencies(targets, None), max_workers)
+
+    configuration_options = 0
+    for provider in graph:
+        __resolve_overriding(<Provider> provider)
+        if not isinstance(provider, ConfigurationOption):
+            continue
+        try:
+            provider()
+        except Error:
+            continue
+        configuration_options += 1
+
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
+
+    return {
+        'providers': len(graph),
+        'singletons': len(build_time),
+        'skipped_singletons': len(singletons) - len(build_time),
+        'configuration_options': configuration_options,
+        'frozen_objects': gc.get_freeze_count() if hasattr(gc, 'get_freeze_count') else 0,
+        'build_time': build_time,
+    }
+
+
+def after_fork():
+    """Reset providers that have fork policy.
+
+    Providers with ``"reinit"`` policy are created again after all of the providers are reset.
+    Asynchronous providers are only reset.
+
+    Function is called automatically in the child process after :py:func:`os.fork`. Call it
+    manually in the child process if the process is forked without calling fork handlers.
+    """
+    forked = list(_fork_sensitive_providers)
+
+    for provider in forked:
+        provider._reset_after_fork()
+
+    for provider in forked:
+        if provider.fork_policy != FORK_POLICY_REINIT or provider.is_async_mode_enabled():
+            continue
+        provider()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=after_fork)
+
+
+def get_active_scope(name):
+    """Return active scope with the given name or ``None``.
+
+    :param name: Scope name.
+    :type name: str
+
+    :rtype: :py:class:`Scope` | None
+    """
+    active_scopes = _get_active_scopes()
+    if not active_scopes:
+        return None
+    return active_scopes.get(name)
+
+
+def enable_dependency_type_checks():
+    """Enable checking types of instances provided by :py:class:`Dependency` providers.
+
+    Type checks are enabled by default, unless ``DEPENDENCY_INJECTOR_SKIP_TYPE_CHECKS``
+    environment variable is set.
+    """
+    global _dependency_type_checks
+    _dependency_type_checks = True
+
+
+def disable_dependency_type_checks():
+    """Disable checking types of instances provided by :py:class:`Dependency` providers.
+
+    Use it in trusted environments, where dependencies graph is known to be correct.
+    """
+    global _dependency_type_checks
+    _dependency_type_checks = False
+
+
+def is_dependency_type_checks_enabled():
+    """Check if types of instances provided by :py:class:`Dependency` providers are checked.
+
+    :rtype: bool
+    """
+    return _dependency_type_checks
+
+
+BATCH_PROVIDERS = (Singleton, ThreadSafeSingleton, Object, ConfigurationOption, Resource)
+
+
+if contextvars is not None:
+    _active_scopes = contextvars.ContextVar('active_scopes', default=None)
+    _get_active_scopes = _active_scopes.get
+    _set_active_scopes = _active_scopes.set
+else:  # pragma: no cover
+    _active_scopes = threading.local()
+
+    def _get_active_scopes():
+        return getattr(_active_scopes, 'scopes', None)
+
+    def _set_active_scopes(scopes):
+        _active_scopes.scopes = scopes
+
+
+_fork_sensitive_providers = weakref.WeakSet()
+
+
+cdef void _register_fork_policy(Provider provider, object policy) except *:
+    if policy not in FORK_POLICIES:
+        raise Error('Fork policy must be one of {0}, got {1}'.format(FORK_POLICIES, repr(policy)))
+
+    if policy is None:
+        _fork_sensitive_providers.discard(provider)
+    else:
+        _fork_sensitive_providers.add(provider)
+
+
+cdef object _unhashable_key_error(Provider provider, object key):
+    return Error(
+        'Key {0} of {1} is not hashable, use .set_key() to compute a hashable key'.format(
+            repr(key),
+            provider,
+        ),
+    )
+
+
+cdef object _provide_in_scope(BaseSingleton provider, object key, tuple args, dict kwargs):
+    active_scopes = _get_active_scopes()
+    scope = active_scopes.get(provider.__scope) if active_scopes else None
+    if scope is None:
+        raise Error(
+            'Scope {0} is not active, provider {1} can not be called'.format(
+                repr(provider.__scope),
+                provider,
+            ),
+        )
+    return (<Scope> scope).__provide(provider, key, args, kwargs)
+
+
+cdef object _get_class_attribute(type cls, str name):
+    """Return attribute from the dictionary of the class or its nearest base class."""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return None
+
+
+cdef list __provide_batch_injections(tuple injections, set excluded):
+    """Return injection values, with batch providers replaced by the provided values."""
+    cdef list values = []
+    cdef Injection injection
+
+    for injection in injections:
+        value = injection.__value
+
+        if injection.__call == 1 \
+                and __is_batch_provider(value) \
+                and not (isinstance(injection, NamedInjection)
+                         and (<NamedInjection>injection).__name in excluded):
+            provided = value()
+            if not is_provider(provided) and not __is_future_or_coroutine(provided):
+                value = provided
+
+        if isinstance(injection, NamedInjection):
+            values.append(((<NamedInjection>injection).__name, value))
+        else:
+            values.append(value)
+
+    return values
+
+
+cdef bint __is_batch_provider(object provider) except -1:
+    """Check if provider returns the same value to all of the batch items.
+
+    Singletons that keep instances per thread, context, scope or for the limited time are not
+    batched. Asynchronous providers are not called before the batch is awaited.
+    """
+    if not isinstance(provider, BATCH_PROVIDERS):
+        return False
+    if isinstance(provider, BaseSingleton) and (<BaseSingleton> provider).__scope is not None:
+        return False
+    return provider.last_overriding is None and not provider.is_async_mode_enabled()
+
+
+cdef bint __has_prefixed_kwargs(dict kwargs, set names):
+    """Check if any of keyword arguments is prefixed with one of the names."""
+    for key in kwargs:
+        if '__' in key and key.split('__', 1)[0] in names:
+            return True
+    return False
+
+
 def isawaitable(obj):
     """Check if object is a coroutine function.
 
@@ -4433,6 +7083,204 @@ def isasyncgenfunction(obj):
         return False
 
 
+def _get_warm_up_targets(providers, types):
+    targets = []
+    for provider in traverse(*providers, types=types or (BaseSingleton, Resource)):
+        if isinstance(provider, BaseSingleton) and provider.scope is not None:
+            continue
+        if isinstance(provider, AbstractSingleton) and not provider.overridden:
+            continue
+        if types is None and isinstance(provider, (ThreadLocalSingleton, ContextLocalSingleton)):
+            continue
+        if isinstance(provider, Multiton):
+            # Instances are created for the keys of the call arguments
+            continue
+        targets.append(provider)
+    return targets
+
+
+def _get_warm_up_dependencies(targets, types):
+    targets_set = set(targets)
+    dependencies = {
+        target: {
+            dependency
+            for dependency in target.traverse(types=types)
+            if dependency in targets_set and dependency is not target
+        }
+        for target in targets
+    }
+
+    # Break dependency cycles: providers of the cycles are built one by one after the providers
+    # they depend on.
+    remaining = {target: set(target_dependencies) for target, target_dependencies in dependencies.items()}
+    ready = [target for target in targets if not remaining[target]]
+    while ready:
+        built = ready.pop()
+        del remaining[built]
+        for target, target_dependencies in remaining.items():
+            if built in target_dependencies:
+                target_dependencies.discard(built)
+                if not target_dependencies:
+                    ready.append(target)
+
+    previous = None
+    for target in targets:
+        if target not in remaining:
+            continue
+        dependencies[target] -= set(remaining)
+        if previous is not None:
+            dependencies[target].add(previous)
+        previous = target
+
+    return dependencies
+
+
+def _warm_up_sync(targets, dependencies, max_workers):
+    report = {}
+    remaining = {target: set(target_dependencies) for target, target_dependencies in dependencies.items()}
+    dependents = {target: [] for target in targets}
+    for target, target_dependencies in dependencies.items():
+        for dependency in target_dependencies:
+            dependents[dependency].append(target)
+
+    ready = [target for target in targets if not remaining[target]]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        while ready or running:
+            for target in ready:
+                running[executor.submit(_warm_up_provider, target)] = target
+            ready = []
+
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                target = running.pop(future)
+                report[target] = future.result()
+                for dependent in dependents[target]:
+                    remaining[dependent].discard(target)
+                    if not remaining[dependent]:
+                        ready.append(dependent)
+    return report
+
+
+async def _warm_up_async(targets, dependencies, max_workers):
+    report = {}
+    tasks = {}
+    semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+
+    async def build(target):
+        if dependencies[target]:
+            await asyncio.gather(*[tasks[dependency] for dependency in dependencies[target]])
+
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            started = time.perf_counter()
+            result = target()
+            if __is_future_or_coroutine(result):
+                await result
+            report[target] = time.perf_counter() - started
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    for target in targets:
+        tasks[target] = asyncio.ensure_future(build(target))
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    return report
+
+
+def _warm_up_provider(provider):
+    started = time.perf_counter()
+    result = provider()
+    if __is_future_or_coroutine(result):
+        if inspect.iscoroutine(result):
+            result.close()
+        raise Error(
+            'Provider {0} is asynchronous, use "await warm_up()" in the event loop'.format(provider),
+        )
+    return time.perf_counter() - started
+
+
+def _is_event_loop_running():
+    if asyncio is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+cpdef unsigned long long _get_graph_epoch():
+    """Return epoch of providers graph.
+
+    Epoch is incremented on every change of providers, so it can be used to invalidate
+    indexes that are built by traversing the graph.
+    """
+    return _graph_epoch
+
+
+cpdef void _invalidate_graph():
+    """Increment epoch of providers graph."""
+    global _graph_epoch
+    _graph_epoch += 1
+
+
+cdef tuple _get_configuration_path(tuple name, bint resolve=False):
+    cdef list path = []
+
+    for segment in name:
+        if is_provider(segment):
+            if not resolve:
+                return None
+            segment = segment()
+        path.extend(segment.split('.'))
+
+    return tuple(path)
+
+
+cdef bint _is_configuration_value_changed(object old, object new) except -1:
+    if old is new:
+        return False
+    if isinstance(old, Mapping) or isinstance(new, Mapping):
+        # Nested options are compared separately
+        return True
+    if old is UNDEFINED or new is UNDEFINED or type(old) is not type(new):
+        return True
+    try:
+        return not (old == new)
+    except Exception:
+        return True
+
+
+cdef void _index_configuration(dict index, tuple path, object value) except *:
+    if not isinstance(value, Mapping):
+        return
+
+    for key, item in value.items():
+        item_path = path + (key,)
+        index[item_path] = item
+        _index_configuration(index, item_path, item)
+
+
+cdef object _find_configuration_value(object value, tuple path):
+    for key in path:
+        try:
+            value = value.get(key, UNDEFINED)
+        except (AttributeError, TypeError):
+            return UNDEFINED
+        if value is UNDEFINED:
+            return UNDEFINED
+    return value
+
+
 cpdef _copy_parent(object from_, object to, dict memo):
     """Copy and assign provider parent."""
     copied_parent = (
@@ -0,0 +1,30 @@
+from dependency_injector import providers
+
+
+class Animal:
+    ...
+
+
+class Cat(Animal):
+
+    def __init__(self, *_, **__): ...
+
+
+# Test 1: to check the return type
+provider1 = providers.Pool(Cat)
+animal1: Animal = provider1.acquire()
+provider1.release(animal1)
+
+# Test 2: to check the lease context manager
+provider2 = providers.ThreadSafePool(Cat).set_max_size(2).set_timeout(1.0)
+with provider2.lease() as animal2:
+    var2: Animal = animal2
+
+# Test 3: to check the fluent settings
+provider3: providers.Pool[Cat] = providers.Pool(Cat).set_max_size(4).set_max_idle_time(60.0)
+
+# Test 4: to check the lease returned by the call
+provider4 = providers.Pool(Cat)
+lease4: providers.PoolLease[Cat] = provider4()
+with lease4 as animal4:
+    var4: Animal = animal4
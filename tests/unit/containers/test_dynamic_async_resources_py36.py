@@ -1,5 +1,7 @@
 """Dependency injector dynamic container unit tests for async resources."""
 
+import asyncio
+
 import unittest2 as unittest
 
 # Runtime import to get asyncutils module
@@ -69,3 +71,43 @@ class AsyncResourcesTest(AsyncTestCase):
         self.assertEqual(_init1.shutdown_counter, 2)
         self.assertEqual(_init2.init_counter, 2)
         self.assertEqual(_init2.shutdown_counter, 2)
+
+
+class AsyncWarmUpTest(AsyncTestCase):
+
+    def test_warm_up(self):
+        built = []
+
+        async def create(name, *_):
+            await asyncio.sleep(0.001)
+            built.append(name)
+            return name
+
+        async def init_resource():
+            built.append('resource')
+            yield 'resource'
+
+        class Container(containers.DeclarativeContainer):
+            resource = providers.Resource(init_resource)
+            database = providers.Singleton(create, 'database', resource)
+            cache = providers.Singleton(create, 'cache')
+            service = providers.Singleton(create, 'service', database, cache)
+            sync = providers.Singleton(list)
+
+        container = Container()
+
+        async def main():
+            return await container.warm_up(max_workers=2)
+
+        report = self._run(main())
+
+        self.assertEqual(
+            set(report),
+            {container.resource, container.database, container.cache, container.service, container.sync},
+        )
+        self.assertEqual(sorted(built), ['cache', 'database', 'resource', 'service'])
+        self.assertLess(built.index('resource'), built.index('database'))
+        self.assertEqual(built[-1], 'service')
+        self.assertEqual(self._run(container.service()), 'service')
+
+        self._run(container.shutdown_resources())
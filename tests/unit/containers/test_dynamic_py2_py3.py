@@ -1,5 +1,7 @@
 """Dependency injector dynamic container unit tests."""
 
+import gc
+
 import unittest2 as unittest
 
 from dependency_injector import (
@@ -288,6 +290,25 @@ class DeclarativeContainerInstanceTests(unittest.TestCase):
         self.assertEqual(_init2.init_counter, 2)
         self.assertEqual(_init2.shutdown_counter, 2)
 
+    def test_scope(self):
+        class Container(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+            scoped = providers.Singleton(object).set_scope('request')
+
+        container = Container()
+        singleton = container.singleton()
+
+        with container.scope('request') as scope:
+            scoped1 = container.scoped()
+            self.assertIs(container.scoped(), scoped1)
+            self.assertEqual(scope.providers, (container.scoped,))
+
+        with container.scope('request'):
+            scoped2 = container.scoped()
+
+        self.assertIsNot(scoped1, scoped2)
+        self.assertIs(container.singleton(), singleton)
+
     def test_reset_singletons(self):
         class SubSubContainer(containers.DeclarativeContainer):
             singleton = providers.Singleton(object)
@@ -336,6 +357,192 @@ class DeclarativeContainerInstanceTests(unittest.TestCase):
         self.assertIs(obj32, obj42)
         self.assertIs(obj33, obj43)
 
+    def test_reset_singletons_index(self):
+        class Container(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+            factory = providers.Factory(dict)
+
+        container = Container()
+        traversals = []
+
+        def traverse(types=None):
+            traversals.append(types)
+            return containers.DynamicContainer.traverse(container, types=types)
+        container.traverse = traverse
+
+        obj1 = container.singleton()
+        container.reset_singletons()
+        container.reset_singletons()
+        obj2 = container.singleton()
+
+        self.assertIsNot(obj1, obj2)
+        self.assertEqual(len(traversals), 1)
+
+    def test_reset_singletons_index_invalidation(self):
+        container = containers.DynamicContainer()
+        container.factory = providers.Factory(dict)
+        container.reset_singletons()
+
+        container.singleton1 = providers.Singleton(object)
+        obj1 = container.singleton1()
+        container.reset_singletons()
+        self.assertIsNot(container.singleton1(), obj1)
+
+        singleton2 = providers.Singleton(object)
+        container.factory.add_kwargs(singleton2=singleton2)
+        obj2 = container.factory()['singleton2']
+        container.reset_singletons()
+        self.assertIsNot(singleton2(), obj2)
+
+        singleton3 = providers.Singleton(object)
+        container.factory.override(providers.Factory(dict, singleton3=singleton3))
+        obj3 = container.factory()['singleton3']
+        container.reset_singletons()
+        self.assertIsNot(singleton3(), obj3)
+
+        singleton1 = container.singleton1
+        obj4 = singleton1()
+        del container.singleton1
+        container.reset_singletons()
+        self.assertIs(singleton1(), obj4)
+
+    def test_warm_up(self):
+        built = []
+
+        def create(name, *_):
+            built.append(name)
+            return name
+
+        def init_resource():
+            built.append('resource')
+            yield 'resource'
+
+        class Container(containers.DeclarativeContainer):
+            resource = providers.Resource(init_resource)
+            database = providers.Singleton(create, 'database', resource)
+            cache = providers.ThreadSafeSingleton(create, 'cache')
+            service = providers.Singleton(
+                create,
+                'service',
+                providers.Factory(create, 'factory', database, cache),
+            )
+            scoped = providers.Singleton(create, 'scoped').set_scope('request')
+            thread_local = providers.ThreadLocalSingleton(create, 'thread_local')
+            factory = providers.Factory(create, 'not built')
+
+        container = Container()
+
+        report = container.warm_up(max_workers=2)
+
+        self.assertEqual(
+            set(report),
+            {container.resource, container.database, container.cache, container.service},
+        )
+        self.assertTrue(all(isinstance(seconds, float) for seconds in report.values()))
+        self.assertEqual(sorted(built), ['cache', 'database', 'factory', 'resource', 'service'])
+        self.assertLess(built.index('resource'), built.index('database'))
+        self.assertLess(built.index('database'), built.index('service'))
+        self.assertLess(built.index('cache'), built.index('service'))
+        self.assertLess(list(report).index(container.database), list(report).index(container.service))
+
+        container.warm_up()
+        self.assertEqual(len(built), 5)
+
+        container.shutdown_resources()
+
+    def test_warm_up_types(self):
+        class Container(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+            thread_local = providers.ThreadLocalSingleton(object)
+            resource = providers.Resource(object)
+
+        container = Container()
+
+        report = container.warm_up(types=[providers.ThreadLocalSingleton])
+
+        self.assertEqual(list(report), [container.thread_local])
+
+    def test_warm_up_skips_multiton(self):
+        class Client(object):
+            def __init__(self, tenant):
+                self.tenant = tenant
+
+        class Container(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+            client = providers.Multiton(Client)
+            thread_safe_client = providers.ThreadSafeMultiton(Client)
+            mapping = providers.Multiton(dict)
+
+        container = Container()
+
+        report = container.warm_up()
+
+        self.assertEqual(list(report), [container.singleton])
+        self.assertEqual(container.client.size, 0)
+        self.assertEqual(container.thread_safe_client.size, 0)
+        self.assertEqual(container.mapping.size, 0)
+
+    def test_warm_up_error(self):
+        def fail():
+            raise RuntimeError()
+
+        class Container(containers.DeclarativeContainer):
+            failing = providers.Singleton(fail)
+            dependent = providers.Singleton(list, failing)
+
+        container = Container()
+
+        with self.assertRaises(RuntimeError):
+            container.warm_up()
+
+    def test_prefork(self):
+        class Container(containers.DeclarativeContainer):
+            config = providers.Configuration()
+            singleton = providers.Singleton(dict, value=config.value)
+            reset_singleton = providers.Singleton(object).set_fork_policy('reset')
+            scoped = providers.Singleton(object).set_scope('request')
+            factory = providers.Factory(object)
+
+        container = Container(config={'value': 1})
+
+        try:
+            report = container.prefork()
+        finally:
+            if hasattr(gc, 'unfreeze'):
+                gc.unfreeze()
+
+        self.assertEqual(report['singletons'], 1)
+        self.assertEqual(report['skipped_singletons'], 2)
+        self.assertEqual(report['configuration_options'], 1)
+        self.assertGreaterEqual(report['providers'], 6)
+        self.assertEqual(list(report['build_time']), [container.singleton])
+        if hasattr(gc, 'freeze'):
+            self.assertGreater(report['frozen_objects'], 0)
+        self.assertEqual(container.singleton(), {'value': 1})
+
+    def test_prefork_skips_multiton(self):
+        class Client(object):
+            def __init__(self, tenant):
+                self.tenant = tenant
+
+        class Container(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+            client = providers.Multiton(Client)
+            mapping = providers.ThreadSafeMultiton(dict)
+
+        container = Container()
+
+        try:
+            report = container.prefork()
+        finally:
+            if hasattr(gc, 'unfreeze'):
+                gc.unfreeze()
+
+        self.assertEqual(list(report['build_time']), [container.singleton])
+        self.assertEqual(report['skipped_singletons'], 2)
+        self.assertEqual(container.client.size, 0)
+        self.assertEqual(container.mapping.size, 0)
+
     def test_reset_singletons_context_manager(self):
         class Item:
             def __init__(self, dependency):
@@ -366,6 +573,57 @@ class DeclarativeContainerInstanceTests(unittest.TestCase):
 
         self.assertIs(container, alias)
 
+    def test_freeze(self):
+        class SubContainer(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+
+        class Container(containers.DeclarativeContainer):
+            config = providers.Configuration(default={'value': 1})
+            factory = providers.Factory(dict, value=config.value)
+            sub_container = providers.Container(SubContainer)
+
+        container = Container()
+        container.freeze()
+
+        self.assertTrue(container.is_frozen())
+        self.assertTrue(container.factory.is_frozen())
+        self.assertTrue(container.config.is_frozen())
+        self.assertTrue(container.sub_container().is_frozen())
+        self.assertTrue(container.sub_container.singleton.is_frozen())
+        self.assertEqual(container.factory(), {'value': 1})
+
+        with self.assertRaises(errors.Error):
+            container.factory.add_kwargs(other=2)
+        with self.assertRaises(errors.Error):
+            container.factory.override(providers.Object({}))
+        with self.assertRaises(errors.Error):
+            container.sub_container.singleton.set_args(1)
+        with self.assertRaises(errors.Error):
+            container.config.from_dict({'value': 2})
+        with self.assertRaises(errors.Error):
+            container.override_providers(factory=providers.Object({}))
+        with self.assertRaises(errors.Error):
+            container.reset_override()
+        with self.assertRaises(errors.Error):
+            container.provider = providers.Object(1)
+        with self.assertRaises(errors.Error):
+            del container.factory
+
+        self.assertEqual(container.factory(), {'value': 1})
+
+    def test_freeze_allows_reset_singletons(self):
+        class Container(containers.DeclarativeContainer):
+            singleton = providers.Singleton(object)
+
+        container = Container()
+        container.freeze()
+
+        instance1 = container.singleton()
+        container.reset_singletons()
+        instance2 = container.singleton()
+
+        self.assertIsNot(instance1, instance2)
+
     def test_check_dependencies(self):
         class SubContainer(containers.DeclarativeContainer):
             dependency = providers.Dependency()
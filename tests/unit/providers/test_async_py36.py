@@ -387,6 +387,25 @@ class FactoryTests(AsyncTestCase):
         self.assertIsNot(service1.client, service2.client)
 
 
+class FactoryMapAsyncTests(AsyncTestCase):
+
+    def test_map_async(self):
+        container = Container()
+
+        async def collect(kwargs_iterable):
+            return [client async for client in container.client.map_async(kwargs_iterable)]
+
+        clients = self._run(collect([{}, {}]))
+
+        self.assertEqual(len(clients), 2)
+        self.assertIsInstance(clients[0], Client)
+        self.assertIsNot(clients[0], clients[1])
+        self.assertIs(clients[0].resource1, RESOURCE1)
+        self.assertIs(clients[1].resource2, RESOURCE2)
+
+        self._run(container.shutdown_resources())
+
+
 class FactoryAggregateTests(AsyncTestCase):
 
     def test_async_mode(self):
@@ -626,6 +645,341 @@ class DelegatedThreadLocalSingletonTests(AsyncTestCase):
         self.assertIs(instance, instance)
 
 
+class ContextLocalSingletonTests(AsyncTestCase):
+
+    def test_async_mode(self):
+        instance = object()
+
+        async def create_instance():
+            return instance
+
+        provider = providers.ContextLocalSingleton(create_instance)
+
+        instance1 = self._run(provider())
+        instance2 = self._run(provider())
+
+        self.assertIs(instance1, instance2)
+        self.assertIs(instance1, instance)
+
+    def test_tasks_scope(self):
+        async def create_instance():
+            await asyncio.sleep(0.001)
+            return object()
+
+        provider = providers.ContextLocalSingleton(create_instance)
+
+        async def task():
+            return await provider(), await provider()
+
+        async def main():
+            return await asyncio.gather(task(), task())
+
+        (instance11, instance12), (instance21, instance22) = self._run(main())
+
+        self.assertIs(instance11, instance12)
+        self.assertIs(instance21, instance22)
+        self.assertIsNot(instance11, instance21)
+
+    def test_async_init_with_error(self):
+        # Disable default exception handling to prevent output
+        asyncio.get_event_loop().set_exception_handler(lambda loop, context: ...)
+
+        async def create_instance():
+            create_instance.counter += 1
+            raise RuntimeError()
+        create_instance.counter = 0
+
+        provider = providers.ContextLocalSingleton(create_instance)
+
+        with self.assertRaises(RuntimeError):
+            self._run(provider())
+
+        with self.assertRaises(RuntimeError):
+            self._run(provider())
+
+        self.assertEqual(create_instance.counter, 2)
+        self.assertTrue(provider.is_async_mode_enabled())
+
+        # Restore default exception handling
+        asyncio.get_event_loop().set_exception_handler(None)
+
+
+class WeakSingletonTests(AsyncTestCase):
+
+    def test_async_mode(self):
+        class Instance:
+            ...
+
+        async def create_instance():
+            return Instance()
+
+        provider = providers.WeakSingleton(create_instance)
+
+        instance1 = self._run(provider())
+        instance2 = self._run(provider())
+
+        self.assertIs(instance1, instance2)
+        self.assertTrue(provider.is_alive)
+
+    def test_async_init_with_error(self):
+        # Disable default exception handling to prevent output
+        asyncio.get_event_loop().set_exception_handler(lambda loop, context: ...)
+
+        async def create_instance():
+            create_instance.counter += 1
+            raise RuntimeError()
+        create_instance.counter = 0
+
+        provider = providers.WeakSingleton(create_instance)
+
+        with self.assertRaises(RuntimeError):
+            self._run(provider())
+
+        with self.assertRaises(RuntimeError):
+            self._run(provider())
+
+        self.assertEqual(create_instance.counter, 2)
+        self.assertFalse(provider.is_alive)
+
+        # Restore default exception handling
+        asyncio.get_event_loop().set_exception_handler(None)
+
+
+class MultitonTests(AsyncTestCase):
+
+    def test_async_mode(self):
+        async def create_instance(key):
+            await asyncio.sleep(0.001)
+            create_instance.counter += 1
+            return object()
+        create_instance.counter = 0
+
+        provider = providers.Multiton(create_instance)
+
+        async def main():
+            return await asyncio.gather(provider('a'), provider('a'), provider('b'))
+
+        instance_a1, instance_a2, instance_b = self._run(main())
+
+        self.assertIs(instance_a1, instance_a2)
+        self.assertIsNot(instance_a1, instance_b)
+        self.assertIs(self._run(provider('a')), instance_a1)
+        self.assertEqual(create_instance.counter, 2)
+
+    def test_async_init_with_error(self):
+        # Disable default exception handling to prevent output
+        asyncio.get_event_loop().set_exception_handler(lambda loop, context: ...)
+
+        async def create_instance(key):
+            raise RuntimeError()
+
+        provider = providers.Multiton(create_instance)
+
+        with self.assertRaises(RuntimeError):
+            self._run(provider('a'))
+
+        self.assertEqual(provider.size, 0)
+
+        # Restore default exception handling
+        asyncio.get_event_loop().set_exception_handler(None)
+
+    def test_eviction_of_created_instance(self):
+        async def create_instance(key):
+            return key
+
+        evicted = []
+        provider = providers.Multiton(create_instance).set_max_size(1)
+        provider.set_eviction_callback(evicted.append)
+
+        self._run(provider('a'))
+        self._run(provider('b'))
+
+        self.assertEqual(evicted, ['a'])
+
+
+class ExpiringSingletonTests(AsyncTestCase):
+
+    def test_async_mode(self):
+        async def create_instance():
+            return object()
+
+        provider = providers.ExpiringSingleton(create_instance).set_ttl(0.01)
+
+        instance1 = self._run(provider())
+        instance2 = self._run(provider())
+        self._run(asyncio.sleep(0.02))
+        instance3 = self._run(provider())
+
+        self.assertIs(instance1, instance2)
+        self.assertIsNot(instance1, instance3)
+
+    def test_background_refresh(self):
+        async def create_instance():
+            await asyncio.sleep(0.01)
+            return object()
+
+        provider = providers.ExpiringSingleton(create_instance)
+        provider.set_ttl(0.01).set_background_refresh()
+
+        async def main():
+            instance1 = await provider()
+            await asyncio.sleep(0.02)
+            instance2 = await provider()
+            instance3 = await provider()
+            await asyncio.sleep(0.05)
+            instance4 = await provider()
+            return instance1, instance2, instance3, instance4
+
+        instance1, instance2, instance3, instance4 = self._run(main())
+
+        self.assertIs(instance1, instance2)
+        self.assertIs(instance1, instance3)
+        self.assertIsNot(instance1, instance4)
+
+    def test_concurrent_calls_while_pending(self):
+        calls = []
+
+        async def create_instance():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        provider = providers.ExpiringSingleton(create_instance).set_ttl(60)
+
+        async def main():
+            return await asyncio.gather(provider(), provider(), provider())
+
+        instance1, instance2, instance3 = self._run(main())
+
+        self.assertEqual(calls, [1])
+        self.assertIs(instance1, instance2)
+        self.assertIs(instance1, instance3)
+
+    def test_background_refresh_not_awaitable_result(self):
+        async def create_first():
+            return 'first'
+
+        results = [create_first(), 'second']
+
+        provider = providers.ExpiringSingleton(lambda: results.pop(0))
+        provider.set_ttl(0.01).set_background_refresh()
+
+        async def main():
+            instance1 = await provider()
+            await asyncio.sleep(0.02)
+            instance2 = await provider()
+            instance3 = await provider()
+            return instance1, instance2, instance3
+
+        instance1, instance2, instance3 = self._run(main())
+
+        self.assertEqual(instance1, 'first')
+        self.assertEqual(instance2, 'first')
+        self.assertEqual(instance3, 'second')
+        self.assertIsNone(provider.refresh_error)
+
+
+class ScopeTests(AsyncTestCase):
+
+    def test_async_with(self):
+        async def create_instance():
+            return object()
+
+        provider = providers.Singleton(create_instance).set_scope('request')
+
+        async def request():
+            async with providers.Scope('request'):
+                return await provider(), await provider()
+
+        instance11, instance12 = self._run(request())
+        instance21, instance22 = self._run(request())
+
+        self.assertIs(instance11, instance12)
+        self.assertIs(instance21, instance22)
+        self.assertIsNot(instance11, instance21)
+
+    def test_tasks_scopes(self):
+        async def create_instance():
+            await asyncio.sleep(0.001)
+            return object()
+
+        provider = providers.ContextLocalSingleton(create_instance).set_scope('request')
+
+        async def request():
+            async with providers.Scope('request'):
+                instance1 = await provider()
+                await asyncio.sleep(0.001)
+                instance2 = await provider()
+                return instance1, instance2
+
+        async def main():
+            return await asyncio.gather(request(), request())
+
+        (instance11, instance12), (instance21, instance22) = self._run(main())
+
+        self.assertIs(instance11, instance12)
+        self.assertIs(instance21, instance22)
+        self.assertIsNot(instance11, instance21)
+
+    def test_tasks_scopes_singleton(self):
+        async def create_instance():
+            await asyncio.sleep(0.001)
+            return object()
+
+        provider = providers.Singleton(create_instance).set_scope('request')
+
+        async def request(delay):
+            async with providers.Scope('request'):
+                instance1 = await provider()
+                await asyncio.sleep(delay)
+                instance2 = await provider()
+                return instance1, instance2
+
+        async def main():
+            return await asyncio.gather(request(0.001), request(0.01))
+
+        (instance11, instance12), (instance21, instance22) = self._run(main())
+
+        self.assertIs(instance11, instance12)
+        self.assertIs(instance21, instance22)
+        self.assertIsNot(instance11, instance21)
+
+
+class PoolTests(AsyncTestCase):
+
+    def test_async_instance(self):
+        async def create_client():
+            return Client(RESOURCE1, RESOURCE2)
+
+        provider = providers.Pool(create_client).set_max_size(1)
+
+        client1 = self._run(provider.acquire())
+        self.assertIsInstance(client1, Client)
+        self.assertEqual(provider.size, 1)
+        self.assertRaises(errors.Error, provider.acquire)
+
+        provider.release(client1)
+        client2 = provider.acquire()
+
+        self.assertIs(client1, client2)
+
+    def test_async_lease(self):
+        async def create_client():
+            return Client(RESOURCE1, RESOURCE2)
+
+        provider = providers.Pool(create_client).set_max_size(1)
+
+        async def lease():
+            async with provider() as client:
+                self.assertEqual(provider.idle_size, 0)
+            return client
+
+        client = self._run(lease())
+
+        self.assertIsInstance(client, Client)
+        self.assertEqual(provider.idle_size, 1)
+
+
 class ProvidedInstanceTests(AsyncTestCase):
 
     def test_provided_attribute(self):
@@ -853,6 +1207,22 @@ class OverrideTests(AsyncTestCase):
         self.assertIs(dependency1, dependency)
         self.assertIs(dependency2, dependency)
 
+    def test_overriding_chain_with_async_mode_enabled(self):
+        dependency = object()
+
+        overriding = providers.Provider()
+        overriding.override(providers.Object(dependency))
+
+        provider = providers.Provider()
+        provider.override(overriding)
+        dependency1 = provider()
+
+        overriding.enable_async_mode()
+        dependency2 = self._run(provider())
+
+        self.assertIs(dependency1, dependency)
+        self.assertIs(dependency2, dependency)
+
     def test_async_mode_enabling(self):
         dependency = object()
 
@@ -946,6 +1316,97 @@ class TestAsyncModeApi(unittest.TestCase):
         self.assertTrue(self.provider.is_async_mode_undefined())
 
 
+class SyncSealTests(AsyncTestCase):
+
+    def test_seal_sync(self):
+        resource = providers.Singleton(object)
+        client = providers.Factory(Client, resource1=resource, resource2=resource)
+        service = providers.Factory(Service, client=client).add_attributes(resource=resource)
+
+        self.assertIs(service.seal_sync(), service)
+
+        self.assertTrue(service.is_sync_sealed())
+        self.assertTrue(client.is_sync_sealed())
+        self.assertTrue(resource.is_sync_sealed())
+        self.assertTrue(service.is_async_mode_disabled())
+
+        instance = service()
+        self.assertIsInstance(instance, Service)
+        self.assertIs(instance.client.resource1, resource())
+        self.assertIs(instance.resource, resource())
+
+    def test_seal_sync_awaitable_provided(self):
+        async def create_client():
+            return None
+
+        provider = providers.Callable(lambda: create_client())
+        provider.seal_sync()
+
+        with self.assertRaises(errors.Error):
+            provider()
+
+    def test_seal_sync_awaitable_injected(self):
+        loop = asyncio.get_event_loop()
+
+        provider = providers.Factory(Service, client=providers.Callable(loop.create_future))
+        provider.seal_sync()
+
+        with self.assertRaises(errors.Error):
+            provider()
+
+    def test_seal_sync_coroutine_provider(self):
+        async def create_client():
+            return None
+
+        dependency = providers.Coroutine(create_client)
+        provider = providers.Factory(Service, client=dependency)
+
+        with self.assertRaises(errors.Error):
+            provider.seal_sync()
+
+        self.assertFalse(provider.is_sync_sealed())
+        self.assertFalse(dependency.is_sync_sealed())
+
+    def test_seal_sync_async_resource(self):
+        with self.assertRaises(errors.Error):
+            Container.service.seal_sync()
+
+    def test_seal_sync_async_mode_enabled(self):
+        provider = providers.Factory(object)
+        provider.enable_async_mode()
+
+        with self.assertRaises(errors.Error):
+            provider.seal_sync()
+
+    def test_reset_async_mode_removes_seal(self):
+        provider = providers.Factory(object)
+        provider.seal_sync()
+
+        provider.reset_async_mode()
+
+        self.assertFalse(provider.is_sync_sealed())
+        self.assertTrue(provider.is_async_mode_undefined())
+
+    def test_container_seal_sync(self):
+        class SyncContainer(containers.DeclarativeContainer):
+            resource = providers.Singleton(object)
+            client = providers.Factory(Client, resource1=resource, resource2=resource)
+
+        container = SyncContainer()
+        container.seal_sync()
+
+        self.assertTrue(container.resource.is_sync_sealed())
+        self.assertTrue(container.client.is_sync_sealed())
+        self.assertFalse(SyncContainer.client.is_sync_sealed())
+        self.assertIsInstance(container.client(), Client)
+
+    def test_container_seal_sync_async_resource(self):
+        container = Container()
+
+        with self.assertRaises(errors.Error):
+            container.seal_sync()
+
+
 class AsyncTypingStubTests(AsyncTestCase):
 
     def test_async_(self):
@@ -20,6 +20,26 @@ class ProviderTests(unittest.TestCase):
     def test_call(self):
         self.assertRaises(NotImplementedError, self.provider.__call__)
 
+    def test_call_injected_subclass_with_custom_call(self):
+        class CustomProvider(providers.Object):
+            def __call__(self, *args, **kwargs):
+                return 'custom'
+
+        provider = providers.Callable(lambda value: value, CustomProvider('object'))
+
+        self.assertEqual(provider(), 'custom')
+
+    def test_call_injected_overridden_by_subclass_with_custom_call(self):
+        class CustomProvider(providers.Object):
+            def __call__(self, *args, **kwargs):
+                return 'custom'
+
+        dependency = providers.Object('object')
+        dependency.override(CustomProvider('overriding'))
+        provider = providers.Callable(lambda value: value, dependency)
+
+        self.assertEqual(provider(), 'custom')
+
     def test_delegate(self):
         delegate1 = self.provider.delegate()
 
@@ -107,6 +127,52 @@ class ProviderTests(unittest.TestCase):
 
         self.assertEqual(self.provider.overridden, tuple())
 
+    def test_call_overriding_chain(self):
+        overriding_provider1 = providers.Provider()
+        overriding_provider2 = providers.Provider()
+        overriding_provider3 = providers.Object(3)
+
+        self.provider.override(overriding_provider1)
+        overriding_provider1.override(overriding_provider2)
+        overriding_provider2.override(overriding_provider3)
+        self.assertEqual(self.provider(), 3)
+
+        overriding_provider3.override(providers.Object(4))
+        self.assertEqual(self.provider(), 4)
+
+        overriding_provider2.reset_override()
+        overriding_provider2.override(providers.Object(5))
+        self.assertEqual(self.provider(), 5)
+
+        overriding_provider1.reset_last_overriding()
+        self.assertRaises(NotImplementedError, self.provider)
+
+    def test_overriding_chain_depth(self):
+        overriding_provider1 = providers.Provider()
+        overriding_provider2 = providers.Provider()
+
+        self.assertEqual(self.provider.overriding_chain_depth, 0)
+
+        self.provider.override(overriding_provider1)
+        overriding_provider1.override(overriding_provider2)
+
+        self.assertEqual(self.provider.overriding_chain_depth, 2)
+        self.assertEqual(overriding_provider1.overriding_chain_depth, 1)
+
+    def test_freeze(self):
+        overriding_provider = providers.Object(1)
+        self.provider.override(overriding_provider)
+
+        self.assertIs(self.provider.freeze(), self.provider)
+
+        self.assertTrue(self.provider.is_frozen())
+        self.assertTrue(overriding_provider.is_frozen())
+        self.assertEqual(self.provider.overridden, (overriding_provider,))
+        self.assertEqual(self.provider(), 1)
+        self.assertRaises(errors.Error, self.provider.override, providers.Object(2))
+        self.assertRaises(errors.Error, self.provider.reset_last_overriding)
+        self.assertRaises(errors.Error, self.provider.reset_override)
+
     def test_deepcopy(self):
         provider = providers.Provider()
 
@@ -373,6 +439,37 @@ class DependencyTests(unittest.TestCase):
         self.provider.provided_by(providers.Factory(dict))
         self.assertRaises(errors.Error, self.provider)
 
+    def test_call_overridden_instance_of_checked_after_reset_override(self):
+        self.provider.provided_by(providers.Factory(list))
+        self.provider()
+        self.provider()
+
+        self.provider.reset_override()
+        self.provider.provided_by(providers.Factory(dict))
+
+        self.assertRaises(errors.Error, self.provider)
+
+    def test_call_overridden_with_subclass_instance_of(self):
+        class CustomList(list):
+            pass
+
+        self.provider.provided_by(providers.Factory(CustomList))
+        self.assertIsInstance(self.provider(), CustomList)
+        self.assertIsInstance(self.provider(), CustomList)
+
+    def test_call_with_disabled_type_checks(self):
+        self.provider.provided_by(providers.Factory(dict))
+
+        providers.disable_dependency_type_checks()
+        try:
+            self.assertFalse(providers.is_dependency_type_checks_enabled())
+            self.assertEqual(self.provider(), {})
+        finally:
+            providers.enable_dependency_type_checks()
+
+        self.assertTrue(providers.is_dependency_type_checks_enabled())
+        self.assertRaises(errors.Error, self.provider)
+
     def test_call_undefined(self):
         with self.assertRaises(errors.Error) as context:
             self.provider()
@@ -89,6 +89,22 @@ class CallableTests(unittest.TestCase):
             .clear_kwargs()
         self.assertEqual(provider.kwargs, dict())
 
+    def test_call_after_set_args(self):
+        provider = providers.Callable(_example, 1, 2, 3, 4)
+        provider()
+
+        provider.set_args(providers.Object(5), 6, 7, 8)
+
+        self.assertTupleEqual(provider(), (5, 6, 7, 8))
+
+    def test_call_after_add_kwargs(self):
+        provider = providers.Callable(_example, 1, 2)
+        provider(3, 4)
+
+        provider.add_kwargs(arg3=providers.Object(7), arg4=8)
+
+        self.assertTupleEqual(provider(), (1, 2, 7, 8))
+
     def test_call_overridden(self):
         provider = providers.Callable(_example)
 
@@ -5,6 +5,7 @@ import decimal
 import os
 import sys
 import tempfile
+import types
 
 import unittest2 as unittest
 
@@ -234,6 +235,188 @@ class ConfigTests(unittest.TestCase):
         self.config.from_dict({'a': None})
         self.assertIsNone(self.config.a())
 
+    def test_get_path(self):
+        self.assertEqual(self.config.a.b.c.get_path(), ('a', 'b', 'c'))
+
+    def test_get_path_with_dynamic_segment(self):
+        self.config.override({'key': 'b'})
+        self.assertEqual(self.config.a[self.config.key].c.get_path(), ('a', 'b', 'c'))
+
+    def test_get_by_tuple_path(self):
+        self.config.from_dict({'a': {'b': {'c': 1}}})
+
+        self.assertEqual(self.config.get(('a', 'b', 'c')), 1)
+        self.assertEqual(self.config.get(('a', 'b')), {'c': 1})
+        self.assertIsNone(self.config.get(('a', 'x')))
+
+    def test_get_by_tuple_path_required(self):
+        self.config.from_dict({'a': {'b': {'c': 1}}})
+
+        with self.assertRaisesRegex(errors.Error, 'Undefined configuration option "config.a.x"'):
+            self.config.get(('a', 'x'), required=True)
+
+    def test_get_below_not_dict_value(self):
+        self.config.from_dict({'a': {'b': 1}})
+        self.assertIsNone(self.config.a.b.c())
+
+    def test_get_after_overriding(self):
+        self.config.from_dict({'a': {'b': 1}})
+        self.assertEqual(self.config.get('a.b'), 1)
+
+        self.config.override({'a': {'b': 2}})
+        self.assertEqual(self.config.get('a.b'), 2)
+
+        self.config.reset_last_overriding()
+        self.assertEqual(self.config.get('a.b'), 1)
+
+    def test_get_from_mapping(self):
+        self.config.override(types.MappingProxyType({'a': types.MappingProxyType({'b': 1})}))
+
+        self.assertEqual(self.config.get('a.b'), 1)
+        self.assertEqual(self.config.a.b(), 1)
+        self.assertIsNone(self.config.get('a.x'))
+
+    def test_get_from_not_mapping_container(self):
+        class Settings(object):
+            def get(self, key, default=None):
+                return {'b': 1}.get(key, default)
+
+        self.config.from_dict({'a': Settings()})
+
+        self.assertEqual(self.config.get('a.b'), 1)
+        self.assertEqual(self.config.a.b(), 1)
+        self.assertIsNone(self.config.get('a.x'))
+
+    def test_get_after_linked_configuration_change(self):
+        other_config = providers.Configuration()
+        other_config.from_dict({'a': {'b': 1}})
+        self.config.override(other_config)
+        self.assertEqual(self.config.get('a.b'), 1)
+
+        other_config.set('a.b', 2)
+        self.assertEqual(self.config.get('a.b'), 2)
+
+    def test_overriding_resets_only_changed_options(self):
+        self.config.from_dict({'a': {'b': [1], 'c': 1}, 'd': [2]})
+        b, d = self.config.a.b(), self.config.d()
+        self.assertEqual(self.config.a.c(), 1)
+
+        self.config.override({'a': {'b': [1], 'c': 2}, 'd': [2]})
+
+        self.assertIs(self.config.a.b(), b)
+        self.assertIs(self.config.d(), d)
+        self.assertEqual(self.config.a.c(), 2)
+        self.assertEqual(self.config.a(), {'b': [1], 'c': 2})
+
+    def test_reset_override_resets_only_changed_options(self):
+        self.config.from_dict({'a': [1], 'b': 1})
+        self.config.override({'a': [1], 'b': 2})
+        a = self.config.a()
+        self.assertEqual(self.config.b(), 2)
+
+        self.config.reset_last_overriding()
+        self.assertIs(self.config.a(), a)
+        self.assertEqual(self.config.b(), 1)
+
+        self.config.reset_override()
+        self.assertIsNone(self.config.a())
+        self.assertIsNone(self.config.b())
+
+    def test_overriding_resets_option_with_changed_type(self):
+        self.config.from_dict({'a': 1})
+        self.assertIs(self.config.a(), 1)
+
+        self.config.from_dict({'a': True})
+        self.assertIs(self.config.a(), True)
+
+    def test_overriding_with_mutated_dictionary(self):
+        value = {'a': {'b': 1}}
+        self.config.override(value)
+        self.assertEqual(self.config.a.b(), 1)
+
+        value['a']['b'] = 2
+        self.config.override(value)
+        self.assertEqual(self.config.a.b(), 2)
+
+    def test_overriding_resets_option_with_dynamic_segment(self):
+        self.config.from_dict({'key': 'b', 'a': {'b': 1, 'c': 2}})
+        option = self.config.a[self.config.key]
+        self.assertEqual(option(), 1)
+
+        self.config.from_dict({'key': 'c'})
+        self.assertEqual(option(), 2)
+
+    def test_set(self):
+        self.config.from_dict({'a': {'b': {'c': 1}, 'd': {'e': 2}}})
+        previous = self.config()
+
+        self.config.set('a.b.c', 3)
+
+        self.assertEqual(self.config(), {'a': {'b': {'c': 3}, 'd': {'e': 2}}})
+        self.assertEqual(previous, {'a': {'b': {'c': 1}, 'd': {'e': 2}}})
+        self.assertIs(self.config()['a']['d'], previous['a']['d'])
+
+    def test_set_by_tuple_path(self):
+        self.config.set(('a', 'b'), 1)
+        self.assertEqual(self.config(), {'a': {'b': 1}})
+
+    def test_set_below_not_dict_value(self):
+        self.config.from_dict({'a': 1})
+        self.config.set('a.b', 2)
+        self.assertEqual(self.config(), {'a': {'b': 2}})
+
+    def test_set_in_mapping(self):
+        self.config.override(types.MappingProxyType({'a': types.MappingProxyType({'b': 1})}))
+
+        self.config.set('y', 1)
+        self.config.set('a.c', 2)
+
+        self.assertEqual(self.config(), {'a': {'b': 1, 'c': 2}, 'y': 1})
+
+    def test_set_reset_last_overriding(self):
+        self.config.from_dict({'a': {'b': 1}})
+        self.config.set('a.b', 2)
+        self.assertEqual(self.config.a.b(), 2)
+
+        self.config.reset_last_overriding()
+        self.assertEqual(self.config.a.b(), 1)
+
+    def test_compact(self):
+        self.config.from_dict({'a': 1})
+        self.config.from_dict({'b': 2})
+        self.config.set('c', 3)
+        self.assertEqual(len(self.config.overridden), 3)
+
+        self.config.compact()
+
+        self.assertEqual(len(self.config.overridden), 1)
+        self.assertEqual(self.config(), {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(self.config.c(), 3)
+
+        self.config.reset_last_overriding()
+        self.assertEqual(self.config(), {})
+        self.assertIsNone(self.config.c())
+
+    def test_compact_keeps_overriding_provider(self):
+        other_config = providers.Configuration()
+        other_config.from_dict({'a': 1})
+
+        self.config.from_dict({'a': 0})
+        self.config.override(other_config)
+        self.config.compact()
+
+        self.assertEqual(self.config.overridden, (other_config,))
+        other_config.set('a', 2)
+        self.assertEqual(self.config.a(), 2)
+
+    def test_compact_not_overridden(self):
+        self.config.compact()
+        self.assertEqual(self.config.overridden, tuple())
+
+    def test_getitem(self):
+        self.config.from_dict({'a': {'b': 1}})
+        self.assertEqual(self.config['a']['b'](), 1)
+
     def test_getting_of_special_attributes(self):
         with self.assertRaises(AttributeError):
             self.config.__name__
@@ -1171,3 +1354,124 @@ class ConfigFromEnvTests(unittest.TestCase):
         self.config = providers.Configuration(strict=True)
         self.config.option.from_env('UNDEFINED_ENV', default='default-value', required=False)
         self.assertEqual(self.config.option(), 'default-value')
+
+
+class ConfigLoadTests(unittest.TestCase):
+
+    def setUp(self):
+        self.config = providers.Configuration(name='config')
+
+        _, self.ini_file = tempfile.mkstemp(suffix='.ini')
+        with open(self.ini_file, 'w') as config_file:
+            config_file.write(
+                '[section1]\n'
+                'value1=1\n'
+                'value2=2\n'
+            )
+
+        _, self.yaml_file = tempfile.mkstemp(suffix='.yml')
+        with open(self.yaml_file, 'w') as config_file:
+            config_file.write(
+                'section1:\n'
+                '  value2: 22\n'
+                'section2:\n'
+                '  value3: 3\n'
+            )
+
+        os.environ['CONFIG_TEST_ENV'] = 'test-value'
+
+    def tearDown(self):
+        del self.config
+        del os.environ['CONFIG_TEST_ENV']
+        os.unlink(self.ini_file)
+        os.unlink(self.yaml_file)
+
+    @unittest.skipIf(yaml is None, 'PyYAML is not installed')
+    def test(self):
+        self.config.load(
+            sources=[self.ini_file, self.yaml_file, {'section2': {'value4': 4}}],
+            env={'section2.value5': 'CONFIG_TEST_ENV'},
+        )
+
+        self.assertEqual(
+            self.config(),
+            {
+                'section1': {'value1': '1', 'value2': 22},
+                'section2': {'value3': 3, 'value4': 4, 'value5': 'test-value'},
+            },
+        )
+        self.assertEqual(self.config.section1.value2(), 22)
+        self.assertEqual(self.config.section2.value5(), 'test-value')
+
+    @unittest.skipIf(yaml is None, 'PyYAML is not installed')
+    def test_thread_pool(self):
+        self.config.load(sources=[self.ini_file, self.yaml_file], max_workers=2)
+
+        self.assertEqual(
+            self.config(),
+            {
+                'section1': {'value1': '1', 'value2': 22},
+                'section2': {'value3': 3},
+            },
+        )
+
+    def test_mapping_source(self):
+        self.config.override(types.MappingProxyType({'section1': types.MappingProxyType({'value0': 0})}))
+
+        self.config.load(sources=[types.MappingProxyType({'section1': {'value1': 1}})])
+
+        self.assertEqual(self.config(), {'section1': {'value0': 0, 'value1': 1}})
+
+    def test_single_overriding(self):
+        self.config.from_dict({'section1': {'value0': 0}})
+
+        self.config.load(sources=[self.ini_file, {'section1': {'value1': 11}}])
+
+        self.assertEqual(len(self.config.overridden), 2)
+        self.assertEqual(self.config(), {'section1': {'value0': 0, 'value1': 11, 'value2': '2'}})
+
+        self.config.reset_last_overriding()
+        self.assertEqual(self.config(), {'section1': {'value0': 0}})
+
+    def test_sources_are_not_changed(self):
+        source1 = {'section1': {'value1': 1}}
+        source2 = {'section1': {'value2': 2}}
+
+        self.config.load(sources=[source1, source2])
+
+        self.assertEqual(self.config(), {'section1': {'value1': 1, 'value2': 2}})
+        self.assertEqual(source1, {'section1': {'value1': 1}})
+        self.assertEqual(source2, {'section1': {'value2': 2}})
+
+    def test_file_does_not_exist(self):
+        self.config.load(sources=['./does_not_exist.ini', {'section1': {'value1': 1}}])
+        self.assertEqual(self.config(), {'section1': {'value1': 1}})
+
+    def test_required_file_does_not_exist(self):
+        with self.assertRaises(IOError):
+            self.config.load(sources=['./does_not_exist.ini'], required=True)
+
+    def test_file_does_not_exist_strict_mode(self):
+        self.config = providers.Configuration(strict=True)
+        with self.assertRaises(IOError):
+            self.config.load(sources=['./does_not_exist.ini'])
+
+    def test_required_empty_dictionary(self):
+        with self.assertRaises(ValueError):
+            self.config.load(sources=[{}], required=True)
+
+    def test_undefined_env(self):
+        self.config.load(env={'section1.value1': 'UNDEFINED_ENV'})
+        self.assertEqual(self.config(), {'section1': {'value1': None}})
+
+    def test_required_undefined_env(self):
+        with self.assertRaises(ValueError):
+            self.config.load(env={'section1.value1': 'UNDEFINED_ENV'}, required=True)
+
+    def test_unknown_file_format(self):
+        with self.assertRaisesRegex(errors.Error, 'Unable to recognize format of configuration file'):
+            self.config.load(sources=['config.json'])
+
+    def test_unknown_source(self):
+        with self.assertRaisesRegex(errors.Error, 'Unable to recognize configuration source'):
+            self.config.load(sources=[object()])
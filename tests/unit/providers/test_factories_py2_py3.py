@@ -209,6 +209,54 @@ class FactoryTests(unittest.TestCase):
         self.assertEqual(algorithm_2.task.loss.regularizer.alpha, 0.7)
         self.assertEqual(algorithm_3.task.loss.regularizer.alpha, 0.8)
 
+    def test_call_with_same_context_kwargs_repeatedly(self):
+        provider = providers.Factory(
+            Example,
+            init_arg1=1,
+            init_arg2=providers.Factory(Example),
+        )
+
+        instance1 = provider(init_arg1=11, init_arg2__init_arg1=22)
+        instance2 = provider(init_arg2__init_arg1=33, init_arg1=44)
+        instance3 = provider(init_arg3=3)
+
+        self.assertEqual(instance1.init_arg1, 11)
+        self.assertEqual(instance1.init_arg2.init_arg1, 22)
+        self.assertEqual(instance2.init_arg1, 44)
+        self.assertEqual(instance2.init_arg2.init_arg1, 33)
+        self.assertEqual(instance3.init_arg1, 1)
+        self.assertIsInstance(instance3.init_arg2, Example)
+        self.assertEqual(instance3.init_arg3, 3)
+
+    def test_call_with_context_kwargs_order(self):
+        provider = providers.Factory(
+            lambda **kwargs: list(kwargs),
+            a=1,
+            b=providers.Object(2),
+            c=3,
+            d=providers.Factory(Example),
+        )
+
+        self.assertEqual(provider(), ['a', 'b', 'c', 'd'])
+        for _ in range(2):
+            self.assertEqual(provider(y=1, x=2), ['y', 'x', 'a', 'b', 'c', 'd'])
+            self.assertEqual(provider(x=2, y=1, c=4), ['x', 'y', 'c', 'a', 'b', 'd'])
+            self.assertEqual(
+                provider(y=1, d__init_arg1=2, x=2),
+                ['y', 'x', 'a', 'b', 'c', 'd'],
+            )
+
+    def test_call_with_context_kwargs_after_add_kwargs(self):
+        provider = providers.Factory(Example, init_arg1=1)
+        provider(init_arg2=2)
+
+        provider.add_kwargs(init_arg3=providers.Object(3))
+        instance = provider(init_arg2=2)
+
+        self.assertEqual(instance.init_arg1, 1)
+        self.assertEqual(instance.init_arg2, 2)
+        self.assertEqual(instance.init_arg3, 3)
+
     def test_fluent_interface(self):
         provider = providers.Factory(Example) \
             .add_args(1, 2) \
@@ -260,6 +308,234 @@ class FactoryTests(unittest.TestCase):
             .clear_attributes()
         self.assertEqual(provider.attributes, dict())
 
+    def test_call_after_set_args(self):
+        dependency = providers.Object('d')
+        provider = providers.Factory(Example, 1, 2)
+        provider()
+
+        provider.set_args(dependency, 4)
+        instance = provider()
+
+        self.assertEqual(instance.init_arg1, 'd')
+        self.assertEqual(instance.init_arg2, 4)
+
+    def test_call_after_add_kwargs(self):
+        dependency = providers.Object('d')
+        provider = providers.Factory(Example, init_arg1=1)
+        provider()
+
+        provider.add_kwargs(init_arg2=dependency, init_arg3=3)
+        instance = provider()
+
+        self.assertEqual(instance.init_arg1, 1)
+        self.assertEqual(instance.init_arg2, 'd')
+        self.assertEqual(instance.init_arg3, 3)
+
+    def test_call_after_set_attributes(self):
+        dependency = providers.Object('d')
+        provider = providers.Factory(Example).add_attributes(attribute1=1)
+        provider()
+
+        provider.set_attributes(attribute2=dependency)
+        instance = provider()
+
+        self.assertIsNone(instance.attribute1)
+        self.assertEqual(instance.attribute2, 'd')
+
+    def test_call_keeps_keyword_args_order(self):
+        provider = providers.Factory(
+            dict,
+            first=1,
+            second=providers.Object(2),
+            third=3,
+        )
+        self.assertEqual(list(provider().keys()), ['first', 'second', 'third'])
+
+    def test_call_with_delegated_injection(self):
+        dependency = providers.Factory(object)
+        provider = providers.Factory(Example, dependency.provider, init_arg2=dependency.provider)
+
+        instance = provider()
+
+        self.assertIs(instance.init_arg1, dependency)
+        self.assertIs(instance.init_arg2, dependency)
+
+    def test_many(self):
+        singleton = providers.Singleton(object)
+        dependency = providers.Factory(object)
+        provider = providers.Factory(
+            Example,
+            singleton,
+            init_arg2=dependency,
+        ).add_attributes(attribute1=singleton)
+
+        instances = provider.many(3, init_arg3=3)
+
+        self.assertEqual(len(instances), 3)
+        self.assertEqual(len(set(map(id, instances))), 3)
+        for instance in instances:
+            self.assertIsInstance(instance, Example)
+            self.assertIs(instance.init_arg1, singleton())
+            self.assertIs(instance.attribute1, singleton())
+            self.assertEqual(instance.init_arg3, 3)
+        self.assertIsNot(instances[0].init_arg2, instances[1].init_arg2)
+
+    def test_many_provides_batch_injections_once(self):
+        calls = []
+
+        def create():
+            calls.append(1)
+            return object()
+
+        callable_provider = providers.Callable(create)
+        provider = providers.Factory(
+            Example,
+            init_arg1=providers.Object(callable_provider),
+            init_arg2=providers.Singleton(create),
+        )
+
+        instances = provider.many(5)
+
+        self.assertEqual(calls, [1])
+        self.assertIs(instances[0].init_arg1, callable_provider)
+        self.assertIs(instances[0].init_arg2, instances[4].init_arg2)
+
+    def test_many_provides_batch_injection_once_per_batch(self):
+        calls = []
+
+        class CountingObject(providers.Object):
+            def _provide(self, args, kwargs):
+                calls.append(1)
+                return super()._provide(args, kwargs)
+
+        provider = providers.Factory(Example, init_arg1=CountingObject(1))
+
+        self.assertIsNotNone(provider._create_batch_factory(()))
+        del calls[:]
+
+        instances = provider.many(3)
+
+        self.assertEqual(calls, [1])
+        self.assertEqual([instance.init_arg1 for instance in instances], [1, 1, 1])
+
+    def test_many_zero(self):
+        calls = []
+
+        class CountingObject(providers.Object):
+            def _provide(self, args, kwargs):
+                calls.append(1)
+                return super()._provide(args, kwargs)
+
+        provider = providers.Factory(Example, init_arg1=CountingObject(1))
+
+        self.assertEqual(provider.many(0), [])
+        self.assertEqual(calls, [])
+
+    def test_many_customized_provide(self):
+        class CustomFactory(providers.Factory):
+            def _provide(self, args, kwargs):
+                return 'custom'
+
+        provider = CustomFactory(Example)
+
+        self.assertIsNone(provider._create_batch_factory(()))
+        self.assertEqual(provider.many(2), ['custom', 'custom'])
+
+    def test_many_overridden(self):
+        provider = providers.Factory(Example)
+        provider.override(providers.Factory(list))
+
+        instances = provider.many(2)
+
+        self.assertEqual(instances, [[], []])
+
+    def test_map(self):
+        singleton = providers.Singleton(object)
+        provider = providers.Factory(Example, init_arg1=singleton)
+
+        instances = provider.map([dict(init_arg2=1), dict(init_arg2=2)])
+
+        self.assertNotIsInstance(instances, list)
+        instances = list(instances)
+        self.assertEqual([instance.init_arg2 for instance in instances], [1, 2])
+        self.assertIs(instances[0].init_arg1, instances[1].init_arg1)
+
+    def test_map_with_prefixed_kwargs(self):
+        provider = providers.Factory(
+            Example,
+            init_arg1=providers.Singleton(Example),
+        )
+
+        instances = list(provider.map([dict(init_arg1__init_arg1=1)]))
+
+        self.assertEqual(instances[0].init_arg1.init_arg1, 1)
+
+    def test_map_after_singleton_reset(self):
+        singleton = providers.Singleton(object)
+        provider = providers.Factory(Example, init_arg1=singleton)
+
+        instances = provider.map([{}, {}])
+        instance1 = next(instances)
+        singleton.reset()
+        instance2 = next(instances)
+
+        self.assertIsNot(instance1.init_arg1, instance2.init_arg1)
+        self.assertIs(instance2.init_arg1, singleton())
+
+    def test_map_after_configuration_change(self):
+        config = providers.Configuration()
+        config.from_dict({'x': 1})
+        provider = providers.Factory(Example, init_arg1=config.x)
+
+        instances = provider.map([{}, {}])
+        instance1 = next(instances)
+        config.set('x', 2)
+        instance2 = next(instances)
+
+        self.assertEqual(instance1.init_arg1, 1)
+        self.assertEqual(instance2.init_arg1, 2)
+
+    def test_map_after_resource_shutdown(self):
+        resource = providers.Resource(object)
+        provider = providers.Factory(Example, init_arg1=resource)
+
+        instances = provider.map([{}, {}])
+        instance1 = next(instances)
+        resource.shutdown()
+        instance2 = next(instances)
+
+        self.assertIsNot(instance1.init_arg1, instance2.init_arg1)
+
+    def test_many_does_not_batch_not_process_wide_singletons(self):
+        singletons = [
+            providers.ThreadLocalSingleton(object),
+            providers.ContextLocalSingleton(object),
+            providers.WeakSingleton(Example),
+            providers.ExpiringSingleton(object).set_ttl(60),
+            providers.Singleton(object).set_scope('request'),
+            providers.Multiton(object),
+        ]
+
+        for singleton in singletons:
+            provider = providers.Factory(Example, init_arg1=singleton)
+            batch = provider._create_batch_factory(())
+            self.assertIs(batch.kwargs['init_arg1'], singleton)
+
+    def test_many_does_not_call_async_providers(self):
+        calls = []
+
+        async def create():
+            calls.append(1)
+
+        singleton = providers.Singleton(create)
+        singleton.enable_async_mode()
+        provider = providers.Factory(Example, init_arg1=singleton)
+
+        batch = provider._create_batch_factory(())
+
+        self.assertIs(batch.kwargs['init_arg1'], singleton)
+        self.assertEqual(calls, [])
+
     def test_call_overridden(self):
         provider = providers.Factory(Example)
         overriding_provider1 = providers.Factory(dict)
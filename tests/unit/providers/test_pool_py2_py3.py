@@ -0,0 +1,295 @@
+"""Dependency injector pool providers unit tests."""
+
+import threading
+import time
+
+import unittest2 as unittest
+
+from dependency_injector import (
+    providers,
+    errors,
+)
+
+
+class Example(object):
+
+    def __init__(self, init_arg1=None, init_arg2=None):
+        self.init_arg1 = init_arg1
+        self.init_arg2 = init_arg2
+
+        self.attribute1 = None
+        self.used = False
+
+
+class _BasePoolTestCase(object):
+
+    pool_cls = None
+
+    def test_is_provider(self):
+        self.assertTrue(providers.is_provider(self.pool_cls(Example)))
+
+    def test_acquire_creates_instances(self):
+        provider = self.pool_cls(Example, 1, init_arg2=providers.Object(2))
+        provider.add_attributes(attribute1=3)
+
+        instance1 = provider.acquire()
+        instance2 = provider.acquire()
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(instance1.init_arg1, 1)
+        self.assertEqual(instance1.init_arg2, 2)
+        self.assertEqual(instance1.attribute1, 3)
+        self.assertEqual(provider.size, 2)
+        self.assertEqual(provider.idle_size, 0)
+
+    def test_release_reuses_instance(self):
+        provider = self.pool_cls(Example)
+
+        instance1 = provider.acquire()
+        provider.release(instance1)
+        instance2 = provider.acquire()
+
+        self.assertIs(instance1, instance2)
+        self.assertEqual(provider.size, 1)
+
+    def test_release_not_acquired_instance(self):
+        provider = self.pool_cls(Example)
+        provider.release(provider.acquire())
+
+        self.assertRaises(errors.Error, provider.release, Example())
+
+    def test_release_twice(self):
+        provider = self.pool_cls(Example)
+        instance = provider.acquire()
+        provider.release(instance)
+
+        self.assertRaises(errors.Error, provider.release, instance)
+
+    def test_lease(self):
+        provider = self.pool_cls(Example)
+
+        with provider.lease() as instance1:
+            self.assertEqual(provider.idle_size, 0)
+
+        with provider.lease() as instance2:
+            pass
+
+        self.assertIs(instance1, instance2)
+        self.assertEqual(provider.idle_size, 1)
+
+    def test_reset_hook(self):
+        def reset(instance):
+            instance.used = False
+
+        provider = self.pool_cls(Example).set_reset_hook(reset)
+        self.assertIs(provider.reset_hook, reset)
+
+        with provider.lease() as instance:
+            instance.used = True
+
+        self.assertFalse(instance.used)
+
+    def test_reset_hook_error_drops_instance(self):
+        def reset(instance):
+            raise ValueError()
+
+        provider = self.pool_cls(Example).set_reset_hook(reset)
+        instance = provider.acquire()
+
+        self.assertRaises(ValueError, provider.release, instance)
+        self.assertEqual(provider.size, 0)
+        self.assertIsNot(provider.acquire(), instance)
+
+    def test_max_idle_time(self):
+        provider = self.pool_cls(Example).set_max_idle_time(0.01)
+        self.assertEqual(provider.max_idle_time, 0.01)
+
+        instance1 = provider.acquire()
+        provider.release(instance1)
+        time.sleep(0.02)
+        instance2 = provider.acquire()
+
+        self.assertIsNot(instance1, instance2)
+        self.assertEqual(provider.size, 1)
+
+    def test_reset(self):
+        provider = self.pool_cls(Example)
+        instance1 = provider.acquire()
+        instance2 = provider.acquire()
+        provider.release(instance1)
+
+        provider.reset()
+
+        self.assertEqual(provider.idle_size, 0)
+        provider.release(instance2)
+        self.assertIs(provider.acquire(), instance2)
+
+    def test_set_max_size(self):
+        provider = self.pool_cls(Example).set_max_size(3)
+        self.assertEqual(provider.max_size, 3)
+        self.assertRaises(errors.Error, provider.set_max_size, 0)
+
+    def test_call_with_context_args(self):
+        provider = self.pool_cls(Example)
+        self.assertRaises(errors.Error, provider, 1)
+        self.assertRaises(errors.Error, provider, init_arg1=1)
+
+    def test_call_returns_lease(self):
+        provider = self.pool_cls(Example)
+
+        lease = provider()
+
+        self.assertIsInstance(lease, providers.PoolLease)
+        self.assertEqual(provider.size, 0)
+        with lease as instance:
+            self.assertIsInstance(instance, Example)
+            self.assertEqual(provider.idle_size, 0)
+        self.assertEqual(provider.idle_size, 1)
+
+    def test_call_overridden(self):
+        provider = self.pool_cls(Example)
+        overriding_instance = Example()
+        provider.override(providers.Object(overriding_instance))
+
+        self.assertIs(provider(), overriding_instance)
+
+    def test_acquire_overridden(self):
+        provider = self.pool_cls(Example)
+        overriding_instance = Example()
+        provider.override(providers.Object(overriding_instance))
+
+        instance = provider.acquire()
+        provider.release(instance)
+        with provider.lease() as leased_instance:
+            pass
+
+        self.assertIs(instance, overriding_instance)
+        self.assertIs(leased_instance, overriding_instance)
+        self.assertEqual(provider.size, 0)
+
+    def test_acquire_overridden_by_pool(self):
+        provider = self.pool_cls(Example)
+        overriding_pool = self.pool_cls(Example)
+        provider.override(overriding_pool)
+
+        with provider.lease() as instance:
+            self.assertEqual(overriding_pool.size, 1)
+
+        self.assertEqual(overriding_pool.idle_size, 1)
+        self.assertEqual(provider.size, 0)
+        self.assertIs(overriding_pool.acquire(), instance)
+
+    def test_release_acquired_before_overriding(self):
+        provider = self.pool_cls(Example)
+        instance = provider.acquire()
+        provider.override(providers.Object(Example()))
+
+        provider.release(instance)
+
+        self.assertEqual(provider.idle_size, 1)
+
+    def test_injection(self):
+        provider = self.pool_cls(Example).set_max_size(2)
+        factory = providers.Factory(Example, init_arg1=provider)
+
+        instances = [factory() for _ in range(3)]
+
+        self.assertEqual(provider.size, 0)
+        with instances[0].init_arg1 as instance1:
+            with instances[1].init_arg1 as instance2:
+                self.assertIsNot(instance1, instance2)
+        with instances[2].init_arg1 as instance3:
+            self.assertIn(instance3, (instance1, instance2))
+        self.assertEqual(provider.size, 2)
+
+    def test_deepcopy(self):
+        def reset(instance):
+            pass
+
+        provider = self.pool_cls(Example, init_arg1=1) \
+            .set_max_size(3) \
+            .set_reset_hook(reset) \
+            .set_max_idle_time(10)
+        provider.acquire()
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertIsNot(provider, provider_copy)
+        self.assertIsInstance(provider_copy, self.pool_cls)
+        self.assertEqual(provider_copy.kwargs, {'init_arg1': 1})
+        self.assertEqual(provider_copy.max_size, 3)
+        self.assertIs(provider_copy.reset_hook, reset)
+        self.assertEqual(provider_copy.max_idle_time, 10)
+        self.assertEqual(provider_copy.size, 0)
+
+    def test_freeze(self):
+        provider = self.pool_cls(Example).freeze()
+
+        self.assertRaises(errors.Error, provider.set_max_size, 1)
+        self.assertRaises(errors.Error, provider.add_kwargs, init_arg1=1)
+
+    def test_repr(self):
+        provider = self.pool_cls(Example)
+
+        self.assertEqual(
+            repr(provider),
+            '<dependency_injector.providers.'
+            '{0}({1}) at {2}>'.format(
+                self.pool_cls.__name__,
+                repr(Example),
+                hex(id(provider)),
+            ),
+        )
+
+
+class PoolTests(_BasePoolTestCase, unittest.TestCase):
+
+    pool_cls = providers.Pool
+
+    def test_exhausted(self):
+        provider = self.pool_cls(Example).set_max_size(1)
+        provider.acquire()
+
+        self.assertRaises(errors.Error, provider.acquire)
+
+
+class ThreadSafePoolTests(_BasePoolTestCase, unittest.TestCase):
+
+    pool_cls = providers.ThreadSafePool
+
+    def test_exhausted_timeout(self):
+        provider = self.pool_cls(Example).set_max_size(1).set_timeout(0.01)
+        self.assertEqual(provider.timeout, 0.01)
+        provider.acquire()
+
+        self.assertRaises(errors.Error, provider.acquire)
+
+    def test_exhausted_waits_for_release(self):
+        provider = self.pool_cls(Example).set_max_size(1).set_timeout(5)
+        instance1 = provider.acquire()
+
+        timer = threading.Timer(0.01, provider.release, args=(instance1,))
+        timer.start()
+        instance2 = provider.acquire()
+        timer.join()
+
+        self.assertIs(instance1, instance2)
+
+    def test_concurrent_lease(self):
+        provider = self.pool_cls(Example).set_max_size(2)
+        leased = []
+
+        def lease():
+            for _ in range(100):
+                with provider.lease() as instance:
+                    leased.append(instance)
+
+        threads = [threading.Thread(target=lease) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(leased), 400)
+        self.assertLessEqual(len(set(map(id, leased))), 2)
+        self.assertEqual(provider.idle_size, provider.size)
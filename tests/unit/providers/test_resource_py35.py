@@ -344,6 +344,46 @@ class ResourceTests(unittest.TestCase):
         )
 
 
+class ResourceForkPolicyTests(unittest.TestCase):
+
+    def test_after_fork_reset(self):
+        def init_fn():
+            init_fn.init_counter += 1
+            yield object()
+            init_fn.shutdown_counter += 1
+        init_fn.init_counter = 0
+        init_fn.shutdown_counter = 0
+
+        provider = providers.Resource(init_fn).set_fork_policy('reset')
+        resource1 = provider()
+
+        providers.after_fork()
+
+        self.assertEqual(provider.fork_policy, 'reset')
+        self.assertFalse(provider.initialized)
+        self.assertEqual(init_fn.shutdown_counter, 0)
+
+        resource2 = provider()
+        self.assertIsNot(resource1, resource2)
+        self.assertEqual(init_fn.init_counter, 2)
+
+    def test_after_fork_reinit(self):
+        provider = providers.Resource(object).set_fork_policy('reinit')
+        resource1 = provider()
+
+        providers.after_fork()
+
+        self.assertTrue(provider.initialized)
+        self.assertIsNot(provider(), resource1)
+
+    def test_deepcopy(self):
+        provider = providers.Resource(object).set_fork_policy('reinit')
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertEqual(provider_copy.fork_policy, 'reinit')
+
+
 class AsyncResourceTest(AsyncTestCase):
 
     def test_init_async_function(self):
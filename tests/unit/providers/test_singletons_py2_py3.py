@@ -1,6 +1,12 @@
 """Dependency injector singleton providers unit tests."""
 
+import contextvars
+import gc
+import os
 import sys
+import threading
+import time
+import weakref
 
 import unittest2 as unittest
 
@@ -23,6 +29,14 @@ class Example(object):
         self.attribute2 = None
 
 
+class WeakDict(dict):
+    ...
+
+
+class WeakList(list):
+    ...
+
+
 class _BaseSingletonTestCase(object):
 
     singleton_cls = None
@@ -430,6 +444,100 @@ class _BaseSingletonTestCase(object):
 
         self.assertIs(singleton, alias)
 
+    def test_scope(self):
+        provider = self.singleton_cls(Example).set_scope('request')
+
+        with providers.Scope('request') as scope:
+            instance1 = provider()
+            instance2 = provider()
+            self.assertEqual(scope.providers, (provider,))
+
+        with providers.Scope('request'):
+            instance3 = provider()
+
+        self.assertEqual(provider.scope, 'request')
+        self.assertIs(instance1, instance2)
+        self.assertIsNot(instance1, instance3)
+
+    def test_scope_is_not_active(self):
+        provider = self.singleton_cls(Example).set_scope('request')
+
+        with self.assertRaises(errors.Error):
+            provider()
+
+        with providers.Scope('session'):
+            with self.assertRaises(errors.Error):
+                provider()
+
+    def test_scope_does_not_use_provider_storage(self):
+        provider = self.singleton_cls(Example).set_scope('request')
+
+        with providers.Scope('request'):
+            instance = provider()
+
+        provider.set_scope(None)
+
+        self.assertIsNot(provider(), instance)
+
+    def test_scope_in_concurrent_threads(self):
+        provider = self.singleton_cls(Example).set_scope('request')
+        entered = threading.Barrier(2)
+        exited = threading.Event()
+        instances = {}
+        errors_in_threads = []
+
+        def request(name, exit_first):
+            try:
+                with providers.Scope('request'):
+                    instance = provider()
+                    entered.wait(5)
+                    if not exit_first:
+                        exited.wait(5)
+                    instances[name] = (instance, provider())
+                if exit_first:
+                    exited.set()
+            except Exception as exception:
+                errors_in_threads.append(exception)
+
+        threads = [
+            threading.Thread(target=request, args=('first', True)),
+            threading.Thread(target=request, args=('second', False)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors_in_threads, [])
+        self.assertIs(instances['first'][0], instances['first'][1])
+        self.assertIs(instances['second'][0], instances['second'][1])
+        self.assertIsNot(instances['first'][0], instances['second'][0])
+
+    def test_scope_is_not_active_in_other_thread(self):
+        provider = self.singleton_cls(Example).set_scope('request')
+        errors_in_threads = []
+
+        def request():
+            try:
+                provider()
+            except errors.Error as exception:
+                errors_in_threads.append(exception)
+
+        with providers.Scope('request'):
+            provider()
+            thread = threading.Thread(target=request)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(len(errors_in_threads), 1)
+
+    def test_deepcopy_scope(self):
+        provider = self.singleton_cls(Example).set_scope('request')
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertEqual(provider_copy.scope, 'request')
+
 
 class SingletonTests(_BaseSingletonTestCase, unittest.TestCase):
 
@@ -499,6 +607,56 @@ class ThreadLocalSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
         instance2 = provider()
         self.assertIsNot(instance1, instance2)
 
+    def test_size(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        self.assertEqual(provider.size, 0)
+
+        provider()
+        self.assertEqual(provider.size, 1)
+
+        provider.reset()
+        self.assertEqual(provider.size, 0)
+
+    def test_release_instance_on_thread_exit(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        instances = []
+
+        thread = threading.Thread(target=lambda: instances.append(weakref.ref(provider())))
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        self.assertEqual(provider.size, 0)
+        self.assertIsNone(instances[0]())
+
+    def test_reset_all_threads(self):
+        provider = providers.ThreadLocalSingleton(Example)
+        started = threading.Event()
+        reset = threading.Event()
+        instances = []
+
+        def run():
+            instances.append(provider())
+            started.set()
+            reset.wait(1.0)
+            instances.append(provider())
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        self.assertTrue(started.wait(1.0))
+
+        instance1 = provider()
+        self.assertEqual(provider.size, 2)
+
+        provider.reset_all_threads()
+        self.assertEqual(provider.size, 0)
+
+        reset.set()
+        thread.join()
+
+        self.assertIsNot(provider(), instance1)
+        self.assertIsNot(instances[0], instances[1])
+
 
 class DelegatedThreadLocalSingletonTests(_BaseSingletonTestCase,
                                          unittest.TestCase):
@@ -519,6 +677,763 @@ class DelegatedThreadLocalSingletonTests(_BaseSingletonTestCase,
                              hex(id(provider))))
 
 
+class ContextLocalSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
+
+    singleton_cls = providers.ContextLocalSingleton
+
+    def test_repr(self):
+        provider = self.singleton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'ContextLocalSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+    def test_reset(self):
+        provider = self.singleton_cls(Example)
+
+        instance1 = provider()
+        provider.reset()
+        provider.reset()
+        instance2 = provider()
+
+        self.assertIsNot(instance1, instance2)
+
+    def test_context_scope(self):
+        provider = self.singleton_cls(Example)
+        instance = provider()
+
+        def provide_in_new_context():
+            provider.reset()
+            return provider(), provider()
+
+        context_instance1, context_instance2 = contextvars.copy_context().run(provide_in_new_context)
+
+        self.assertIs(context_instance1, context_instance2)
+        self.assertIsNot(context_instance1, instance)
+        self.assertIs(provider(), instance)
+
+    def test_context_inherits_instance(self):
+        provider = self.singleton_cls(Example)
+        instance = provider()
+
+        context_instance = contextvars.copy_context().run(provider)
+
+        self.assertIs(context_instance, instance)
+
+    def test_context_instance_of_other_provider_does_not_leak(self):
+        provider1 = self.singleton_cls(Example)
+        provider2 = self.singleton_cls(Example)
+        instance1 = provider1()
+
+        context_instance2 = contextvars.copy_context().run(provider2)
+
+        self.assertIs(provider1(), instance1)
+        self.assertIsNot(provider2(), context_instance2)
+
+    def test_deepcopy_has_own_instance(self):
+        provider = self.singleton_cls(Example)
+        provider_copy = providers.deepcopy(provider)
+
+        instance = provider()
+
+        self.assertIsNot(provider_copy(), instance)
+        provider_copy.reset()
+        self.assertIs(provider(), instance)
+
+    def test_thread_scope(self):
+        provider = self.singleton_cls(Example)
+        instance = provider()
+        thread_instances = []
+
+        thread = threading.Thread(target=lambda: thread_instances.append(provider()))
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(thread_instances[0], instance)
+
+
+class DelegatedContextLocalSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
+
+    singleton_cls = providers.DelegatedContextLocalSingleton
+
+    def test_is_delegated_provider(self):
+        provider = self.singleton_cls(object)
+        self.assertTrue(providers.is_delegated(provider))
+
+    def test_repr(self):
+        provider = self.singleton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'DelegatedContextLocalSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+
+class WeakSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
+
+    singleton_cls = providers.WeakSingleton
+
+    def test_repr(self):
+        provider = self.singleton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'WeakSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+    def test_instance_is_collected(self):
+        provider = self.singleton_cls(Example)
+
+        instance = provider()
+        instance_ref = weakref.ref(instance)
+        self.assertTrue(provider.is_alive)
+        self.assertIs(provider(), instance)
+
+        del instance
+        gc.collect()
+
+        self.assertIsNone(instance_ref())
+        self.assertFalse(provider.is_alive)
+        self.assertIsInstance(provider(), Example)
+
+    def test_not_weak_referenceable_instance(self):
+        provider = self.singleton_cls(dict)
+
+        with self.assertRaises(errors.Error):
+            provider()
+
+        self.assertFalse(provider.is_alive)
+
+    # Instances of object, dict and list do not support weak references, so base tests that use
+    # them are redefined with weak referenceable types.
+
+    def test_call_overridden(self):
+        provider = self.singleton_cls(Example)
+        overriding_provider1 = self.singleton_cls(WeakDict)
+        overriding_provider2 = self.singleton_cls(WeakList)
+
+        provider.override(overriding_provider1)
+        provider.override(overriding_provider2)
+
+        instance1 = provider()
+        instance2 = provider()
+
+        self.assertIs(instance1, instance2)
+        self.assertIsInstance(instance1, WeakList)
+
+    def test_reset(self):
+        provider = self.singleton_cls(Example)
+
+        instance1 = provider()
+        provider.reset()
+        instance2 = provider()
+
+        self.assertIsNot(instance1, instance2)
+
+    def test_reset_with_singleton(self):
+        dependent_singleton = providers.Singleton(object)
+        provider = self.singleton_cls(WeakDict, dependency=dependent_singleton)
+
+        dependent_instance = dependent_singleton()
+        instance1 = provider()
+        self.assertIs(instance1['dependency'], dependent_instance)
+
+        provider.reset()
+
+        instance2 = provider()
+        self.assertIs(instance2['dependency'], dependent_instance)
+        self.assertIsNot(instance1, instance2)
+
+    def test_reset_context_manager(self):
+        singleton = self.singleton_cls(Example)
+
+        instance1 = singleton()
+        with singleton.reset():
+            instance2 = singleton()
+        instance3 = singleton()
+        self.assertEqual(len({instance1, instance2, instance3}), 3)
+
+    def test_full_reset(self):
+        dependent_singleton = providers.Singleton(object)
+        provider = self.singleton_cls(WeakDict, dependency=dependent_singleton)
+
+        dependent_instance1 = dependent_singleton()
+        instance1 = provider()
+
+        provider.full_reset()
+
+        dependent_instance2 = dependent_singleton()
+        instance2 = provider()
+        self.assertIs(instance2['dependency'], dependent_instance2)
+        self.assertIsNot(dependent_instance1, dependent_instance2)
+        self.assertIsNot(instance1, instance2)
+
+
+class DelegatedWeakSingletonTests(WeakSingletonTests):
+
+    singleton_cls = providers.DelegatedWeakSingleton
+
+    def test_is_delegated_provider(self):
+        provider = self.singleton_cls(object)
+        self.assertTrue(providers.is_delegated(provider))
+
+    def test_repr(self):
+        provider = self.singleton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'DelegatedWeakSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+
+class ExpiringSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
+
+    singleton_cls = providers.ExpiringSingleton
+
+    def test_repr(self):
+        provider = self.singleton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'ExpiringSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+    def test_ttl(self):
+        provider = self.singleton_cls(Example).set_ttl(0.01)
+
+        instance1 = provider()
+        instance2 = provider()
+        self.assertFalse(provider.is_expired())
+
+        time.sleep(0.02)
+        self.assertTrue(provider.is_expired())
+        instance3 = provider()
+
+        self.assertEqual(provider.ttl, 0.01)
+        self.assertIs(instance1, instance2)
+        self.assertIsNot(instance1, instance3)
+        self.assertFalse(provider.is_expired())
+
+    def test_no_ttl(self):
+        provider = self.singleton_cls(Example)
+
+        instance = provider()
+
+        self.assertIsNone(provider.ttl)
+        self.assertFalse(provider.is_expired())
+        self.assertIs(provider(), instance)
+
+    def test_set_ttl_invalid(self):
+        with self.assertRaises(errors.Error):
+            self.singleton_cls(Example).set_ttl(0)
+
+    def test_background_refresh(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def create():
+            if create.counter:
+                started.set()
+                release.wait(1.0)
+            create.counter += 1
+            return object()
+        create.counter = 0
+
+        provider = self.singleton_cls(create).set_ttl(0.01).set_background_refresh()
+
+        instance1 = provider()
+        time.sleep(0.02)
+
+        instance2 = provider()
+        self.assertTrue(started.wait(1.0))
+        instance3 = provider()
+        provider.set_ttl(10.0)
+        release.set()
+
+        for _ in range(100):
+            if not provider.is_expired():
+                break
+            time.sleep(0.01)
+
+        instance4 = provider()
+
+        self.assertTrue(provider.background_refresh)
+        self.assertIs(instance1, instance2)
+        self.assertIs(instance1, instance3)
+        self.assertIsNot(instance1, instance4)
+        self.assertEqual(create.counter, 2)
+
+    def test_background_refresh_after_reset(self):
+        started = threading.Event()
+        release = threading.Event()
+        finished = threading.Event()
+
+        def create():
+            create.counter += 1
+            if create.counter == 2:
+                started.set()
+                release.wait(1.0)
+                finished.set()
+            return object()
+        create.counter = 0
+
+        provider = self.singleton_cls(create).set_ttl(0.01).set_background_refresh()
+
+        provider()
+        time.sleep(0.02)
+        provider()
+        self.assertTrue(started.wait(1.0))
+
+        provider.set_ttl(10.0)
+        provider.reset()
+        instance = provider()
+        release.set()
+        self.assertTrue(finished.wait(1.0))
+        time.sleep(0.02)
+
+        self.assertIs(provider(), instance)
+        self.assertEqual(create.counter, 3)
+
+    def test_background_refresh_error(self):
+        def create():
+            create.counter += 1
+            if create.counter > 1:
+                raise RuntimeError()
+            return object()
+        create.counter = 0
+
+        provider = self.singleton_cls(create).set_ttl(0.01).set_background_refresh()
+
+        instance1 = provider()
+        time.sleep(0.02)
+        instance2 = provider()
+
+        for _ in range(100):
+            if provider.refresh_error is not None:
+                break
+            time.sleep(0.01)
+
+        self.assertIs(instance1, instance2)
+        self.assertIsInstance(provider.refresh_error, RuntimeError)
+        self.assertIs(provider(), instance1)
+
+    def test_deepcopy_ttl(self):
+        provider = self.singleton_cls(Example).set_ttl(1.0).set_background_refresh()
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertEqual(provider_copy.ttl, 1.0)
+        self.assertTrue(provider_copy.background_refresh)
+
+
+class DelegatedExpiringSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
+
+    singleton_cls = providers.DelegatedExpiringSingleton
+
+    def test_is_delegated_provider(self):
+        provider = self.singleton_cls(object)
+        self.assertTrue(providers.is_delegated(provider))
+
+    def test_repr(self):
+        provider = self.singleton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         'DelegatedExpiringSingleton({0}) at {1}>'.format(
+                             repr(Example),
+                             hex(id(provider))))
+
+
+class MultitonTests(unittest.TestCase):
+
+    multiton_cls = providers.Multiton
+
+    def test_repr(self):
+        provider = self.multiton_cls(Example)
+
+        self.assertEqual(repr(provider),
+                         '<dependency_injector.providers.'
+                         '{0}({1}) at {2}>'.format(
+                             self.multiton_cls.__name__,
+                             repr(Example),
+                             hex(id(provider))))
+
+    def test_call(self):
+        provider = self.multiton_cls(Example, init_arg2=2)
+
+        instance_a1 = provider('a')
+        instance_a2 = provider('a')
+        instance_b = provider('b')
+        instance_b_kwargs = provider(init_arg1='b')
+
+        self.assertIs(instance_a1, instance_a2)
+        self.assertIsNot(instance_a1, instance_b)
+        self.assertIsNot(instance_b, instance_b_kwargs)
+        self.assertEqual(instance_a1.init_arg1, 'a')
+        self.assertEqual(instance_a1.init_arg2, 2)
+        self.assertEqual(instance_b_kwargs.init_arg1, 'b')
+        self.assertIs(provider(init_arg1='b'), instance_b_kwargs)
+
+    def test_key(self):
+        provider = self.multiton_cls(Example).set_key(lambda tenant, **_: tenant)
+
+        instance1 = provider('a', init_arg2=1)
+        instance2 = provider('a', init_arg2=2)
+
+        self.assertIs(instance1, instance2)
+        self.assertEqual(instance2.init_arg2, 1)
+
+    def test_unhashable_key(self):
+        provider = self.multiton_cls(Example)
+
+        with self.assertRaises(errors.Error):
+            provider([])
+
+    def test_unhashable_kwargs_key(self):
+        provider = self.multiton_cls(Example)
+
+        with self.assertRaisesRegex(errors.Error, r'is not hashable, use \.set_key\(\)'):
+            provider(init_arg1=[1])
+
+        with self.assertRaises(errors.Error):
+            provider.evict(init_arg1=[1])
+
+    def test_stats(self):
+        provider = self.multiton_cls(Example)
+
+        provider('a')
+        provider('a')
+        provider('b')
+
+        self.assertEqual(provider.size, 2)
+        self.assertEqual(provider.hits, 1)
+        self.assertEqual(provider.misses, 2)
+        self.assertEqual(provider.evictions, 0)
+
+    def test_max_size(self):
+        evicted = []
+        provider = self.multiton_cls(Example).set_max_size(2).set_eviction_callback(evicted.append)
+
+        instance_a = provider('a')
+        instance_b = provider('b')
+        provider('a')
+        instance_c = provider('c')
+
+        self.assertEqual(provider.max_size, 2)
+        self.assertEqual(provider.size, 2)
+        self.assertEqual(provider.evictions, 1)
+        self.assertEqual(evicted, [instance_b])
+        self.assertIs(provider('a'), instance_a)
+        self.assertIs(provider('c'), instance_c)
+
+    def test_set_max_size_evicts(self):
+        evicted = []
+        provider = self.multiton_cls(Example).set_eviction_callback(evicted.append)
+
+        instance_a = provider('a')
+        provider('b')
+        provider.set_max_size(1)
+
+        self.assertEqual(evicted, [instance_a])
+
+    def test_set_max_size_invalid(self):
+        with self.assertRaises(errors.Error):
+            self.multiton_cls(Example).set_max_size(0)
+
+    def test_evict(self):
+        evicted = []
+        provider = self.multiton_cls(Example).set_eviction_callback(evicted.append)
+
+        instance1 = provider('a')
+        provider.evict('a')
+        provider.evict('b')
+        instance2 = provider('a')
+
+        self.assertEqual(evicted, [instance1])
+        self.assertIsNot(instance1, instance2)
+
+    def test_reset(self):
+        evicted = []
+        provider = self.multiton_cls(Example).set_eviction_callback(evicted.append)
+
+        instance1 = provider('a')
+        provider.reset()
+        instance2 = provider('a')
+
+        self.assertEqual(evicted, [])
+        self.assertIsNot(instance1, instance2)
+
+    def test_deepcopy(self):
+        evicted = []
+        key = lambda *_: 'key'
+        provider = self.multiton_cls(Example).set_max_size(2).set_key(key)
+        provider.set_eviction_callback(evicted.append)
+
+        provider_copy = providers.deepcopy(provider)
+
+        self.assertIsNot(provider, provider_copy)
+        self.assertIsInstance(provider_copy, self.multiton_cls)
+        self.assertEqual(provider_copy.max_size, 2)
+        self.assertIs(provider_copy.key, key)
+        self.assertEqual(provider_copy.eviction_callback, evicted.append)
+
+        instance = provider_copy('a')
+        provider_copy.evict('b')
+
+        self.assertEqual(evicted, [instance])
+        self.assertEqual(provider.size, 0)
+
+
+class ThreadSafeMultitonTests(MultitonTests):
+
+    multiton_cls = providers.ThreadSafeMultiton
+
+    def test_threads(self):
+        def create(key):
+            time.sleep(0.01)
+            return object()
+
+        provider = self.multiton_cls(create)
+        instances = []
+
+        threads = [
+            threading.Thread(target=lambda key=key: instances.append((key, provider(key))))
+            for key in ('a', 'b') * 5
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(instance for key, instance in instances)), 2)
+        self.assertEqual(provider.misses, 2)
+
+    def test_creation_does_not_block_other_keys(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def create(key):
+            if key == 'slow':
+                started.set()
+                release.wait(5)
+            return object()
+
+        provider = self.multiton_cls(create)
+        results = {}
+
+        slow = threading.Thread(target=lambda: results.setdefault('slow', provider('slow')))
+        slow.start()
+        started.wait(5)
+
+        started_at = time.monotonic()
+        fast = provider('fast')
+        self.assertLess(time.monotonic() - started_at, 1)
+        release.set()
+        slow.join()
+
+        self.assertIs(provider('fast'), fast)
+        self.assertIs(provider('slow'), results['slow'])
+        self.assertEqual(provider.misses, 2)
+
+
+class ForkPolicyTests(unittest.TestCase):
+
+    def test_set_fork_policy(self):
+        provider = providers.Singleton(Example)
+        self.assertIsNone(provider.fork_policy)
+
+        provider.set_fork_policy(providers.FORK_POLICY_RESET)
+        self.assertEqual(provider.fork_policy, 'reset')
+
+        provider.set_fork_policy(None)
+        self.assertIsNone(provider.fork_policy)
+
+    def test_set_fork_policy_invalid(self):
+        with self.assertRaises(errors.Error):
+            providers.Singleton(Example).set_fork_policy('restart')
+
+    def test_after_fork(self):
+        kept = providers.Singleton(Example)
+        reset = providers.ThreadSafeSingleton(Example).set_fork_policy('reset')
+        reinit = providers.Singleton(Example).set_fork_policy('reinit')
+        multiton = providers.ThreadSafeMultiton(Example).set_fork_policy('reset')
+        thread_local = providers.ThreadLocalSingleton(Example).set_fork_policy('reset')
+
+        kept_instance = kept()
+        reset_instance = reset()
+        reinit_instance = reinit()
+        multiton_instance = multiton('a')
+        thread_local_instance = thread_local()
+
+        providers.after_fork()
+
+        self.assertIs(kept(), kept_instance)
+        self.assertIsNot(reset(), reset_instance)
+        self.assertIsNot(multiton('a'), multiton_instance)
+        self.assertIsNot(thread_local(), thread_local_instance)
+        self.assertIsNot(reinit(), reinit_instance)
+
+    def test_multiton_reinit_fork_policy(self):
+        provider = providers.Multiton(Example)
+
+        with self.assertRaisesRegex(errors.Error, 'does not support "reinit" fork policy'):
+            provider.set_fork_policy('reinit')
+        self.assertIsNone(provider.fork_policy)
+
+    def test_after_fork_reinit(self):
+        def create():
+            create.counter += 1
+            return object()
+        create.counter = 0
+
+        provider = providers.Singleton(create).set_fork_policy('reinit')
+        provider()
+
+        providers.after_fork()
+
+        self.assertEqual(create.counter, 2)
+        provider()
+        self.assertEqual(create.counter, 2)
+
+    def test_deepcopy(self):
+        provider = providers.Singleton(Example).set_fork_policy('reset')
+
+        provider_copy = providers.deepcopy(provider)
+        instance = provider_copy()
+        providers.after_fork()
+
+        self.assertEqual(provider_copy.fork_policy, 'reset')
+        self.assertIsNot(provider_copy(), instance)
+
+    @unittest.skipIf(not hasattr(os, 'register_at_fork'), 'Requires os.register_at_fork()')
+    def test_fork(self):
+        kept = providers.Singleton(Example)
+        reset = providers.Singleton(Example).set_fork_policy('reset')
+
+        kept_instance = kept()
+        reset_instance = reset()
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            result = kept() is kept_instance and reset() is not reset_instance
+            os.write(write_fd, b'1' if result else b'0')
+            os._exit(0)
+
+        os.close(write_fd)
+        result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(result, b'1')
+        self.assertIs(reset(), reset_instance)
+
+
+class ScopeTests(unittest.TestCase):
+
+    def test_name(self):
+        scope = providers.Scope('request')
+        self.assertEqual(scope.name, 'request')
+
+    def test_repr(self):
+        scope = providers.Scope('request')
+
+        self.assertEqual(
+            repr(scope),
+            '<dependency_injector.providers.Scope(\'request\') at {0}>'.format(hex(id(scope))),
+        )
+
+    def test_reset_registered_providers_only(self):
+        not_scoped = providers.Singleton(Example)
+        scoped = providers.Singleton(Example, init_arg1=not_scoped).set_scope('request')
+        not_called = providers.Singleton(Example).set_scope('request')
+
+        not_scoped_instance = not_scoped()
+        with providers.Scope('request') as scope:
+            instance = scoped()
+            self.assertIs(instance.init_arg1, not_scoped_instance)
+
+        self.assertEqual(scope.providers, ())
+        self.assertIs(not_scoped(), not_scoped_instance)
+        with providers.Scope('request'):
+            self.assertIsNot(scoped(), instance)
+
+    def test_is_active(self):
+        scope = providers.Scope('request')
+        self.assertFalse(scope.is_active)
+        self.assertIsNone(providers.get_active_scope('request'))
+
+        with scope:
+            self.assertTrue(scope.is_active)
+            self.assertIs(providers.get_active_scope('request'), scope)
+
+        self.assertFalse(scope.is_active)
+        self.assertIsNone(providers.get_active_scope('request'))
+
+    def test_nested_scopes(self):
+        request = providers.Singleton(Example).set_scope('request')
+        session = providers.Singleton(Example).set_scope('session')
+
+        with providers.Scope('session'):
+            session_instance = session()
+
+            with providers.Scope('request'):
+                request_instance1 = request()
+                self.assertIs(session(), session_instance)
+
+            with providers.Scope('request'):
+                request_instance2 = request()
+
+            self.assertIs(session(), session_instance)
+
+        self.assertIsNot(request_instance1, request_instance2)
+
+        with providers.Scope('session'):
+            self.assertIsNot(session(), session_instance)
+
+    def test_thread_scope(self):
+        provider = providers.ThreadLocalSingleton(Example).set_scope('request')
+        thread_errors = []
+
+        def call_provider():
+            try:
+                provider()
+            except errors.Error as exception:
+                thread_errors.append(exception)
+
+        with providers.Scope('request'):
+            thread = threading.Thread(target=call_provider)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(len(thread_errors), 1)
+
+    def test_enter_twice(self):
+        scope = providers.Scope('request')
+
+        with scope:
+            with self.assertRaises(errors.Error):
+                scope.enter()
+
+    def test_exit_not_active(self):
+        scope = providers.Scope('request')
+
+        with self.assertRaises(errors.Error):
+            scope.exit()
+
+    def test_set_scope_frozen(self):
+        provider = providers.Singleton(Example).freeze()
+
+        with self.assertRaises(errors.Error):
+            provider.set_scope('request')
+
+
 class ThreadSafeSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
 
     singleton_cls = providers.ThreadSafeSingleton
@@ -532,6 +1447,87 @@ class ThreadSafeSingletonTests(_BaseSingletonTestCase, unittest.TestCase):
                              repr(Example),
                              hex(id(provider))))
 
+    def test_slow_creation_does_not_block_other_providers(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def create_slow():
+            started.set()
+            release.wait(5)
+            return object()
+
+        slow = self.singleton_cls(create_slow)
+        fast = self.singleton_cls(object)
+
+        thread = threading.Thread(target=slow)
+        thread.start()
+        started.wait(5)
+        try:
+            self.assertIsInstance(fast(), object)
+            self.assertTrue(thread.is_alive())
+        finally:
+            release.set()
+            thread.join()
+
+    def test_concurrent_creation(self):
+        release = threading.Event()
+
+        def create():
+            release.wait(5)
+            return object()
+
+        provider = self.singleton_cls(create)
+        instances = []
+
+        threads = [threading.Thread(target=lambda: instances.append(provider())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while provider.lock_waiters < 3:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(instances), 4)
+        self.assertEqual(len(set(map(id, instances))), 1)
+        self.assertIsNotNone(instances[0])
+        self.assertEqual(provider.lock_waiters, 0)
+        self.assertEqual(provider.lock_wait_count, 3)
+        self.assertGreater(provider.lock_wait_time, 0)
+
+    def test_lock_statistics_without_contention(self):
+        provider = self.singleton_cls(object)
+        provider()
+        provider.reset()
+        provider()
+
+        self.assertEqual(provider.lock_waiters, 0)
+        self.assertEqual(provider.lock_wait_count, 0)
+        self.assertEqual(provider.lock_wait_time, 0)
+
+    def test_storage_lock(self):
+        with providers.ThreadSafeSingleton.storage_lock:
+            instance = self.singleton_cls(object)()
+
+        self.assertIsInstance(instance, object)
+
+    def test_shared_storage_lock(self):
+        class SharedLockSingleton(providers.ThreadSafeSingleton):
+            storage_lock = threading.RLock()
+            per_provider_lock = False
+
+        provider = SharedLockSingleton(object)
+        instances = []
+
+        with SharedLockSingleton.storage_lock:
+            thread = threading.Thread(target=lambda: instances.append(provider()))
+            thread.start()
+            thread.join(0.05)
+            self.assertTrue(thread.is_alive())
+        thread.join()
+
+        self.assertEqual(instances, [provider()])
+
 
 class DelegatedThreadSafeSingletonTests(_BaseSingletonTestCase,
                                         unittest.TestCase):